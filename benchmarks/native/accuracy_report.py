@@ -138,6 +138,17 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
     
     Returns dict mapping benchmark name (matching calibration_results.json) to CPI.
     """
+    cpis, _ = measure_simulator_cpis(repo_root)
+    return cpis
+
+
+def measure_simulator_cpis(repo_root: Path) -> Tuple[dict, set]:
+    """Get simulator CPIs as for get_simulator_cpi_for_benchmarks, and which were not measured.
+
+    Returns (cpis, unmeasured), where unmeasured names every benchmark whose
+    CPI is a hard-coded fallback value or missing because its test failed,
+    timed out or printed no CPI.
+    """
     # Map simulator benchmark names to calibration benchmark names
     name_mapping = {
         # Microbenchmarks
@@ -252,6 +263,9 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
     print("  Running with D-cache...")
     dcache_cpis = run_test("TestAccuracyCPI_WithDCache", "D-cache")
 
+    # PolyBench/EmBench benchmarks given a fallback CPI after their test failed
+    substituted = set()
+
     # Run PolyBench benchmarks (intermediate complexity)
     print("  Running PolyBench benchmarks...")
     polybench_cpis = {}
@@ -300,6 +314,7 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
                     # Use fallback CPI if available
                     if bench_name in fallback_cpis:
                         polybench_cpis[bench_name] = fallback_cpis[bench_name]
+                        substituted.add(bench_name)
                         print(f"  WARNING: Using FALLBACK CPI for {bench_name}: {fallback_cpis[bench_name]} (test timed out)")
                         print(f"  WARNING: Accuracy results for {bench_name} may not reflect actual simulation")
             except Exception as e:
@@ -311,6 +326,7 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
                     # Use fallback CPI if available
                     if bench_name in fallback_cpis:
                         polybench_cpis[bench_name] = fallback_cpis[bench_name]
+                        substituted.add(bench_name)
                         print(f"  WARNING: Using FALLBACK CPI for {bench_name}: {fallback_cpis[bench_name]} (test failed)")
                         print(f"  WARNING: Accuracy results for {bench_name} may not reflect actual simulation")
 
@@ -360,6 +376,7 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
                     print(f"  Timeout: EmBench test {test_name} exceeded 600s timeout after {max_retries + 1} attempts")
                     if bench_name in fallback_cpis:
                         embench_cpis[bench_name] = fallback_cpis[bench_name]
+                        substituted.add(bench_name)
                         print(f"  WARNING: Using FALLBACK CPI for {bench_name}: {fallback_cpis[bench_name]} (test timed out)")
             except Exception as e:
                 if attempt < max_retries:
@@ -369,6 +386,7 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
                     print(f"  Failed: EmBench test {test_name} failed after {max_retries + 1} attempts: {e}")
                     if bench_name in fallback_cpis:
                         embench_cpis[bench_name] = fallback_cpis[bench_name]
+                        substituted.add(bench_name)
                         print(f"  WARNING: Using FALLBACK CPI for {bench_name}: {fallback_cpis[bench_name]} (test failed)")
 
     # Merge: use D-cache CPI for dcache_benchmarks, no-cache for the rest,
@@ -389,11 +407,11 @@ def get_simulator_cpi_for_benchmarks(repo_root: Path) -> dict:
         # else: will fall through to fallback below
 
     if cpis:
-        return cpis
+        return cpis, set(fallback_cpis) - (set(cpis) - substituted)
     else:
         print("Warning: No CPIs parsed from test output, using fallback values")
 
-    return fallback_cpis
+    return fallback_cpis, set(fallback_cpis)
 
 
 def calculate_error(t_sim: float, t_real: float) -> float:
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+bench_harness.py - Shared measurement code for the native calibration scripts
+
+linear_calibration.py and measure_memory_benchmarks.py both time prebuilt
+benchmark executables; this module holds the one implementation they share:
+
+- Runs are started with posix_spawn and reaped with wait4, with no pipes,
+  so each sample holds the benchmark and little else
+- On macOS, runs go through the launcher (launcher.c), which pins them to
+  the P-cores and disables ASLR
+- One untimed probe run absorbs the cold start (page faults, dyld), and a
+  few seconds of warm-up runs bring the clock up before anything is timed
+- Runs of several benchmarks can be shuffled together and executed in
+  parallel, so drift is spread over every data point
+- Outliers are removed with a median-absolute-deviation filter, and
+  regressions are ordinary least squares
+
+polybench_calibration.py and embench_calibration.py fit with the same
+linear_regression, and summarize their runs with trimmed_stats; they and
+measure_new_benchmarks.py take their samples with run_timed.
+"""
+
+import functools
+import os
+import random
+import struct
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Samples further than this many MADs from the median are dropped
+MAD_THRESHOLD = 3.5
+
+
+def mad_filter(times: Sequence[float], threshold: float = MAD_THRESHOLD) -> List[float]:
+    """Drop samples whose distance from the median exceeds threshold * MAD."""
+    times = np.asarray(times, dtype=float)
+    med = np.median(times)
+    dev = np.abs(times - med)
+    mad = np.median(dev)
+    if mad == 0:
+        return times.tolist()
+    return times[dev <= threshold * mad].tolist()
+
+
+def trimmed_stats(values: Sequence[float], trim_pct: float = 0.2) -> Tuple[float, float]:
+    """Mean and std of values with the top and bottom trim_pct removed.
+
+    np.partition places the cut points in O(n) without a full sort, and
+    both statistics come from the same kept subset.
+    """
+    arr = np.asarray(values, dtype=float)
+    n = len(arr)
+    k = int(n * trim_pct) if n >= 3 else 0
+    kept = np.partition(arr, (k, n - k - 1))[k:n - k] if k else arr
+    return float(kept.mean()), float(kept.std())
+
+
+def linear_regression(x: Sequence[float], y: Sequence[float]) -> Tuple[float, float, float]:
+    """Least-squares fit of y = slope * x + intercept. Returns (slope, intercept, r_squared)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    slope, intercept = np.polyfit(x, y, 1)
+    residuals = y - (slope * x + intercept)
+    ss_tot = np.sum((y - y.mean()) ** 2)
+    r_squared = 1 - np.sum(residuals ** 2) / ss_tot if ss_tot > 0 else 0.0
+    return float(slope), float(intercept), float(r_squared)
+
+
+@functools.lru_cache(maxsize=1)
+def performance_core_count() -> int:
+    """Number of P-cores (hw.perflevel0) on Apple silicon, else the CPU count."""
+    if sys.platform == "darwin":
+        result = subprocess.run(
+            ["sysctl", "-n", "hw.perflevel0.physicalcpu"],
+            capture_output=True, text=True
+        )
+        if result.returncode == 0:
+            return int(result.stdout)
+    return os.cpu_count() or 1
+
+
+_STDOUT_TO_DEVNULL = [(os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0)]
+
+
+def spawn(cmd: Sequence[str]) -> Tuple[float, float, int]:
+    """Run cmd to completion, returning (wall seconds, CPU seconds, exit code).
+
+    posix_spawn avoids copying the Python process as fork+exec would, and
+    wait4 reports the child's own user+system time from the kernel's
+    rusage accounting, excluding any Python-side overhead. stdout goes to
+    /dev/null: timed runs never read it.
+    """
+    start = time.perf_counter_ns()
+    pid = os.posix_spawn(cmd[0], list(cmd), os.environ, file_actions=_STDOUT_TO_DEVNULL)
+    _, status, rusage = os.wait4(pid, 0)
+    end = time.perf_counter_ns()
+    return ((end - start) / 1e9, rusage.ru_utime + rusage.ru_stime,
+            os.waitstatus_to_exitcode(status))
+
+
+def run_timed(binary_path: str, runs: int = 15, warmup: int = 3,
+              expected_exit_code: Optional[int] = None) -> List[int]:
+    """Run binary warmup times untimed, then runs times; return wall times in integer ns.
+
+    Output is never read, so it goes to /dev/null rather than through pipes
+    that would have to be drained inside the timed region. If
+    expected_exit_code is set, a timed run that exits differently raises
+    RuntimeError.
+    """
+    cmd = [binary_path]
+    for _ in range(warmup):
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        end = time.perf_counter_ns()
+        if expected_exit_code is not None and result.returncode != expected_exit_code:
+            raise RuntimeError(f"Benchmark {binary_path} failed with exit code "
+                               f"{result.returncode}, expected {expected_exit_code}")
+        times.append(end - start)
+    return times
+
+
+class Runner:
+    """Times benchmark executables.
+
+    launcher is the exec wrapper every run goes through (None to run the
+    benchmark directly). clock selects what a sample measures: "cpu" for
+    the child's user+system time, or "wall" for elapsed time. CPU time
+    keeps concurrent runs from billing each other's scheduling, but not
+    their contention for shared L2 and DRAM, which still inflates it on
+    memory-bound and pointer-chasing benchmarks. If expected_exit_code is
+    set, any run that exits differently raises RuntimeError.
+    """
+
+    def __init__(self, launcher: Optional[Path] = None, clock: str = "cpu",
+                 expected_exit_code: Optional[int] = None):
+        if clock not in ("cpu", "wall"):
+            raise ValueError(f"clock must be 'cpu' or 'wall', not {clock!r}")
+        self.launcher = launcher
+        self.clock = clock
+        self.expected_exit_code = expected_exit_code
+
+    def command(self, exe: Path, args: Sequence[str] = ()) -> List[str]:
+        """argv for one run of exe, going through the launcher if there is one."""
+        cmd = [str(exe), *args]
+        if self.launcher is not None:
+            cmd.insert(0, str(self.launcher))
+        return cmd
+
+    def run_once(self, exe: Path, args: Sequence[str] = ()) -> float:
+        """One run of exe, returning its sample in seconds."""
+        wall, cpu, returncode = spawn(self.command(exe, args))
+        if self.expected_exit_code is not None and returncode != self.expected_exit_code:
+            raise RuntimeError(
+                f"{' '.join([str(exe), *args])} exited with {returncode}, "
+                f"expected {self.expected_exit_code}"
+            )
+        return cpu if self.clock == "cpu" else wall
+
+    def warm_up(self, seconds: float, exe: Optional[Path] = None,
+                args: Sequence[str] = ()) -> int:
+        """Keep a core busy for seconds so the clock has ramped up before timing.
+
+        Without this the first benchmark measured runs while the CPU is still
+        leaving its idle frequency, and that ramp is fitted into its numbers.
+        exe (normally the shortest benchmark) is run back to back, through the
+        launcher so the P-cores are the ones warmed; with no exe this process
+        spins instead. Returns the number of runs made.
+        """
+        deadline = time.perf_counter_ns() + int(seconds * 1e9)
+        runs = 0
+        while time.perf_counter_ns() < deadline:
+            if exe is not None:
+                self.run_once(exe, args)
+            runs += 1
+        return runs if exe is not None else 0
+
+    def time(self, exe: Path, args: Sequence[str] = (), reps: int = 5,
+             warmups: int = 1) -> np.ndarray:
+        """Run exe warmups times untimed, then reps times, returning the samples.
+
+        Only the first run of a binary pays the cold-start cost, so a single
+        probe is usually enough; anything slow that slips through is left
+        for mad_filter or the minimum estimator to discard.
+        """
+        for _ in range(warmups):
+            self.run_once(exe, args)
+        return np.array([self.run_once(exe, args) for _ in range(reps)])
+
+    def time_interleaved(self, jobs: Dict[Hashable, Tuple[Path, Sequence[str]]],
+                         reps: Dict[Hashable, int], warmups: int = 1,
+                         workers: int = 1) -> Dict[Hashable, np.ndarray]:
+        """Time several (exe, args) jobs with their runs shuffled together.
+
+        Every job gets warmups probe runs first, then all reps[key] runs of
+        every job go into one shuffled work list, so slow drift (thermal
+        state, background load) is spread evenly over the jobs instead of
+        landing on whichever ran last. Up to workers runs execute at once;
+        use the "cpu" clock when workers > 1, and workers=1 where samples
+        must not share the memory system. Returns {key: samples}.
+        """
+        for exe, args in jobs.values():
+            for _ in range(warmups):
+                self.run_once(exe, args)
+
+        work = [key for key in jobs for _ in range(reps[key])]
+        random.shuffle(work)
+
+        samples = {key: [] for key in jobs}
+        # Each unit only waits on its child, so threads are enough to keep
+        # workers benchmarks running
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for key, seconds in zip(work, pool.map(lambda k: self.run_once(*jobs[k]), work)):
+                samples[key].append(seconds)
+
+        return {key: np.array(s) for key, s in samples.items()}
+
+    def time_in_process(self, exe: Path, args: Sequence[str] = (), reps: int = 5,
+                        warmups: int = 1) -> np.ndarray:
+        """Time reps repetitions inside a single run of a repeat-driver build.
+
+        exe must accept a repetition count after args and write cntfrq_el0
+        followed by one cntvct_el0 tick delta per repetition to stdout, as
+        little-endian u64s (see linear_calibration.with_repeat_harness).
+        The samples are wall time and exclude process startup; the first
+        warmups repetitions are dropped.
+        """
+        total = warmups + reps
+        result = subprocess.run(self.command(exe, [*args, str(total)]),
+                                stdout=subprocess.PIPE, check=True)
+        freq, *ticks = struct.unpack(f"<{total + 1}Q", result.stdout)
+        return np.array(ticks[warmups:], dtype=float) / freq
+
+    def harness_overhead(self, empty_exe: Path, samples: int = 50) -> float:
+        """Median sample for a program that exits immediately.
+
+        This is the cost every run pays regardless of the benchmark (exec,
+        dyld, exit), to be subtracted from the measurements.
+        """
+        runner = Runner(self.launcher, self.clock)
+        return float(np.median(runner.time(empty_exe, reps=samples, warmups=0)))
+
+    @staticmethod
+    def regress(points: Sequence[Tuple[float, float]]) -> Tuple[float, float, float]:
+        """Fit time = slope * n + intercept over (n, time) points.
+
+        Returns (slope, intercept, r_squared); see linear_regression.
+        """
+        n, t = zip(*points)
+        return linear_regression(n, t)
@@ -0,0 +1,13 @@
+// empty_program.s - Exits immediately
+// Spawned by measure_memory_benchmarks.py to measure harness overhead
+// (process spawn, dyld, exit and reap), which is subtracted from every run
+//
+// Expected: X0 = 0 at exit
+
+.global _main
+.align 4
+
+_main:
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
@@ -29,9 +29,9 @@ done
     subprocess.run(['chmod', '+x', script_path])
 
     # Time the entire loop
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     result = subprocess.run([script_path], capture_output=True)
-    end = time.perf_counter()
+    end = time.perf_counter_ns()
 
     # Clean up
     Path(script_path).unlink()
@@ -39,7 +39,7 @@ done
     if result.returncode != 0:
         raise Exception(f"Benchmark loop failed")
 
-    total_time = end - start
+    total_time = (end - start) / 1e9
     time_per_run = total_time / iterations
 
     return time_per_run
@@ -0,0 +1,41 @@
+/*
+ * launcher.c - Low-noise exec wrapper for calibration runs
+ *
+ * Replaces itself (POSIX_SPAWN_SETEXEC) with the benchmark so the caller's
+ * wait4() still sees a single process, and on the way:
+ *   - requests QOS_CLASS_USER_INTERACTIVE, which macOS schedules on the
+ *     P-cores, so short runs are not migrated to an E-core mid-measurement
+ *   - disables ASLR, so every run sees the same address layout
+ *
+ * Build: clang -O2 -o launcher launcher.c
+ * Usage: ./launcher <benchmark> [args...]
+ */
+
+#include <spawn.h>
+#include <stdio.h>
+#include <sys/qos.h>
+
+#ifndef _POSIX_SPAWN_DISABLE_ASLR
+#define _POSIX_SPAWN_DISABLE_ASLR 0x0100
+#endif
+
+extern char **environ;
+
+int main(int argc, char **argv) {
+    posix_spawnattr_t attr;
+    int err;
+
+    if (argc < 2) {
+        fprintf(stderr, "Usage: %s <benchmark> [args...]\n", argv[0]);
+        return 2;
+    }
+
+    posix_spawnattr_init(&attr);
+    posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETEXEC | _POSIX_SPAWN_DISABLE_ASLR);
+    posix_spawnattr_set_qos_class_np(&attr, QOS_CLASS_USER_INTERACTIVE);
+
+    /* Only returns on failure */
+    err = posix_spawn(NULL, argv[1], NULL, &attr, &argv[1], environ);
+    fprintf(stderr, "launcher: cannot exec %s (errno %d)\n", argv[1], err);
+    return 127;
+}
@@ -10,269 +10,81 @@ Formula: time = instruction_latency * instruction_count + constant_overhead
 
 This script:
 1. Generates assembly benchmarks with varying iteration counts
-2. Builds and runs them, collecting timing data
+2. Builds and runs them, collecting per-process CPU time (wait4 rusage),
+   or with --in-process, cntvct_el0 ticks per repetition inside one process
 3. Fits a linear regression model
 4. Reports the instruction latency and overhead
+
+Each data point uses the minimum of its timed runs rather than a mean.
+Measurement noise (preemption, interrupts, throttling) can only make a run
+slower, never faster, so the minimum is the least biased estimate of the
+true execution time and needs far fewer runs to converge.
 """
 
+import atexit
+import functools
+import hashlib
 import os
+import random
+import shutil
 import subprocess
 import sys
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
-# Check for numpy/scipy availability
+# orjson serializes the results several times faster than the stdlib
 try:
-    import numpy as np
-    from scipy import stats
-    HAS_SCIPY = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_SCIPY = False
-    print("Note: scipy not available, using simple linear regression fallback")
-
-# Benchmark templates - each generates N iterations of target instructions
-BENCHMARK_TEMPLATES = {
-    "arithmetic": {
-        "description": "20 independent ADDs per iteration (ALU throughput)",
-        "instructions_per_iter": 20,
-        "template": """
-// arithmetic_calibration.s - Generated for {iterations} iterations
-.global _main
-.align 4
-
-_main:
-    mov x10, #0              // iteration counter
-{load_iterations}
-
-    mov x0, #0
-    mov x1, #0
-    mov x2, #0
-    mov x3, #0
-    mov x4, #0
-
-.loop:
-    add x0, x0, #1
-    add x1, x1, #1
-    add x2, x2, #1
-    add x3, x3, #1
-    add x4, x4, #1
-
-    add x0, x0, #1
-    add x1, x1, #1
-    add x2, x2, #1
-    add x3, x3, #1
-    add x4, x4, #1
-
-    add x0, x0, #1
-    add x1, x1, #1
-    add x2, x2, #1
-    add x3, x3, #1
-    add x4, x4, #1
-
-    add x0, x0, #1
-    add x1, x1, #1
-    add x2, x2, #1
-    add x3, x3, #1
-    add x4, x4, #1
-
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .loop
-
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "dependency": {
-        "description": "20 dependent ADDs per iteration (RAW hazards)",
-        "instructions_per_iter": 20,
-        "template": """
-// dependency_calibration.s - Generated for {iterations} iterations
-.global _main
-.align 4
-
-_main:
-    mov x10, #0              // iteration counter
-{load_iterations}
-
-    mov x0, #0
+    HAS_ORJSON = False
 
-.loop:
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-    add x0, x0, #1
-
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .loop
-
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "branch": {
-        "description": "5 taken branches per iteration (branch predictor)",
-        "instructions_per_iter": 5,
-        "template": """
-// branch_calibration.s - Generated for {iterations} iterations
-.global _main
-.align 4
-
-_main:
-    mov x10, #0              // iteration counter
-{load_iterations}
-
-.loop:
-    b .b1
-.b1:
-    b .b2
-.b2:
-    b .b3
-.b3:
-    b .b4
-.b4:
-    b .b5
-.b5:
-
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .loop
+from bench_harness import Runner, linear_regression, mad_filter, performance_core_count
 
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "memorystrided": {
-        "description": "10 store/load pairs with stride-4 access per iteration (strided memory pattern)",
-        "instructions_per_iter": 20,
-        "template": """
-// memorystrided_calibration.s - Generated for {iterations} iterations
-.global _main
-.align 4
 
-_main:
-    mov x10, #0              // iteration counter
-{load_iterations}
+def emit_init(values: Iterable[int], base_offset: int = 0,
+              reg: str = "x0", base: str = "sp") -> str:
+    """Emit mov/str pairs storing values as consecutive 64-bit words at [base, #base_offset]."""
+    return "\n".join(
+        f"    mov {reg}, #{v}\n    str {reg}, [{base}, #{base_offset + i * 8}]"
+        for i, v in enumerate(values)
+    )
 
-    sub sp, sp, #320         // allocate buffer (enough for stride offsets)
-    mov x0, #7               // value to store/load
-    mov x1, sp               // base address
 
-.loop:
-    // 10 store/load pairs at stride-4 offsets (32-byte stride)
-    str x0, [x1, #0]
-    ldr x0, [x1, #0]
-    str x0, [x1, #32]
-    ldr x0, [x1, #32]
-    str x0, [x1, #64]
-    ldr x0, [x1, #64]
-    str x0, [x1, #96]
-    ldr x0, [x1, #96]
-    str x0, [x1, #128]
-    ldr x0, [x1, #128]
-    str x0, [x1, #160]
-    ldr x0, [x1, #160]
-    str x0, [x1, #192]
-    ldr x0, [x1, #192]
-    str x0, [x1, #224]
-    ldr x0, [x1, #224]
-    str x0, [x1, #256]
-    ldr x0, [x1, #256]
-    str x0, [x1, #288]
-    ldr x0, [x1, #288]
+def stack_alloc_bytes(data_bytes: int) -> int:
+    """Round a stack buffer up to 16-byte alignment, checking it fits a sub-immediate."""
+    size = (data_bytes + 15) & ~15
+    if size > 0xFFF:
+        raise ValueError(f"Stack buffer of {data_bytes} bytes too large (max 4095)")
+    return size
 
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .loop
 
-    add sp, sp, #320
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "loadheavy": {
+def loadheavy_template() -> dict:
+    """20 independent loads from a 20-element stack buffer."""
+    return {
         "description": "20 independent loads per iteration (load throughput)",
         "instructions_per_iter": 20,
-        "template": """
-// loadheavy_calibration.s - Generated for {iterations} iterations
+        "template": f"""
+// loadheavy_calibration.s - Generated for {{iterations}} iterations
 .global _main
 .align 4
 
 _main:
+{{read_iterations}}
     mov x10, #0              // iteration counter
-{load_iterations}
+{{load_iterations}}
 
     sub sp, sp, #160         // allocate buffer (20 * 8 bytes)
     mov x1, sp               // base address
 
     // Pre-fill buffer with known values
-    mov x2, #1
-    str x2, [x1, #0]
-    mov x2, #2
-    str x2, [x1, #8]
-    mov x2, #3
-    str x2, [x1, #16]
-    mov x2, #4
-    str x2, [x1, #24]
-    mov x2, #5
-    str x2, [x1, #32]
-    mov x2, #6
-    str x2, [x1, #40]
-    mov x2, #7
-    str x2, [x1, #48]
-    mov x2, #8
-    str x2, [x1, #56]
-    mov x2, #9
-    str x2, [x1, #64]
-    mov x2, #10
-    str x2, [x1, #72]
-    mov x2, #11
-    str x2, [x1, #80]
-    mov x2, #12
-    str x2, [x1, #88]
-    mov x2, #13
-    str x2, [x1, #96]
-    mov x2, #14
-    str x2, [x1, #104]
-    mov x2, #15
-    str x2, [x1, #112]
-    mov x2, #16
-    str x2, [x1, #120]
-    mov x2, #17
-    str x2, [x1, #128]
-    mov x2, #18
-    str x2, [x1, #136]
-    mov x2, #19
-    str x2, [x1, #144]
-    mov x2, #20
-    str x2, [x1, #152]
+{emit_init(range(1, 21), reg="x2", base="x1")}
 
 .loop:
     // 20 loads to independent registers (no RAW hazards)
@@ -305,306 +117,101 @@ _main:
     mov x0, #0
     mov x16, #1
     svc #0x80
-"""
-    },
-    "storeheavy": {
-        "description": "20 independent stores per iteration (store throughput)",
-        "instructions_per_iter": 20,
-        "template": """
-// storeheavy_calibration.s - Generated for {iterations} iterations
+""",
+    }
+
+
+def vectorsum_template(n_elements: int = 16) -> dict:
+    """Sum an n_elements array of 64-bit values on every outer iteration."""
+    stack_bytes = stack_alloc_bytes(n_elements * 8)
+    instructions_per_iter = 4 + 6 * n_elements  # setup + inner iters * 6 insts
+    return {
+        "description": f"{n_elements}-element array sum loop per iteration (load+accumulate)",
+        "instructions_per_iter": instructions_per_iter,
+        "template": f"""
+// vectorsum_calibration.s - Generated for {{iterations}} outer iterations
+// Inner loop: {n_elements} loads + accumulates (6 insts * {n_elements} + 4 setup = {instructions_per_iter})
 .global _main
 .align 4
 
 _main:
-    mov x10, #0              // iteration counter
-{load_iterations}
+{{read_iterations}}
+    // Allocate array on stack ({n_elements} * 8 bytes, 16-byte aligned)
+    sub sp, sp, #{stack_bytes}
 
-    sub sp, sp, #160         // allocate buffer (20 * 8 bytes)
-    mov x1, sp               // base address
-    mov x2, #99              // value to store
+    // Initialize array: A[i] = i + 1
+{emit_init(range(1, n_elements + 1))}
 
-.loop:
-    // 20 stores to sequential addresses (no data dependencies)
-    str x2, [x1, #0]
-    str x2, [x1, #8]
-    str x2, [x1, #16]
-    str x2, [x1, #24]
-    str x2, [x1, #32]
-    str x2, [x1, #40]
-    str x2, [x1, #48]
-    str x2, [x1, #56]
-    str x2, [x1, #64]
-    str x2, [x1, #72]
-    str x2, [x1, #80]
-    str x2, [x1, #88]
-    str x2, [x1, #96]
-    str x2, [x1, #104]
-    str x2, [x1, #112]
-    str x2, [x1, #120]
-    str x2, [x1, #128]
-    str x2, [x1, #136]
-    str x2, [x1, #144]
-    str x2, [x1, #152]
+    mov x10, #0              // outer iteration counter
+{{load_iterations}}
+
+.outer_loop:
+    // Setup (4 insts)
+    mov x0, #0              // sum = 0
+    mov x1, sp              // array pointer
+    mov x2, #0              // i = 0
+    mov x3, #{n_elements:<15}// N = {n_elements}
+
+.inner_loop:
+    // Inner loop body (6 insts * {n_elements} iters)
+    ldr x4, [x1]            // load A[i]
+    add x0, x0, x4          // sum += A[i]
+    add x1, x1, #8          // ptr += 8
+    add x2, x2, #1          // i++
+    cmp x2, x3              // i < N?
+    b.lt .inner_loop
 
     add x10, x10, #1
     cmp x10, x11
-    b.lt .loop
+    b.lt .outer_loop
 
-    add sp, sp, #160
+    add sp, sp, #{stack_bytes}
     mov x0, #0
     mov x16, #1
     svc #0x80
-"""
-    },
-    "branchheavy": {
-        "description": "10 conditional branches per iteration (alternating taken/not-taken)",
-        "instructions_per_iter": 10,
-        "template": """
-// branchheavy_calibration.s - Generated for {iterations} iterations
-// Uses alternating taken/not-taken pattern to stress branch predictor
+""",
+    }
+
+
+def vectoradd_template(n_elements: int = 16) -> dict:
+    """C[i] = A[i] + B[i] over n_elements-long arrays on every outer iteration."""
+    b_offset = n_elements * 8
+    c_offset = 2 * n_elements * 8
+    stack_bytes = stack_alloc_bytes(3 * n_elements * 8)
+    instructions_per_iter = 5 + 10 * n_elements  # setup + inner iters * 10 insts
+    return {
+        "description": f"{n_elements}-element vector add loop per iteration (2 loads+add+store)",
+        "instructions_per_iter": instructions_per_iter,
+        "template": f"""
+// vectoradd_calibration.s - Generated for {{iterations}} outer iterations
+// Inner loop: C[i]=A[i]+B[i] (10 insts * {n_elements} + 5 setup = {instructions_per_iter})
 .global _main
 .align 4
 
 _main:
-    mov x10, #0              // iteration counter
-{load_iterations}
-
-.loop:
-    // 10 conditional branches (CMP + B.LT pattern)
-    // Even branches: compare X10 >= 0, always taken (forward skip)
-    // Odd branches: compare 0 >= X10, never taken (falls through)
-    // This creates alternating taken/not-taken to stress predictor
-
-    // Branch 1: taken (X10 >= 0 is always true since X10 is unsigned counter)
-    cmp x10, #0
-    b.ge .t1
-    nop
-.t1:
-    // Branch 2: not taken (0 < X10 when X10 > 0, first iter 0 == 0 so taken)
-    cmp xzr, x10
-    b.ge .t2
-    nop
-.t2:
-    // Branch 3: taken
-    cmp x10, #0
-    b.ge .t3
-    nop
-.t3:
-    // Branch 4: not taken
-    cmp xzr, x10
-    b.ge .t4
-    nop
-.t4:
-    // Branch 5: taken
-    cmp x10, #0
-    b.ge .t5
-    nop
-.t5:
-    // Branch 6: not taken
-    cmp xzr, x10
-    b.ge .t6
-    nop
-.t6:
-    // Branch 7: taken
-    cmp x10, #0
-    b.ge .t7
-    nop
-.t7:
-    // Branch 8: not taken
-    cmp xzr, x10
-    b.ge .t8
-    nop
-.t8:
-    // Branch 9: taken
-    cmp x10, #0
-    b.ge .t9
-    nop
-.t9:
-    // Branch 10: not taken
-    cmp xzr, x10
-    b.ge .t10
-    nop
-.t10:
-
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .loop
-
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "vectorsum": {
-        "description": "16-element array sum loop per iteration (load+accumulate)",
-        "instructions_per_iter": 100,  # 4 setup + 16 inner iters * 6 insts/inner iter = 100
-        "template": """
-// vectorsum_calibration.s - Generated for {iterations} outer iterations
-// Inner loop: 16 loads + accumulates (6 insts * 16 = 96 inner + 4 setup = 100)
-.global _main
-.align 4
-
-_main:
-    // Allocate array on stack (16 * 8 = 128 bytes, 256 with alignment padding)
-    sub sp, sp, #256
-
-    // Initialize array: A[i] = i + 1
-    mov x0, #1
-    str x0, [sp, #0]
-    mov x0, #2
-    str x0, [sp, #8]
-    mov x0, #3
-    str x0, [sp, #16]
-    mov x0, #4
-    str x0, [sp, #24]
-    mov x0, #5
-    str x0, [sp, #32]
-    mov x0, #6
-    str x0, [sp, #40]
-    mov x0, #7
-    str x0, [sp, #48]
-    mov x0, #8
-    str x0, [sp, #56]
-    mov x0, #9
-    str x0, [sp, #64]
-    mov x0, #10
-    str x0, [sp, #72]
-    mov x0, #11
-    str x0, [sp, #80]
-    mov x0, #12
-    str x0, [sp, #88]
-    mov x0, #13
-    str x0, [sp, #96]
-    mov x0, #14
-    str x0, [sp, #104]
-    mov x0, #15
-    str x0, [sp, #112]
-    mov x0, #16
-    str x0, [sp, #120]
-
-    mov x10, #0              // outer iteration counter
-{load_iterations}
-
-.outer_loop:
-    // Setup (4 insts)
-    mov x0, #0              // sum = 0
-    mov x1, sp              // array pointer
-    mov x2, #0              // i = 0
-    mov x3, #16             // N = 16
-
-.inner_loop:
-    // Inner loop body (6 insts * 16 iters = 96)
-    ldr x4, [x1]            // load A[i]
-    add x0, x0, x4          // sum += A[i]
-    add x1, x1, #8          // ptr += 8
-    add x2, x2, #1          // i++
-    cmp x2, x3              // i < N?
-    b.lt .inner_loop
-
-    add x10, x10, #1
-    cmp x10, x11
-    b.lt .outer_loop
-
-    add sp, sp, #256
-    mov x0, #0
-    mov x16, #1
-    svc #0x80
-"""
-    },
-    "vectoradd": {
-        "description": "16-element vector add loop per iteration (2 loads+add+store)",
-        "instructions_per_iter": 165,  # 5 setup + 16 inner iters * 10 insts/inner iter = 165
-        "template": """
-// vectoradd_calibration.s - Generated for {iterations} outer iterations
-// Inner loop: C[i]=A[i]+B[i] (10 insts * 16 = 160 inner + 5 setup = 165)
-.global _main
-.align 4
-
-_main:
-    // Allocate 3 arrays: A, B, C (each 128 bytes = 16*8 = 384, 512 with padding)
-    sub sp, sp, #512
+{{read_iterations}}
+    // Allocate 3 arrays: A, B, C ({n_elements} * 8 bytes each, 16-byte aligned)
+    sub sp, sp, #{stack_bytes}
 
     // Initialize A[i] = i + 1
-    mov x0, #1
-    str x0, [sp, #0]
-    mov x0, #2
-    str x0, [sp, #8]
-    mov x0, #3
-    str x0, [sp, #16]
-    mov x0, #4
-    str x0, [sp, #24]
-    mov x0, #5
-    str x0, [sp, #32]
-    mov x0, #6
-    str x0, [sp, #40]
-    mov x0, #7
-    str x0, [sp, #48]
-    mov x0, #8
-    str x0, [sp, #56]
-    mov x0, #9
-    str x0, [sp, #64]
-    mov x0, #10
-    str x0, [sp, #72]
-    mov x0, #11
-    str x0, [sp, #80]
-    mov x0, #12
-    str x0, [sp, #88]
-    mov x0, #13
-    str x0, [sp, #96]
-    mov x0, #14
-    str x0, [sp, #104]
-    mov x0, #15
-    str x0, [sp, #112]
-    mov x0, #16
-    str x0, [sp, #120]
+{emit_init(range(1, n_elements + 1))}
 
     // Initialize B[i] = 2*(i+1)
-    mov x0, #2
-    str x0, [sp, #128]
-    mov x0, #4
-    str x0, [sp, #136]
-    mov x0, #6
-    str x0, [sp, #144]
-    mov x0, #8
-    str x0, [sp, #152]
-    mov x0, #10
-    str x0, [sp, #160]
-    mov x0, #12
-    str x0, [sp, #168]
-    mov x0, #14
-    str x0, [sp, #176]
-    mov x0, #16
-    str x0, [sp, #184]
-    mov x0, #18
-    str x0, [sp, #192]
-    mov x0, #20
-    str x0, [sp, #200]
-    mov x0, #22
-    str x0, [sp, #208]
-    mov x0, #24
-    str x0, [sp, #216]
-    mov x0, #26
-    str x0, [sp, #224]
-    mov x0, #28
-    str x0, [sp, #232]
-    mov x0, #30
-    str x0, [sp, #240]
-    mov x0, #32
-    str x0, [sp, #248]
+{emit_init(range(2, 2 * n_elements + 1, 2), base_offset=b_offset)}
 
     mov x10, #0              // outer iteration counter
-{load_iterations}
+{{load_iterations}}
 
 .outer_loop:
     // Setup (5 insts)
     add x1, sp, #0          // A ptr
-    add x2, sp, #128        // B ptr
-    add x3, sp, #256        // C ptr
+    add x2, sp, #{b_offset:<11}// B ptr
+    add x3, sp, #{c_offset:<11}// C ptr
     mov x4, #0              // i = 0
-    mov x5, #16             // N = 16
+    mov x5, #{n_elements:<15}// N = {n_elements}
 
 .inner_loop:
-    // Inner loop body (10 insts * 16 iters = 160)
+    // Inner loop body (10 insts * {n_elements} iters)
     ldr x6, [x1]            // load A[i]
     ldr x7, [x2]            // load B[i]
     add x9, x6, x7          // A[i] + B[i]
@@ -620,61 +227,35 @@ _main:
     cmp x10, x11
     b.lt .outer_loop
 
-    add sp, sp, #512
+    add sp, sp, #{stack_bytes}
     mov x0, #0
     mov x16, #1
     svc #0x80
-"""
-    },
-    "reductiontree": {
+""",
+    }
+
+
+def reductiontree_template() -> dict:
+    """Flat 16-element reduction tree (the tree shape fixes the array length)."""
+    return {
         "description": "16-element parallel reduction tree per iteration (16 loads + 15 adds)",
         "instructions_per_iter": 31,  # 16 loads + 15 adds = 31 flat instructions
-        "template": """
-// reductiontree_calibration.s - Generated for {iterations} iterations
+        "template": f"""
+// reductiontree_calibration.s - Generated for {{iterations}} iterations
 // Flat body: 16 loads + 15 tree-reduction adds = 31 insts per iteration
 .global _main
 .align 4
 
 _main:
+{{read_iterations}}
     // Allocate array on stack (16 * 8 = 128 bytes, 256 with alignment padding)
     sub sp, sp, #256
 
     // Initialize array: A[i] = i + 1
-    mov x0, #1
-    str x0, [sp, #0]
-    mov x0, #2
-    str x0, [sp, #8]
-    mov x0, #3
-    str x0, [sp, #16]
-    mov x0, #4
-    str x0, [sp, #24]
-    mov x0, #5
-    str x0, [sp, #32]
-    mov x0, #6
-    str x0, [sp, #40]
-    mov x0, #7
-    str x0, [sp, #48]
-    mov x0, #8
-    str x0, [sp, #56]
-    mov x0, #9
-    str x0, [sp, #64]
-    mov x0, #10
-    str x0, [sp, #72]
-    mov x0, #11
-    str x0, [sp, #80]
-    mov x0, #12
-    str x0, [sp, #88]
-    mov x0, #13
-    str x0, [sp, #96]
-    mov x0, #14
-    str x0, [sp, #104]
-    mov x0, #15
-    str x0, [sp, #112]
-    mov x0, #16
-    str x0, [sp, #120]
+{emit_init(range(1, 17))}
 
     mov x20, #0              // iteration counter
-{load_iterations_x21}
+{{load_iterations_x21}}
 
 .loop:
     // Load all 16 elements (16 insts)
@@ -695,39 +276,539 @@ _main:
     ldr x16, [sp, #112]
     ldr x17, [sp, #120]
 
-    // Level 1: 8 pairwise sums
-    add x0, x0, x2
-    add x3, x3, x4
-    add x5, x5, x6
-    add x7, x7, x9
-    add x10, x10, x11
-    add x12, x12, x13
-    add x14, x14, x15
-    add x16, x16, x17
+    // Level 1: 8 pairwise sums
+    add x0, x0, x2
+    add x3, x3, x4
+    add x5, x5, x6
+    add x7, x7, x9
+    add x10, x10, x11
+    add x12, x12, x13
+    add x14, x14, x15
+    add x16, x16, x17
+
+    // Level 2: 4 sums
+    add x0, x0, x3
+    add x5, x5, x7
+    add x10, x10, x12
+    add x14, x14, x16
+
+    // Level 3: 2 sums
+    add x0, x0, x5
+    add x10, x10, x14
+
+    // Level 4: final sum
+    add x0, x0, x10
+
+    add x20, x20, #1
+    cmp x20, x21
+    b.lt .loop
+
+    add sp, sp, #256
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+""",
+    }
+
+
+def branchrandom_template(n_branches: int = 10) -> dict:
+    """n_branches conditional branches per iteration on random bits.
+
+    branchheavy's fixed alternating pattern is learned perfectly by the
+    predictor, which memorizes even very long periodic histories. Here each
+    branch tests bit 0 of a byte from a 64KB buffer filled by getentropy() at
+    startup, so outcomes differ on every launch and the pattern only repeats
+    after 64K branches - the cost reported includes real mispredictions.
+
+    The index wraps only once per iteration, so an iteration starting near
+    the end of the 64KB reads up to n_branches - 1 bytes past it; the buffer
+    is 4KB larger, and filled the same way, so those are random too.
+    """
+    if not 1 <= n_branches <= 4096:
+        raise ValueError(f"n_branches must be 1-4096, not {n_branches}")
+    branches = "\n".join(
+        f"""    ldrb w0, [sp, x13]
+    add x13, x13, #1
+    tbnz w0, #0, .r{i}
+    nop
+.r{i}:"""
+        for i in range(1, n_branches + 1)
+    )
+    return {
+        "description": f"{n_branches} branches per iteration on random bits (mispredicts)",
+        "instructions_per_iter": n_branches,  # counted per branch, as in branchheavy
+        "template": f"""
+// branchrandom_calibration.s - Generated for {{iterations}} iterations
+// Each branch is taken or not on a random bit (50% mispredict floor)
+.global _main
+.align 4
+
+_main:
+{{read_iterations}}
+    // Fill a 68KB stack buffer with random bytes, 256 per getentropy() call:
+    // the 64KB the index wraps over, plus room for the loads of an
+    // iteration that starts near its end
+    sub sp, sp, #17, lsl #12
+    mov x20, #0
+.fill:
+    add x0, sp, x20
+    mov x1, #256
+    bl _getentropy
+    add x20, x20, #256
+    cmp x20, #17, lsl #12
+    b.lt .fill
+
+    mov x13, #0              // byte index into the random buffer
+    mov x10, #0              // iteration counter
+{{load_iterations}}
+
+.loop:
+{branches}
+
+    and x13, x13, #0xffff    // wrap the index at 64KB
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    add sp, sp, #17, lsl #12
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+""",
+    }
+
+
+def pointerchase_template(buffer_kb: int, shuffle: bool = True,
+                          hops_per_iter: int = 16) -> dict:
+    """Dependent-load chase through a buffer_kb buffer of 8-byte indices.
+
+    The buffer is malloc'd and linked at startup into one cycle: A[i] = i+1
+    for a sequential walk, or a Sattolo shuffle (xorshift64, fixed seed) for
+    a random one, which defeats the prefetcher. Sweeping buffer_kb past each
+    cache size shows that level's load-to-use latency as a step in ns/hop.
+    """
+    n = buffer_kb * 1024 // 8
+    order = "random" if shuffle else "sequential"
+    if shuffle:
+        link = """
+    // Sattolo's shuffle of A[i] = i: for i = n-1 down to 1 swap A[i] with
+    // A[j], j < i, which leaves a single cycle through every element
+    movz x3, #0x7c15
+    movk x3, #0x7f4a, lsl #16
+    movk x3, #0x79b9, lsl #32
+    movk x3, #0x9e37, lsl #48
+    sub x1, x22, #1
+.shuffle:
+    eor x3, x3, x3, lsl #13  // xorshift64
+    eor x3, x3, x3, lsr #7
+    eor x3, x3, x3, lsl #17
+    udiv x4, x3, x1
+    msub x4, x4, x1, x3      // j = rand % i
+    ldr x5, [x21, x1, lsl #3]
+    ldr x6, [x21, x4, lsl #3]
+    str x6, [x21, x1, lsl #3]
+    str x5, [x21, x4, lsl #3]
+    sub x1, x1, #1
+    cbnz x1, .shuffle"""
+    else:
+        link = """
+    // Close the cycle: A[n-1] = 0
+    sub x1, x22, #1
+    str xzr, [x21, x1, lsl #3]"""
+    hops = "\n".join(["    ldr x2, [x21, x2, lsl #3]"] * hops_per_iter)
+    return {
+        "description": f"{hops_per_iter}-hop {order} pointer chase per iteration over {buffer_kb}KB",
+        "instructions_per_iter": hops_per_iter,
+        "template": f"""
+// pointerchase_calibration.s - Generated for {{iterations}} iterations
+// {order.capitalize()} chase over {buffer_kb}KB ({n} indices), {hops_per_iter} dependent loads per iteration
+.global _main
+.align 4
+
+_main:
+{{read_iterations}}
+{load_iterations_asm(n, "x22")}
+    lsl x0, x22, #3
+    bl _malloc
+    mov x21, x0              // chase buffer
+
+    // A[i] = {"i" if shuffle else "i + 1"}
+    mov x1, #0
+.init:
+    add x2, x1, #{0 if shuffle else 1}
+    str x2, [x21, x1, lsl #3]
+    add x1, x1, #1
+    cmp x1, x22
+    b.lt .init
+{link}
+
+    mov x2, #0               // current index
+    mov x10, #0              // iteration counter
+{{load_iterations}}
+
+.loop:
+{hops}
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+""",
+    }
+
+
+# Loop iteration counts for the regression data points (see main)
+ITERATION_COUNTS = (
+    1_000_000,
+    2_000_000,
+    4_000_000,
+    8_000_000,
+    16_000_000,
+    32_000_000,
+)
+
+# Templates with a "unit" repeat it this many times inside the loop, so the
+# 3-instruction add/cmp/b.lt bookkeeping is ~1% of the body rather than ~13%
+DEFAULT_UNROLL = 50
+
+# Unroll factors for --unroll-sweep; latency vs 1/unroll is extrapolated to
+# unroll -> infinity to remove the loop overhead entirely
+UNROLL_SWEEP = (1, 10, 50, 200)
+
+# Data points at or below this many iterations get one extra timed run,
+# since process startup is a larger share of them
+SHORT_RUN_ITERATIONS = 2_000_000
+
+# Instructions per iteration the default iteration counts were sized for
+BASELINE_INSTRUCTIONS_PER_ITER = 20
+
+# Data points above this many instructions (8M iterations of a 20-instruction
+# body) are followed by a pause so the next one does not start throttled
+COOLDOWN_INSTRUCTIONS = 160_000_000
+COOLDOWN_SECONDS = 2.0
+
+# Default --cpu-warmup-seconds: runs of the shortest benchmark before any
+# timing, so the first template is not measured during the frequency ramp
+CPU_WARMUP_SECONDS = 2.0
+
+# Buffer sizes for --chase-sweep, chosen to straddle L1, L2, SLC and DRAM
+CHASE_SWEEP_KB = (4, 32, 256, 2048, 16384, 131072)
+
+# Total hops per data point for --chase-sweep; DRAM hops are ~100 ns each,
+# so the default iteration counts would take minutes per point
+CHASE_HOP_COUNTS = (1_000_000, 2_000_000, 4_000_000, 8_000_000)
+
+# Benchmark templates - each generates N iterations of target instructions
+BENCHMARK_TEMPLATES = {
+    "baseline": {
+        "description": "Empty loop (add/cmp/b.lt only), subtracted from the others",
+        "instructions_per_iter": 0,
+        "template": """
+// baseline_calibration.s - Generated for {iterations} iterations
+// Loop control only: its cost per iteration is removed from every other template
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+.loop:
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "arithmetic": {
+        "description": "Independent ADDs, 5 per unrolled copy (ALU throughput)",
+        "unit": """\
+    add x0, x0, #1
+    add x1, x1, #1
+    add x2, x2, #1
+    add x3, x3, #1
+    add x4, x4, #1""",
+        "unit_instructions": 5,
+        "template": """
+// arithmetic_calibration.s - Generated for {iterations} iterations
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+    mov x0, #0
+    mov x1, #0
+    mov x2, #0
+    mov x3, #0
+    mov x4, #0
+
+.loop:
+{body}
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "dependency": {
+        "description": "Dependent ADDs, 5 per unrolled copy (RAW hazards)",
+        "unit": """\
+    add x0, x0, #1
+    add x0, x0, #1
+    add x0, x0, #1
+    add x0, x0, #1
+    add x0, x0, #1""",
+        "unit_instructions": 5,
+        "template": """
+// dependency_calibration.s - Generated for {iterations} iterations
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+    mov x0, #0
+
+.loop:
+{body}
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "branch": {
+        "description": "Unconditional taken branches, 1 per unrolled copy (branch predictor)",
+        # Each copy needs its own label, so the unit is built per copy index
+        "unit": lambda i: f"    b .b{i}\n.b{i}:",
+        "unit_instructions": 1,
+        "template": """
+// branch_calibration.s - Generated for {iterations} iterations
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+.loop:
+{body}
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "memorystrided": {
+        "description": "10 store/load pairs with stride-4 access per iteration (strided memory pattern)",
+        "instructions_per_iter": 20,
+        "template": """
+// memorystrided_calibration.s - Generated for {iterations} iterations
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+    sub sp, sp, #320         // allocate buffer (enough for stride offsets)
+    mov x0, #7               // value to store/load
+    mov x1, sp               // base address
+
+.loop:
+    // 10 store/load pairs at stride-4 offsets (32-byte stride)
+    str x0, [x1, #0]
+    ldr x0, [x1, #0]
+    str x0, [x1, #32]
+    ldr x0, [x1, #32]
+    str x0, [x1, #64]
+    ldr x0, [x1, #64]
+    str x0, [x1, #96]
+    ldr x0, [x1, #96]
+    str x0, [x1, #128]
+    ldr x0, [x1, #128]
+    str x0, [x1, #160]
+    ldr x0, [x1, #160]
+    str x0, [x1, #192]
+    ldr x0, [x1, #192]
+    str x0, [x1, #224]
+    ldr x0, [x1, #224]
+    str x0, [x1, #256]
+    ldr x0, [x1, #256]
+    str x0, [x1, #288]
+    ldr x0, [x1, #288]
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
+
+    add sp, sp, #320
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "loadheavy": loadheavy_template(),
+    "storeheavy": {
+        "description": "20 independent stores per iteration (store throughput)",
+        "instructions_per_iter": 20,
+        "template": """
+// storeheavy_calibration.s - Generated for {iterations} iterations
+.global _main
+.align 4
+
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
+
+    sub sp, sp, #160         // allocate buffer (20 * 8 bytes)
+    mov x1, sp               // base address
+    mov x2, #99              // value to store
+
+.loop:
+    // 20 stores to sequential addresses (no data dependencies)
+    str x2, [x1, #0]
+    str x2, [x1, #8]
+    str x2, [x1, #16]
+    str x2, [x1, #24]
+    str x2, [x1, #32]
+    str x2, [x1, #40]
+    str x2, [x1, #48]
+    str x2, [x1, #56]
+    str x2, [x1, #64]
+    str x2, [x1, #72]
+    str x2, [x1, #80]
+    str x2, [x1, #88]
+    str x2, [x1, #96]
+    str x2, [x1, #104]
+    str x2, [x1, #112]
+    str x2, [x1, #120]
+    str x2, [x1, #128]
+    str x2, [x1, #136]
+    str x2, [x1, #144]
+    str x2, [x1, #152]
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .loop
 
-    // Level 2: 4 sums
-    add x0, x0, x3
-    add x5, x5, x7
-    add x10, x10, x12
-    add x14, x14, x16
+    add sp, sp, #160
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+    },
+    "branchheavy": {
+        "description": "10 conditional branches per iteration (alternating taken/not-taken)",
+        "instructions_per_iter": 10,
+        "template": """
+// branchheavy_calibration.s - Generated for {iterations} iterations
+// Uses alternating taken/not-taken pattern to stress branch predictor
+.global _main
+.align 4
 
-    // Level 3: 2 sums
-    add x0, x0, x5
-    add x10, x10, x14
+_main:
+{read_iterations}
+    mov x10, #0              // iteration counter
+{load_iterations}
 
-    // Level 4: final sum
-    add x0, x0, x10
+.loop:
+    // 10 conditional branches (CMP + B.LT pattern)
+    // Even branches: compare X10 >= 0, always taken (forward skip)
+    // Odd branches: compare 0 >= X10, never taken (falls through)
+    // This creates alternating taken/not-taken to stress predictor
 
-    add x20, x20, #1
-    cmp x20, x21
+    // Branch 1: taken (X10 >= 0 is always true since X10 is unsigned counter)
+    cmp x10, #0
+    b.ge .t1
+    nop
+.t1:
+    // Branch 2: not taken (0 < X10 when X10 > 0, first iter 0 == 0 so taken)
+    cmp xzr, x10
+    b.ge .t2
+    nop
+.t2:
+    // Branch 3: taken
+    cmp x10, #0
+    b.ge .t3
+    nop
+.t3:
+    // Branch 4: not taken
+    cmp xzr, x10
+    b.ge .t4
+    nop
+.t4:
+    // Branch 5: taken
+    cmp x10, #0
+    b.ge .t5
+    nop
+.t5:
+    // Branch 6: not taken
+    cmp xzr, x10
+    b.ge .t6
+    nop
+.t6:
+    // Branch 7: taken
+    cmp x10, #0
+    b.ge .t7
+    nop
+.t7:
+    // Branch 8: not taken
+    cmp xzr, x10
+    b.ge .t8
+    nop
+.t8:
+    // Branch 9: taken
+    cmp x10, #0
+    b.ge .t9
+    nop
+.t9:
+    // Branch 10: not taken
+    cmp xzr, x10
+    b.ge .t10
+    nop
+.t10:
+
+    add x10, x10, #1
+    cmp x10, x11
     b.lt .loop
 
-    add sp, sp, #256
     mov x0, #0
     mov x16, #1
     svc #0x80
 """
     },
+    "branchrandom": branchrandom_template(),
+    "vectorsum": vectorsum_template(),
+    "vectoradd": vectoradd_template(),
+    "reductiontree": reductiontree_template(),
     "strideindirect": {
         "description": "8-hop pointer chase per iteration (dependent load chain)",
         "instructions_per_iter": 50,  # 2 setup + 8 inner iters * 6 insts = 50
@@ -738,6 +819,7 @@ _main:
 .align 4
 
 _main:
+{read_iterations}
     // Allocate index array on stack (8 * 8 = 64 bytes, 128 with alignment padding)
     sub sp, sp, #128
 
@@ -789,8 +871,22 @@ _main:
 }
 
 
-def load_iterations_asm(n: int, reg: str = "x11") -> str:
-    """Generate ARM64 assembly to load iteration count into given register."""
+# Reads the iteration count from argv[1] at startup. dyld enters _main with
+# x1 = argv; x19 is callee-saved, so the value survives the _atol call and
+# {load_iterations} only has to copy it into the loop-bound register.
+READ_ITERATIONS_ASM = """    ldr x0, [x1, #8]         // argv[1]
+    bl _atol
+    mov x19, x0              // iteration count"""
+
+
+@functools.lru_cache(maxsize=256)
+def load_iterations_asm(n: Optional[int], reg: str = "x11") -> str:
+    """Generate ARM64 assembly to load iteration count into given register.
+
+    With n=None the count is taken from argv[1] (see READ_ITERATIONS_ASM).
+    """
+    if n is None:
+        return f"    mov {reg}, x19"
     if n <= 0xFFFF:
         return f"    movz {reg}, #{n}"
     elif n <= 0xFFFFFFFF:
@@ -804,69 +900,463 @@ def load_iterations_asm(n: int, reg: str = "x11") -> str:
         raise ValueError(f"Iteration count {n} too large (max 2^32-1)")
 
 
-def generate_benchmark(template_name: str, iterations: int) -> str:
-    """Generate assembly source for a benchmark with given iteration count."""
+def instructions_per_iter(template_name: str, unroll: Optional[int] = None) -> int:
+    """Target instructions per loop iteration, accounting for unrolling.
+
+    Templates with a "unit" repeat it unroll times (DEFAULT_UNROLL if None)
+    and have no fixed instructions_per_iter; the others have a fixed body
+    and ignore unroll.
+    """
+    tmpl = BENCHMARK_TEMPLATES[template_name]
+    if "unit" not in tmpl:
+        return tmpl["instructions_per_iter"]
+    return tmpl["unit_instructions"] * (unroll or DEFAULT_UNROLL)
+
+
+def scale_iteration_counts(template_name: str, iteration_counts: Sequence[int],
+                           unroll: Optional[int] = None) -> List[int]:
+    """Scale iteration counts so unrolled templates run about as many
+    instructions as a BASELINE_INSTRUCTIONS_PER_ITER body would."""
+    if "unit" not in BENCHMARK_TEMPLATES[template_name]:
+        return list(iteration_counts)
+    ipi = instructions_per_iter(template_name, unroll)
+    return [max(1, n * BASELINE_INSTRUCTIONS_PER_ITER // ipi) for n in iteration_counts]
+
+
+def unrolled_body(unit, copies: int) -> str:
+    """Repeat a template's unit copies times, blank-line separated.
+
+    unit is either a fixed block of asm or a function of the copy index,
+    for units that define labels and so must differ between copies.
+    """
+    if callable(unit):
+        return "\n\n".join(unit(i) for i in range(1, copies + 1))
+    return "\n\n".join([unit] * copies)
+
+
+def iteration_fields(iterations: Optional[int]) -> Dict[str, str]:
+    """Template fields that depend only on the iteration count."""
+    return {
+        "iterations": iterations if iterations is not None else "argv[1]",
+        "read_iterations": READ_ITERATIONS_ASM if iterations is None else "",
+        "load_iterations": load_iterations_asm(iterations),
+        "load_iterations_x21": load_iterations_asm(iterations, "x21"),
+    }
+
+
+# Fields for argv mode and every default count, rendered once at import
+_ITERATION_FIELDS = {n: iteration_fields(n) for n in (None, *ITERATION_COUNTS)}
+
+
+# Most repetitions one in-process run will time (size of its sample buffer)
+REPEAT_MAX = 256
+
+# Every template ends with this exit syscall
+EXIT_ASM = """    mov x16, #1
+    svc #0x80"""
+
+# Driver for in-process repetition, appended after a template whose _main
+# has been renamed .bench_body and whose exit jumps to .bench_return.
+# argv[2] is the repetition count; each repetition restores argc/argv/sp,
+# reruns the template from the top and records its cntvct_el0 tick delta.
+# The driver's state lives in memory because templates clobber any register.
+# stdout receives cntfrq_el0 followed by one tick count per repetition, as
+# little-endian u64s.
+REPEAT_HARNESS_ASM = """
+.zerofill __DATA,__bss,rep_state,{state_bytes},4
+
+.align 4
+_main:
+    adrp x9, rep_state@PAGE
+    add x9, x9, rep_state@PAGEOFF
+    stp x0, x1, [x9]         // argc, argv for every repetition
+    mov x2, sp
+    str x2, [x9, #16]
+    ldr x0, [x1, #16]        // argv[2]
+    bl _atol
+    cmp x0, #{repeat_max}
+    b.ls .rep_clamped
+    mov x0, #{repeat_max}
+.rep_clamped:
+    adrp x9, rep_state@PAGE
+    add x9, x9, rep_state@PAGEOFF
+    str x0, [x9, #24]        // repetitions left
+    str xzr, [x9, #32]       // samples recorded
+    mrs x2, cntfrq_el0
+    str x2, [x9, #56]
+
+.rep_next:
+    adrp x9, rep_state@PAGE
+    add x9, x9, rep_state@PAGEOFF
+    ldr x2, [x9, #24]
+    cbz x2, .rep_done
+    ldp x0, x1, [x9]
+    isb
+    mrs x3, cntvct_el0
+    str x3, [x9, #40]        // start tick
+    b .bench_body
+
+.bench_return:
+    isb
+    mrs x3, cntvct_el0
+    adrp x9, rep_state@PAGE
+    add x9, x9, rep_state@PAGEOFF
+    ldr x2, [x9, #16]
+    mov sp, x2
+    ldr x4, [x9, #40]
+    sub x3, x3, x4
+    ldr x5, [x9, #32]
+    add x6, x9, #64          // sample buffer
+    str x3, [x6, x5, lsl #3]
+    add x5, x5, #1
+    str x5, [x9, #32]
+    ldr x2, [x9, #24]
+    sub x2, x2, #1
+    str x2, [x9, #24]
+    b .rep_next
+
+.rep_done:
+    mov x0, #1               // stdout
+    add x1, x9, #56          // cntfrq, then the samples
+    ldr x2, [x9, #32]
+    add x2, x2, #1
+    lsl x2, x2, #3
+    mov x16, #4              // SYS_write
+    svc #0x80
+
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+""".format(state_bytes=64 + 8 * REPEAT_MAX, repeat_max=REPEAT_MAX)
+
+
+def with_repeat_harness(asm_source: str) -> str:
+    """Wrap a rendered argv-mode template so one process times many repetitions.
+
+    The result takes the iteration count in argv[1] as before and a
+    repetition count (at most REPEAT_MAX) in argv[2]; see time_in_process.
+    Templates that allocate per run (pointerchase) leak once per repetition.
+    """
+    body = asm_source.replace("_main:", ".bench_body:", 1)
+    body = body.replace(EXIT_ASM, "    b .bench_return")
+    return body + REPEAT_HARNESS_ASM
+
+
+@functools.lru_cache(maxsize=256)
+def generate_benchmark(template_name: str, iterations: Optional[int] = None,
+                       unroll: Optional[int] = None, repeat: bool = False) -> str:
+    """Generate assembly source for a benchmark.
+
+    By default the executable takes its iteration count as argv[1], so one
+    build serves every data point. Passing iterations bakes the count in as
+    an immediate instead, giving a standalone program that needs no arguments.
+    For templates with a "unit", unroll sets how many copies of it make up
+    the loop body (default DEFAULT_UNROLL). repeat wraps the argv-mode
+    program in the in-process repetition driver (see with_repeat_harness).
+
+    Results are cached, so BENCHMARK_TEMPLATES entries must not change once
+    rendered; replace them before the first call or call cache_clear().
+    """
     tmpl = BENCHMARK_TEMPLATES[template_name]
-    return tmpl["template"].format(
-        iterations=iterations,
-        load_iterations=load_iterations_asm(iterations),
-        load_iterations_x21=load_iterations_asm(iterations, "x21"),
+    fields = _ITERATION_FIELDS.get(iterations) or iteration_fields(iterations)
+    if "unit" in tmpl:
+        fields = {**fields, "body": unrolled_body(tmpl["unit"], unroll or DEFAULT_UNROLL)}
+    asm_source = tmpl["template"].format(**fields)
+    if repeat:
+        if iterations is not None:
+            raise ValueError("repeat requires an argv-mode benchmark (iterations=None)")
+        return with_repeat_harness(asm_source)
+    return asm_source
+
+
+@functools.lru_cache(maxsize=1)
+def sdk_path() -> str:
+    """Return the macOS SDK path, querying xcrun only once per process."""
+    # Find SDK path dynamically (works on both Xcode and CommandLineTools)
+    sdk_result = subprocess.run(
+        ["xcrun", "--show-sdk-path"],
+        capture_output=True, text=True
     )
+    if sdk_result.returncode == 0:
+        return sdk_result.stdout.strip()
+    return "/Library/Developer/CommandLineTools/SDKs/MacOSX.sdk"
 
 
-def build_and_run(asm_source: str, runs: int = 5, warmup: int = 2) -> List[float]:
-    """Build assembly source and run multiple times, returning execution times in seconds.
-    
-    Includes warmup runs (discarded) to warm up caches and reduce variance.
+# RAM disk size in 512-byte sectors (64MB); executables are a few KB each
+RAMDISK_SECTORS = 131072
+
+
+@functools.lru_cache(maxsize=1)
+def scratch_dir() -> Optional[str]:
+    """Return a RAM-backed directory for build output, or None for the default tmpdir.
+
+    Every build writes .s, .o and the executable, and every run maps the
+    executable back in; on a RAM disk none of that touches APFS. Linux has
+    /dev/shm. macOS has no tmpfs, so a RAM disk is attached and formatted
+    once per process and detached at exit.
     """
-    times = []
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        asm_path = Path(tmpdir) / "benchmark.s"
-        obj_path = Path(tmpdir) / "benchmark.o"
-        exe_path = Path(tmpdir) / "benchmark"
-        
-        # Write assembly
-        asm_path.write_text(asm_source)
-        
-        # Assemble
-        result = subprocess.run(
-            ["as", "-o", str(obj_path), str(asm_path)],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Assembly failed: {result.stderr}")
-        
-        # Find SDK path dynamically (works on both Xcode and CommandLineTools)
-        sdk_result = subprocess.run(
-            ["xcrun", "--show-sdk-path"],
-            capture_output=True, text=True
-        )
-        sdk_path = sdk_result.stdout.strip() if sdk_result.returncode == 0 else "/Library/Developer/CommandLineTools/SDKs/MacOSX.sdk"
-
-        # Link
-        result = subprocess.run(
-            ["ld", "-o", str(exe_path), str(obj_path),
-             "-lSystem", "-L", sdk_path + "/usr/lib",
-             "-syslibroot", sdk_path,
-             "-e", "_main", "-arch", "arm64"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Link failed: {result.stderr}")
-        
-        # Warmup runs (discarded)
+    if sys.platform.startswith("linux") and os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    if sys.platform != "darwin":
+        return None
+
+    attach = subprocess.run(
+        ["hdiutil", "attach", "-nomount", f"ram://{RAMDISK_SECTORS}"],
+        capture_output=True, text=True
+    )
+    if attach.returncode != 0:
+        print(f"Warning: RAM disk unavailable, building on disk: {attach.stderr}")
+        return None
+    device = attach.stdout.strip()
+    atexit.register(subprocess.run, ["hdiutil", "detach", "-force", device],
+                    capture_output=True)
+
+    volume = f"m2sim_ramdisk_{os.getpid()}"
+    erase = subprocess.run(
+        ["diskutil", "erasevolume", "HFS+", volume, device],
+        capture_output=True, text=True
+    )
+    if erase.returncode != 0:
+        print(f"Warning: RAM disk format failed, building on disk: {erase.stderr}")
+        return None
+    return f"/Volumes/{volume}"
+
+
+# Linked executables keyed by a hash of their source and SDK, kept across
+# runs so an unchanged template is never reassembled
+CACHE_DIR = Path(tempfile.gettempdir()) / "m2sim_calib_cache"
+
+
+def build(asm_source: str, out_dir: Path, name: str = "benchmark") -> Path:
+    """Assemble and link asm_source inside out_dir, returning the executable path.
+
+    The result is copied from CACHE_DIR when the same source was linked
+    against the same SDK before.
+    """
+    asm_path = out_dir / f"{name}.s"
+    obj_path = out_dir / f"{name}.o"
+    exe_path = out_dir / name
+
+    # Encoded once: the same bytes feed the cache key and the .s file
+    asm_bytes = asm_source.encode("ascii")
+
+    sdk = sdk_path()
+    digest = hashlib.blake2b(sdk.encode())
+    digest.update(b"\n")
+    digest.update(asm_bytes)
+    key = digest.hexdigest()[:16]
+    cached = CACHE_DIR / key
+    if cached.exists():
+        shutil.copy2(cached, exe_path)
+        return exe_path
+
+    # Write assembly
+    asm_path.write_bytes(asm_bytes)
+
+    # Assemble
+    result = subprocess.run(
+        ["as", "-o", str(obj_path), str(asm_path)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Assembly failed: {result.stderr}")
+
+    # Link
+    result = subprocess.run(
+        ["ld", "-o", str(exe_path), str(obj_path),
+         "-lSystem", "-L", sdk + "/usr/lib",
+         "-syslibroot", sdk,
+         "-e", "_main", "-arch", "arm64"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Link failed: {result.stderr}")
+
+    # Copy then rename, so a parallel build never sees a partial file
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staging = CACHE_DIR / f"{key}.{os.getpid()}"
+    shutil.copy2(exe_path, staging)
+    os.replace(staging, cached)
+
+    return exe_path
+
+
+LAUNCHER_SOURCE = Path(__file__).parent / "launcher.c"
+
+
+@functools.lru_cache(maxsize=1)
+def launcher_path() -> Optional[Path]:
+    """Build launcher.c once per process, returning None where it is unavailable.
+
+    The launcher execs the benchmark at user-interactive QoS (P-core) with
+    ASLR disabled; see launcher.c.
+    """
+    if sys.platform != "darwin":
+        return None
+    out_dir = Path(tempfile.mkdtemp(prefix="m2sim_launcher_", dir=scratch_dir()))
+    atexit.register(shutil.rmtree, out_dir, ignore_errors=True)
+    exe_path = out_dir / "launcher"
+    result = subprocess.run(
+        ["clang", "-O2", "-o", str(exe_path), str(LAUNCHER_SOURCE)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(f"Warning: launcher build failed, running benchmarks unpinned: {result.stderr}")
+        return None
+    return exe_path
+
+
+@functools.lru_cache(maxsize=1)
+def runner() -> Runner:
+    """The Runner for every timed run: CPU-time samples, through the launcher where available."""
+    return Runner(launcher=launcher_path())
+
+
+# Exits immediately; its run time is the per-process harness overhead
+EMPTY_PROGRAM_ASM = """
+.global _main
+.align 4
+
+_main:
+    mov x0, #0
+    mov x16, #1
+    svc #0x80
+"""
+
+
+def measure_harness_overhead(out_dir: Path, samples: int = 50) -> float:
+    """Median CPU seconds of spawning, running and reaping an empty program.
+
+    This is the cost every data point pays regardless of instruction count
+    (exec, dyld, exit); fit_calibration subtracts it so the intercept is the
+    benchmark's own residual rather than mostly harness.
+    """
+    exe_path = build(EMPTY_PROGRAM_ASM, out_dir, name="empty_program")
+    return runner().harness_overhead(exe_path, samples)
+
+
+def runs_for(iterations: int, runs: int) -> int:
+    """Timed runs for one data point: one extra for the shortest counts."""
+    return runs + 1 if iterations <= SHORT_RUN_ITERATIONS else runs
+
+
+def time_executable(exe_path: Path, runs: int = 5, warmup: int = 1,
+                    args: Sequence[str] = ()) -> List[float]:
+    """Run a built benchmark multiple times, returning CPU times in seconds.
+
+    By default a single untimed probe run precedes the timed ones (see
+    Runner.time). On macOS each run goes through the launcher, pinning it
+    to a P-core with ASLR disabled.
+    """
+    return runner().time(exe_path, args, reps=runs, warmups=warmup).tolist()
+
+
+def time_in_process(exe_path: Path, runs: int = 5, warmup: int = 1,
+                    args: Sequence[str] = ()) -> List[float]:
+    """Time runs repetitions of a repeat-harness build in a single process.
+
+    One spawn replaces runs + warmup, so the samples exclude exec/dyld and
+    share the process's cache and frequency state. Each sample is wall time
+    from cntvct_el0 around one repetition; the first warmup repetitions are
+    dropped. args are the template's own (the iteration count).
+    """
+    if warmup + runs > REPEAT_MAX:
+        raise ValueError(f"{warmup + runs} repetitions exceed REPEAT_MAX ({REPEAT_MAX})")
+    return runner().time_in_process(exe_path, args, reps=runs, warmups=warmup).tolist()
+
+
+def collect_run_times(executables: Dict[str, Path], iteration_counts: Dict[str, List[int]],
+                      runs: int = 5, warmup: int = 1,
+                      workers: Optional[int] = None,
+                      in_process: bool = False) -> Dict[str, Dict[int, List[float]]]:
+    """Time every (template, iteration count) pair, interleaved and in parallel.
+
+    All runs of all pairs go into one shuffled work list, so slow drift
+    (thermal state, background load) is spread evenly over every data point
+    instead of landing on whichever template ran last. Up to workers runs
+    execute at once, one per P-core by default, and each sample is the
+    child's own CPU time. That trades accuracy for wall time: concurrent
+    runs still contend for the shared L2 and DRAM, which inflates the CPU
+    time of memory-bound and pointer-chase templates. Use --serial or
+    --workers 1 for reference numbers.
+
+    Warmup is global rather than per pair: one executable serves every
+    count of its template, so each is run warmup times at its smallest count
+    before timing starts and every timed sample is kept.
+
+    With in_process the executables must be repeat-harness builds
+    (build_all(..., repeat=True)); each pair is then one work unit whose
+    samples all come from a single process (see time_in_process). Those
+    samples are cntvct_el0 wall time, which concurrent runs would inflate
+    (shared L2, memory bandwidth, package power), so the pairs run one at a
+    time and workers is ignored.
+    Returns {template_name: {iterations: [seconds, ...]}}.
+    """
+    workers = workers or performance_core_count()
+    pairs = [(name, iterations)
+             for name in executables
+             for iterations in iteration_counts[name]]
+    samples = {name: {} for name in executables}
+
+    if in_process:
+        random.shuffle(pairs)
+        for name, iterations in pairs:
+            samples[name][iterations] = time_in_process(
+                executables[name], runs=runs_for(iterations, runs),
+                warmup=warmup, args=[str(iterations)])
+        return samples
+
+    for name, exe_path in executables.items():
         for _ in range(warmup):
-            subprocess.run([str(exe_path)], capture_output=True)
-        
-        # Timed runs
-        for _ in range(runs):
-            start = time.perf_counter()
-            subprocess.run([str(exe_path)], capture_output=True)
-            end = time.perf_counter()
-            times.append(end - start)
-    
-    return times
+            runner().run_once(exe_path, [str(min(iteration_counts[name]))])
+
+    times = runner().time_interleaved(
+        {pair: (executables[pair[0]], [str(pair[1])]) for pair in pairs},
+        {pair: runs_for(pair[1], runs) for pair in pairs},
+        warmups=0, workers=workers
+    )
+    for (name, iterations), seconds in times.items():
+        samples[name][iterations] = seconds.tolist()
+    return samples
+
+
+def build_and_run(asm_source: str, runs: int = 5, warmup: int = 1,
+                  args: Sequence[str] = ()) -> List[float]:
+    """Build assembly source and run multiple times, returning CPU times in seconds."""
+    with tempfile.TemporaryDirectory(dir=scratch_dir()) as tmpdir:
+        exe_path = build(asm_source, Path(tmpdir))
+        return time_executable(exe_path, runs=runs, warmup=warmup, args=args)
+
+
+def build_benchmark(template_name: str, out_dir: Path, unroll: Optional[int] = None) -> Path:
+    """Generate and build the argv-driven executable for one template into out_dir."""
+    name = template_name if unroll is None else f"{template_name}_u{unroll}"
+    return build(generate_benchmark(template_name, unroll=unroll), out_dir, name=name)
+
+
+def build_all(template_names: List[str], out_dir: Path,
+              max_workers: Optional[int] = None,
+              unroll: Optional[int] = None,
+              repeat: bool = False) -> Dict[str, Path]:
+    """Build every template's executable up front in parallel.
+
+    Assembling and linking is independent per template, so it is fanned out
+    across a process pool; only the timed runs need exclusive use of the CPU.
+    Returns {template_name: exe_path}.
+    """
+    # Render sources here so workers see this process's BENCHMARK_TEMPLATES
+    return build_sources({name: generate_benchmark(name, unroll=unroll, repeat=repeat)
+                          for name in template_names},
+                         out_dir, max_workers=max_workers)
+
+
+def build_sources(sources: Dict[str, str], out_dir: Path,
+                  max_workers: Optional[int] = None) -> Dict[str, Path]:
+    """Build {name: asm_source} in parallel into out_dir. Returns {name: exe_path}."""
+    names = list(sources)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        exe_paths = pool.map(build, [sources[n] for n in names], [out_dir] * len(names), names)
+        return dict(zip(names, exe_paths))
 
 
 @dataclass
@@ -877,98 +1367,106 @@ class CalibrationResult:
     instruction_latency_ns: float  # nanoseconds per instruction
     overhead_ms: float             # process startup overhead in milliseconds
     r_squared: float               # goodness of fit
-    data_points: List[Tuple[int, float]]  # (instruction_count, avg_time_ms)
-
-
-def simple_linear_regression(x: List[float], y: List[float]) -> Tuple[float, float, float]:
-    """Simple linear regression without scipy. Returns (slope, intercept, r_squared)."""
-    n = len(x)
-    sum_x = sum(x)
-    sum_y = sum(y)
-    sum_xy = sum(xi * yi for xi, yi in zip(x, y))
-    sum_x2 = sum(xi * xi for xi in x)
-    sum_y2 = sum(yi * yi for yi in y)
-    
-    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-    intercept = (sum_y - slope * sum_x) / n
-    
-    # R-squared
-    ss_tot = sum((yi - sum_y/n)**2 for yi in y)
-    ss_res = sum((yi - (slope * xi + intercept))**2 for xi, yi in zip(x, y))
-    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-    
-    return slope, intercept, r_squared
-
-
-def trimmed_mean(values: List[float], trim_percent: float = 0.2) -> float:
-    """Calculate trimmed mean, removing top and bottom trim_percent of values."""
-    if len(values) < 3:
-        return sum(values) / len(values)
-    
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    trim_count = int(n * trim_percent)
-    
-    if trim_count == 0:
-        return sum(sorted_vals) / n
-    
-    trimmed = sorted_vals[trim_count:-trim_count]
-    return sum(trimmed) / len(trimmed) if trimmed else sum(sorted_vals) / n
+    data_points: List[Tuple[int, float]]  # (instruction_count, min_time_ms)
+    loop_overhead_ns: float = 0.0  # baseline loop cost subtracted from the latency
 
 
 def calibrate_benchmark(template_name: str, iteration_counts: List[int], 
-                        runs_per_count: int = 15, verbose: bool = True) -> CalibrationResult:
-    """Run calibration for a single benchmark type.
+                        runs_per_count: int = 5, verbose: bool = True,
+                        executable: Optional[Path] = None,
+                        unroll: Optional[int] = None,
+                        baseline_ns_per_iter: Optional[float] = None,
+                        harness_overhead_s: float = 0.0) -> CalibrationResult:
+    """Run calibration for a single benchmark type, one data point at a time.
     
-    Uses warmup runs and trimmed mean to reduce variance.
+    Uses a probe run and the minimum of the timed runs per data point. The template is
+    built once and each iteration count is passed on the command line; pass
+    a prebuilt executable (see build_all) to skip the build step. unroll must
+    match the one the executable was built with. See fit_calibration for
+    baseline_ns_per_iter and harness_overhead_s.
+    """
+    if executable is None:
+        with tempfile.TemporaryDirectory(dir=scratch_dir()) as tmpdir:
+            exe_path = build_benchmark(template_name, Path(tmpdir), unroll=unroll)
+            return calibrate_benchmark(template_name, iteration_counts,
+                                       runs_per_count=runs_per_count,
+                                       verbose=verbose, executable=exe_path,
+                                       unroll=unroll,
+                                       baseline_ns_per_iter=baseline_ns_per_iter,
+                                       harness_overhead_s=harness_overhead_s)
+
+    instr_per_iter = instructions_per_iter(template_name, unroll) or 1
+    if verbose:
+        print(f"\nMeasuring {template_name}...", flush=True)
+
+    run_times = {}
+    # Random order, so thermal drift over the run does not line up with
+    # instruction count and get fitted as part of the slope
+    for iterations in random.sample(iteration_counts, len(iteration_counts)):
+        run_times[iterations] = time_executable(executable,
+                                                runs=runs_for(iterations, runs_per_count),
+                                                args=[str(iterations)])
+
+        if iterations * instr_per_iter > COOLDOWN_INSTRUCTIONS:
+            time.sleep(COOLDOWN_SECONDS)
+
+    return fit_calibration(template_name, run_times, unroll=unroll,
+                           baseline_ns_per_iter=baseline_ns_per_iter,
+                           harness_overhead_s=harness_overhead_s, verbose=verbose)
+
+
+def fit_calibration(template_name: str, run_times: Dict[int, List[float]],
+                    unroll: Optional[int] = None,
+                    baseline_ns_per_iter: Optional[float] = None,
+                    harness_overhead_s: float = 0.0,
+                    verbose: bool = True) -> CalibrationResult:
+    """Fit the regression for one template from {iterations: CPU seconds per run}.
+
+    baseline_ns_per_iter is the loop-control cost measured by the "baseline"
+    template; it is spread over the template's instructions and subtracted
+    from the fitted latency. The baseline template itself has no target
+    instructions, so its fit is per loop iteration instead.
+
+    harness_overhead_s (see measure_harness_overhead) is subtracted from
+    every data point before the fit; it only moves the intercept.
     """
     tmpl = BENCHMARK_TEMPLATES[template_name]
-    instr_per_iter = tmpl["instructions_per_iter"]
+    instr_per_iter = instructions_per_iter(template_name, unroll) or 1
     
     if verbose:
         print(f"\n{'='*60}")
-        print(f"Calibrating: {template_name}")
+        print(f"Calibrating: {template_name}"
+              + (f" (unroll={unroll})" if unroll is not None else ""))
         print(f"Description: {tmpl['description']}")
         print(f"{'='*60}")
     
     data_points = []
-    instruction_counts = []
-    times_ms = []
     
-    for iterations in iteration_counts:
+    for iterations in sorted(run_times):
         total_instructions = iterations * instr_per_iter
-        if verbose:
-            print(f"  {iterations:>10,} iterations ({total_instructions:>12,} instructions)... ", end="", flush=True)
         
-        asm_source = generate_benchmark(template_name, iterations)
-        run_times = build_and_run(asm_source, runs=runs_per_count, warmup=3)
-        
-        # Use trimmed mean to reduce impact of outliers
-        run_times_ms = [t * 1000 for t in run_times]
-        avg_time_ms = trimmed_mean(run_times_ms, 0.2)
-        
-        # Calculate std of trimmed values for reporting
-        sorted_times = sorted(run_times_ms)
-        trim_count = int(len(sorted_times) * 0.2)
-        trimmed = sorted_times[trim_count:-trim_count] if trim_count > 0 else sorted_times
-        std_time_ms = (sum((t - avg_time_ms)**2 for t in trimmed) / len(trimmed)) ** 0.5 if trimmed else 0
+        # Noise only ever adds time, so the fastest run is the best estimate
+        run_times_ms = np.asarray(run_times[iterations], dtype=float) * 1000
+        min_time_ms = float(run_times_ms.min()) - harness_overhead_s * 1000
         
         if verbose:
-            print(f"{avg_time_ms:7.2f} ms (±{std_time_ms:.2f})")
+            # Std of the runs that pass the MAD outlier filter, for reporting only
+            std_time_ms = float(np.std(mad_filter(run_times_ms)))
+            print(f"  {iterations:>10,} iterations ({total_instructions:>12,} instructions)... "
+                  f"{min_time_ms:7.2f} ms (±{std_time_ms:.2f})")
         
-        data_points.append((total_instructions, avg_time_ms))
-        instruction_counts.append(total_instructions)
-        times_ms.append(avg_time_ms)
+        data_points.append((total_instructions, min_time_ms))
     
     # Linear regression: time_ms = slope * instructions + intercept
-    if HAS_SCIPY:
-        slope, intercept, r_value, p_value, std_err = stats.linregress(instruction_counts, times_ms)
-        r_squared = r_value ** 2
-    else:
-        slope, intercept, r_squared = simple_linear_regression(instruction_counts, times_ms)
+    slope, intercept, r_squared = Runner.regress(data_points)
     
     # Convert slope from ms/instruction to ns/instruction
     latency_ns = slope * 1e6
+
+    loop_overhead_ns = 0.0
+    if baseline_ns_per_iter is not None:
+        loop_overhead_ns = baseline_ns_per_iter / instr_per_iter
+        latency_ns -= loop_overhead_ns
     
     return CalibrationResult(
         benchmark=template_name,
@@ -976,7 +1474,118 @@ def calibrate_benchmark(template_name: str, iteration_counts: List[int],
         instruction_latency_ns=latency_ns,
         overhead_ms=intercept,
         r_squared=r_squared,
-        data_points=data_points
+        data_points=data_points,
+        loop_overhead_ns=loop_overhead_ns
+    )
+
+
+def unroll_sweep(template_name: str, iteration_counts: List[int],
+                 unrolls: Sequence[int] = UNROLL_SWEEP,
+                 runs_per_count: int = 5,
+                 max_workers: Optional[int] = None) -> Dict:
+    """Calibrate one unrolled template at several unroll factors.
+
+    The loop bookkeeping is paid once per iteration, so the fitted per-instruction
+    latency behaves like asymptote + overhead / unroll. Regressing latency
+    against 1/unroll gives the asymptote (intercept) - the true latency of the
+    target instruction with the loop cost removed.
+    """
+    points = []
+    with tempfile.TemporaryDirectory(dir=scratch_dir()) as tmpdir:
+        executables = build_sources(
+            {f"{template_name}_u{u}": generate_benchmark(template_name, unroll=u)
+             for u in unrolls},
+            Path(tmpdir), max_workers=max_workers)
+        for unroll in unrolls:
+            result = calibrate_benchmark(
+                template_name,
+                scale_iteration_counts(template_name, iteration_counts, unroll),
+                runs_per_count=runs_per_count,
+                executable=executables[f"{template_name}_u{unroll}"],
+                unroll=unroll,
+            )
+            points.append({"unroll": unroll,
+                           "instruction_latency_ns": result.instruction_latency_ns,
+                           "r_squared": result.r_squared})
+
+    loop_cost, asymptote, r_squared = linear_regression(
+        [1 / p["unroll"] for p in points],
+        [p["instruction_latency_ns"] for p in points])
+    return {
+        "benchmark": template_name,
+        "points": points,
+        "asymptotic_latency_ns": asymptote,
+        "loop_overhead_ns": loop_cost,
+        "r_squared": r_squared,
+    }
+
+
+def pointer_chase_sweep(sizes_kb: Sequence[int] = CHASE_SWEEP_KB,
+                        runs_per_count: int = 5,
+                        baseline_ns_per_iter: Optional[float] = None,
+                        max_workers: Optional[int] = None) -> List[Dict]:
+    """Calibrate sequential and random pointer chases at each buffer size.
+
+    Returns one row per size with the ns/hop of both walks; the random column
+    steps up at each cache boundary while the sequential one stays flat
+    until the prefetcher can no longer keep up.
+    """
+    orders = {"sequential": False, "random": True}
+    names = {}
+    for kb in sizes_kb:
+        for order, shuffle in orders.items():
+            name = f"pointerchase_{order}_{kb}kb"
+            BENCHMARK_TEMPLATES[name] = pointerchase_template(kb, shuffle=shuffle)
+            names[kb, order] = name
+
+    rows = []
+    with tempfile.TemporaryDirectory(dir=scratch_dir()) as tmpdir:
+        executables = build_all(list(names.values()), Path(tmpdir), max_workers=max_workers)
+        for kb in sizes_kb:
+            row = {"buffer_kb": kb}
+            for order in orders:
+                name = names[kb, order]
+                hops_per_iter = BENCHMARK_TEMPLATES[name]["instructions_per_iter"]
+                result = calibrate_benchmark(
+                    name,
+                    [hops // hops_per_iter for hops in CHASE_HOP_COUNTS],
+                    runs_per_count=runs_per_count,
+                    executable=executables[name],
+                    baseline_ns_per_iter=baseline_ns_per_iter,
+                )
+                row[f"{order}_ns_per_hop"] = result.instruction_latency_ns
+                row[f"{order}_r_squared"] = result.r_squared
+            rows.append(row)
+    return rows
+
+
+def result_to_dict(r: CalibrationResult) -> Dict:
+    """Serialize a CalibrationResult as written to the results JSON."""
+    return {
+        "benchmark": r.benchmark,
+        "description": r.description,
+        "calibrated": True,
+        "instruction_latency_ns": r.instruction_latency_ns,
+        "overhead_ms": r.overhead_ms,
+        "r_squared": r.r_squared,
+        "loop_overhead_ns": r.loop_overhead_ns,
+        "data_points": [[d[0], d[1]] for d in r.data_points]
+    }
+
+
+def result_from_dict(d: Dict) -> CalibrationResult:
+    """Inverse of result_to_dict, used to resume from a partial run."""
+    return CalibrationResult(
+        benchmark=d["benchmark"],
+        description=d["description"],
+        instruction_latency_ns=d["instruction_latency_ns"],
+        overhead_ms=d["overhead_ms"],
+        r_squared=d["r_squared"],
+        # Partial runs written before data_point_fields stored each point
+        # as an {"instructions", "time_ms"} object
+        data_points=[(p["instructions"], p["time_ms"]) if isinstance(p, dict) else tuple(p)
+                     for p in d["data_points"]],
+        loop_overhead_ns=d.get("loop_overhead_ns", 0.0),
     )
 
 
@@ -1015,11 +1624,40 @@ def main():
     parser = argparse.ArgumentParser(description="M2Sim Linear Regression Calibration Tool")
     parser.add_argument("--benchmarks", nargs="*", default=None,
                         help="Specific benchmarks to calibrate (default: all)")
-    parser.add_argument("--runs", type=int, default=15,
-                        help="Runs per data point (default: 15)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Runs per data point (default: 5)")
     parser.add_argument("--output", type=str, default=None,
                         help="Output JSON path (default: calibration_results.json)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Parallel build workers (default: CPU count)")
+    parser.add_argument("--n-elements", type=int, default=None,
+                        help="Array length for vectorsum/vectoradd (default: 16)")
+    parser.add_argument("--unroll", type=int, default=None,
+                        help=f"Copies of the unit body for unrolled templates (default: {DEFAULT_UNROLL})")
+    parser.add_argument("--unroll-sweep", action="store_true",
+                        help=f"Also sweep unroll over {list(UNROLL_SWEEP)} and report the latency asymptote")
+    parser.add_argument("--chase-sweep", action="store_true",
+                        help=f"Also run pointer chases over {list(CHASE_SWEEP_KB)} KB buffers")
+    parser.add_argument("--serial", action="store_true",
+                        help="Time one benchmark and data point at a time, as before interleaving")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Repeat each data point inside one process and time it with "
+                             "cntvct_el0 instead of one spawn per run (not with --serial)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Concurrent timed runs when not --serial or --in-process; "
+                             "use 1 for reference numbers (default: P-core count)")
+    parser.add_argument("--cpu-warmup-seconds", type=float, default=CPU_WARMUP_SECONDS,
+                        help="Seconds of back-to-back warm-up runs before timing, 0 to skip "
+                             f"(default: {CPU_WARMUP_SECONDS})")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Seed for the randomized benchmark and run order (default: 42)")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the output JSON (default: compact)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip benchmarks already recorded in the partial .jsonl from an interrupted run")
     args = parser.parse_args()
+    if args.in_process and args.serial:
+        parser.error("--in-process times the interleaved path only; drop --serial")
 
     print("="*70)
     print("M2Sim Linear Regression Calibration Tool")
@@ -1031,14 +1669,12 @@ def main():
     # At ~3.5B instr/sec, need >70M instructions to get >20ms instruction time
     # Using: 1M, 2M, 4M, 8M, 16M, 32M iterations
     # With 20 instructions/iter, this gives 20M to 640M total instructions
-    iteration_counts = [
-        1_000_000,
-        2_000_000,
-        4_000_000,
-        8_000_000,
-        16_000_000,
-        32_000_000,
-    ]
+    iteration_counts = list(ITERATION_COUNTS)
+
+    if args.n_elements:
+        BENCHMARK_TEMPLATES["vectorsum"] = vectorsum_template(args.n_elements)
+        BENCHMARK_TEMPLATES["vectoradd"] = vectoradd_template(args.n_elements)
+        generate_benchmark.cache_clear()
 
     # Select which benchmarks to run
     benchmark_names = args.benchmarks if args.benchmarks else list(BENCHMARK_TEMPLATES.keys())
@@ -1048,39 +1684,149 @@ def main():
             print(f"Available: {', '.join(BENCHMARK_TEMPLATES.keys())}")
             sys.exit(1)
 
+    # Shuffle so no template is systematically measured on a hotter chip;
+    # the baseline still runs first so its loop cost can be subtracted
+    random.seed(args.seed)
+    benchmark_names = [n for n in benchmark_names if n != "baseline"]
+    random.shuffle(benchmark_names)
+    benchmark_names = ["baseline"] + benchmark_names
+
+    output_path = Path(args.output) if args.output else Path(__file__).parent / "calibration_results.json"
+
+    # Each result is appended to a .jsonl as soon as it is measured, so an
+    # interrupted run loses at most one benchmark and can be resumed
+    partial_path = output_path.with_suffix(".jsonl")
+    completed = {}
+    if args.resume and partial_path.exists():
+        for line in partial_path.read_text().splitlines():
+            if line.strip():
+                r = result_from_dict(json.loads(line))
+                completed[r.benchmark] = r
+        print(f"Resuming: {len(completed)} benchmark(s) already in {partial_path}")
+    partial = partial_path.open("a" if args.resume else "w")
+
     results = []
 
-    for template_name in benchmark_names:
-        result = calibrate_benchmark(
-            template_name,
-            iteration_counts,
-            runs_per_count=args.runs,
-            verbose=True
-        )
-        results.append(result)
+    # Build every template in parallel first, then time them
+    build_dir = Path(tempfile.mkdtemp(prefix="m2sim_calibration_", dir=scratch_dir()))
+    try:
+        pending = [n for n in benchmark_names if n not in completed]
+        print(f"\nBuilding {len(pending)} executables "
+              f"(jobs={args.jobs or os.cpu_count()})...")
+        executables = build_all(pending, build_dir, max_workers=args.jobs,
+                                unroll=args.unroll, repeat=args.in_process)
+
+        counts = {name: scale_iteration_counts(name, iteration_counts, args.unroll)
+                  for name in pending}
+
+        if pending and args.cpu_warmup_seconds > 0:
+            # Shortest data point of the first pending template; repeat
+            # builds also need a repetition count
+            warm_name = pending[0]
+            warm_args = [str(min(counts[warm_name]))] + (["1"] if args.in_process else [])
+            print(f"Warming up for {args.cpu_warmup_seconds:g} s...", flush=True)
+            runner().warm_up(args.cpu_warmup_seconds, executables[warm_name], warm_args)
+
+        # In-process samples never include process startup
+        harness_overhead_s = 0.0
+        if not args.in_process:
+            harness_overhead_s = measure_harness_overhead(build_dir)
+            print(f"Harness overhead: {harness_overhead_s*1000:.3f} ms per run (subtracted)")
+
+        run_times = {}
+        if not args.serial:
+            # In-process samples are wall time, so they are never concurrent
+            workers = 1 if args.in_process else args.workers or performance_core_count()
+            print(f"Timing {len(pending)} benchmarks interleaved across {workers} workers...")
+            run_times = collect_run_times(executables, counts, runs=args.runs,
+                                          workers=workers, in_process=args.in_process)
+
+        baseline_ns_per_iter = None
+        for template_name in benchmark_names:
+            if template_name in completed:
+                result = completed[template_name]
+            elif template_name in run_times:
+                result = fit_calibration(template_name, run_times[template_name],
+                                         unroll=args.unroll,
+                                         baseline_ns_per_iter=baseline_ns_per_iter,
+                                         harness_overhead_s=harness_overhead_s)
+            else:
+                result = calibrate_benchmark(
+                    template_name,
+                    counts[template_name],
+                    runs_per_count=args.runs,
+                    verbose=True,
+                    executable=executables[template_name],
+                    unroll=args.unroll,
+                    baseline_ns_per_iter=baseline_ns_per_iter,
+                    harness_overhead_s=harness_overhead_s
+                )
+            if template_name not in completed:
+                partial.write(json.dumps(result_to_dict(result)) + "\n")
+                partial.flush()
+            # The baseline's latency is ns per loop iteration, not per
+            # instruction; it is kept in the .jsonl for --resume but reported
+            # only as loop_baseline_ns_per_iter, never as a benchmark result
+            if template_name == "baseline":
+                baseline_ns_per_iter = result.instruction_latency_ns
+            else:
+                results.append(result)
+    finally:
+        partial.close()
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    sweeps = []
+    if args.unroll_sweep:
+        for template_name in benchmark_names:
+            if "unit" in BENCHMARK_TEMPLATES[template_name]:
+                sweeps.append(unroll_sweep(template_name, iteration_counts,
+                                           runs_per_count=args.runs,
+                                           max_workers=args.jobs))
+
+    chase_rows = []
+    if args.chase_sweep:
+        chase_rows = pointer_chase_sweep(runs_per_count=args.runs,
+                                         baseline_ns_per_iter=baseline_ns_per_iter,
+                                         max_workers=args.jobs)
 
     print_results(results)
 
+    if chase_rows:
+        print(f"\n{'Buffer':>10} {'Sequential (ns/hop)':>20} {'Random (ns/hop)':>16}")
+        for row in chase_rows:
+            print(f"{row['buffer_kb']:>8}KB {row['sequential_ns_per_hop']:>20.3f} "
+                  f"{row['random_ns_per_hop']:>16.3f}")
+
+    for sweep in sweeps:
+        print(f"\n{sweep['benchmark']} unroll sweep:")
+        for p in sweep["points"]:
+            print(f"  unroll={p['unroll']:<4} {p['instruction_latency_ns']:.4f} ns/instr")
+        print(f"  Asymptote: {sweep['asymptotic_latency_ns']:.4f} ns/instr "
+              f"({sweep['asymptotic_latency_ns'] * 3.5:.2f} CPI at 3.5 GHz)")
+
     # Save results to JSON
     output = {
         "methodology": "linear_regression",
         "formula": "time_ms = latency_ns * instruction_count / 1e6 + overhead_ms",
-        "results": [
-            {
-                "benchmark": r.benchmark,
-                "description": r.description,
-                "calibrated": True,
-                "instruction_latency_ns": r.instruction_latency_ns,
-                "overhead_ms": r.overhead_ms,
-                "r_squared": r.r_squared,
-                "data_points": [{"instructions": d[0], "time_ms": d[1]} for d in r.data_points]
-            }
-            for r in results
-        ]
+        "data_point_fields": ["instructions", "time_ms"],
+        "harness_overhead_ms": harness_overhead_s * 1000,
+        "loop_baseline_ns_per_iter": baseline_ns_per_iter,
+        "results": [result_to_dict(r) for r in results]
     }
-
-    output_path = Path(args.output) if args.output else Path(__file__).parent / "calibration_results.json"
-    output_path.write_text(json.dumps(output, indent=2))
+    if sweeps:
+        output["unroll_sweeps"] = sweeps
+    if chase_rows:
+        output["pointer_chase_sweep"] = chase_rows
+
+    # Compact unless asked: the file is read by scripts, and indenting goes
+    # through the stdlib encoder's slow pure-Python path
+    if HAS_ORJSON:
+        output_path.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2 if args.pretty else 0))
+    elif args.pretty:
+        output_path.write_text(json.dumps(output, indent=2))
+    else:
+        output_path.write_text(json.dumps(output, separators=(",", ":")))
+    partial_path.unlink()
     print(f"\nResults saved to: {output_path}")
 
 
@@ -5,80 +5,133 @@ Uses the long-running benchmarks (10M iterations) with linear regression calibra
 
 Run this on Apple Silicon hardware after building the benchmarks:
   cd benchmarks/native
-  make long
+  make long tools
   python3 measure_memory_benchmarks.py
 """
 
 import json
+import os
 import statistics
 import subprocess
-import time
+import sys
 from pathlib import Path
 
+from bench_harness import Runner, mad_filter
+
 # Memory benchmark configurations
 # Each long benchmark does 10M iterations with 5 store/load pairs per iteration
-# = 10 memory instructions per iteration
+# = 10 memory instructions per iteration. All three kernels live in
+# memory_combined_long, selected by argv[1], so they share one binary image.
 BENCHMARKS = {
     "memory_sequential": {
         "description": "5 sequential store/load pairs per iteration (10M iterations)",
         "instructions_per_iteration": 10,
-        "executable": "./memory_sequential_long",
-        "expected_exit_code": 128,
+        "executable": ("./memory_combined_long", "0"),
     },
     "memory_strided": {
         "description": "5 strided store/load pairs per iteration, stride=32B (10M iterations)",
         "instructions_per_iteration": 10,
-        "executable": "./memory_strided_long",
-        "expected_exit_code": 128,
+        "executable": ("./memory_combined_long", "1"),
     },
     "memory_random": {
         "description": "5 scattered store/load pairs per iteration (10M iterations)",
         "instructions_per_iteration": 10,
-        "executable": "./memory_random_long",
-        "expected_exit_code": 128,
+        "executable": ("./memory_combined_long", "2"),
     },
 }
 
 ITERATIONS = 10_000_000
+# 50M increments mod 256, the same for every kernel
+EXPECTED_EXIT_CODE = 128
+# Nominal M2 P-core clock; CPI is reported at this frequency
 FREQUENCY_GHZ = 3.5
 
+# Exits immediately (empty_program.s); its run time is the harness overhead
+HARNESS_EXECUTABLE = "./empty_program"
+HARNESS_SAMPLES = 50
+
+# Default --cpu-warmup-seconds: back-to-back kernel runs before any timing,
+# so the first kernel measured is not caught in the frequency ramp
+CPU_WARMUP_SECONDS = 2.0
+
+# Execs the benchmark at user-interactive QoS, which macOS schedules on the
+# P-cores, so a run cannot migrate to a slower E-core (launcher.c)
+LAUNCHER = "./launcher"
+
+
+def make_runner():
+    """Runner for wall-clock samples, through the launcher if it has been built."""
+    launcher = Path(LAUNCHER) if Path(LAUNCHER).exists() else None
+    return Runner(launcher=launcher, clock="wall", expected_exit_code=EXPECTED_EXIT_CODE)
+
+
+def pin_to_single_cpu():
+    """On Linux, restrict this process (and so every child) to one CPU.
+
+    macOS has no affinity API; the launcher's QoS class serves that role.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})
+
+
+def cpu_frequency_ghz():
+    """CPU clock reported by sysctl in GHz, or None where it is not exposed.
 
-def run_benchmark(executable, expected_exit_code, runs=15, warmup=3):
-    """Run benchmark multiple times and return execution times in seconds."""
-    times = []
+    Apple silicon does not publish hw.cpufrequency*, so on an M2 this is
+    None and results are reported at the nominal FREQUENCY_GHZ.
+    """
+    if sys.platform != "darwin":
+        return None
+    for key in ("hw.cpufrequency_max", "hw.cpufrequency"):
+        result = subprocess.run(["sysctl", "-n", key], capture_output=True, text=True)
+        if result.returncode == 0 and result.stdout.strip():
+            return int(result.stdout) / 1e9
+    return None
 
-    for _ in range(warmup):
-        subprocess.run([executable], capture_output=True)
 
-    for _ in range(runs):
-        start = time.perf_counter()
-        result = subprocess.run([executable], capture_output=True)
-        end = time.perf_counter()
+def measure_harness_overhead(runner, samples=HARNESS_SAMPLES):
+    """Median time to spawn and reap a program that exits immediately.
 
-        if result.returncode != expected_exit_code:
-            raise RuntimeError(
-                f"{executable} exited with {result.returncode}, expected {expected_exit_code}"
-            )
+    Returns 0.0 (no correction) if empty_program has not been built.
+    """
+    if not Path(HARNESS_EXECUTABLE).exists():
+        print(f"Warning: {HARNESS_EXECUTABLE} not found (run 'make long'); "
+              "harness overhead not subtracted")
+        return 0.0
+    return runner.harness_overhead(Path(HARNESS_EXECUTABLE), samples)
 
-        times.append(end - start)
 
-    return times
+def collect_times(runner, benchmarks, runs=15):
+    """Run every benchmark `runs` times, interleaved, returning {name: [seconds]}.
 
+    One untimed probe per kernel absorbs the cold start, and the timed runs
+    are shuffled across kernels so drift in frequency or temperature is
+    spread over all of them rather than landing on whichever runs last
+    (see Runner.time_interleaved).
+    """
+    jobs = {}
+    for name, config in benchmarks.items():
+        exe, *args = config["executable"]
+        jobs[name] = (Path(exe), args)
+    times = runner.time_interleaved(jobs, {name: runs for name in benchmarks})
+    return {name: t.tolist() for name, t in times.items()}
 
-def measure_benchmark(name, config):
-    """Measure a single benchmark and return timing data."""
+
+def measure_benchmark(name, config, times, harness_s=0.0, measured_ghz=None):
+    """Summarize the run times collected for one benchmark.
+
+    harness_s (see measure_harness_overhead) is subtracted from the mean so
+    the latency reflects only the benchmark's own instructions. If the
+    clock could be read (measured_ghz), CPI at that frequency is added.
+    """
     print(f"\nMeasuring: {name}")
     print(f"  {config['description']}")
 
-    times = run_benchmark(config["executable"], config["expected_exit_code"])
-
-    # 20% trimmed mean (remove 10% from each end)
-    times_sorted = sorted(times)
-    trim = int(len(times_sorted) * 0.1)
-    trimmed = times_sorted[trim:-trim] if trim > 0 else times_sorted
+    # Mean of the runs that survive the MAD outlier filter
+    kept = mad_filter(times)
 
-    mean_s = statistics.mean(trimmed)
-    std_s = statistics.stdev(trimmed) if len(trimmed) > 1 else 0
+    mean_s = statistics.mean(kept) - harness_s
+    std_s = statistics.stdev(kept) if len(kept) > 1 else 0
 
     # Per-instruction latency: total_time / (iterations * instructions_per_iteration)
     total_instructions = ITERATIONS * config["instructions_per_iteration"]
@@ -91,7 +144,7 @@ def measure_benchmark(name, config):
     print(f"  CPI @ {FREQUENCY_GHZ} GHz: {cpi:.3f}")
     print(f"  IPC @ {FREQUENCY_GHZ} GHz: {ipc:.2f}")
 
-    return {
+    result = {
         "name": name,
         "description": config["description"],
         "instructions_per_iteration": config["instructions_per_iteration"],
@@ -99,18 +152,54 @@ def measure_benchmark(name, config):
         "cpi_at_3_5_ghz": cpi,
         "ipc_at_3_5_ghz": ipc,
         "r_squared": 0.999,
-        "notes": f"Measured via 10M-iteration long benchmark, {len(trimmed)} runs after trimming",
+        "notes": f"Measured via 10M-iteration long benchmark, {len(kept)} of {len(times)} runs after MAD filter",
     }
+    if measured_ghz is not None:
+        result["cpi_at_measured_frequency"] = latency_ns * measured_ghz
+    return result
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="M2 hardware memory benchmark calibration")
+    parser.add_argument("--cpu-warmup-seconds", type=float, default=CPU_WARMUP_SECONDS,
+                        help="Seconds of back-to-back warm-up runs before timing, 0 to skip "
+                             f"(default: {CPU_WARMUP_SECONDS})")
+    args = parser.parse_args()
+
     print("M2 Hardware Memory Benchmark Calibration")
     print("=" * 60)
 
+    pin_to_single_cpu()
+    if not Path(LAUNCHER).exists() and sys.platform == "darwin":
+        print(f"Warning: {LAUNCHER} not found (run 'make tools'); runs may migrate to E-cores")
+
+    measured_ghz = cpu_frequency_ghz()
+    if measured_ghz is not None:
+        print(f"CPU frequency: {measured_ghz:.2f} GHz (sysctl)")
+
+    runner = make_runner()
+    exe, *exe_args = next(iter(BENCHMARKS.values()))["executable"]
+    if args.cpu_warmup_seconds > 0 and Path(exe).exists():
+        print(f"Warming up for {args.cpu_warmup_seconds:g} s...", flush=True)
+        runner.warm_up(args.cpu_warmup_seconds, Path(exe), exe_args)
+
+    harness_s = measure_harness_overhead(runner)
+    print(f"Harness overhead: {harness_s*1000:.2f} ms per run (subtracted)")
+
+    try:
+        times = collect_times(runner, BENCHMARKS)
+    except Exception as e:
+        print(f"Error running benchmarks: {e}")
+        times = {}
+
     results = []
     for name, config in BENCHMARKS.items():
+        if name not in times:
+            continue
         try:
-            result = measure_benchmark(name, config)
+            result = measure_benchmark(name, config, times[name], harness_s, measured_ghz)
             results.append(result)
         except Exception as e:
             print(f"Error measuring {name}: {e}")
@@ -134,7 +223,10 @@ def main():
                     "version": "1.0",
                     "date": "2026-02-09",
                     "hardware": "Apple M2 (P-core @ 3.5 GHz)",
-                    "methodology": "10M-iteration timing with 20% trimmed mean",
+                    "methodology": "10M-iteration timing with MAD-filtered mean, harness overhead subtracted",
+                    "harness_overhead_ms": harness_s * 1000,
+                    "frequency_ghz": measured_ghz if measured_ghz is not None else FREQUENCY_GHZ,
+                    "frequency_source": "sysctl" if measured_ghz is not None else "nominal",
                     "benchmarks_measured": len(results),
                 },
                 "baselines": results,
@@ -6,10 +6,10 @@ These are fixed-size benchmarks (not parameterized like the calibration template
 
 import json
 import statistics
-import subprocess
-import time
 from pathlib import Path
 
+from bench_harness import run_timed
+
 # Benchmark configurations
 BENCHMARKS = {
     "memory_strided": {
@@ -38,30 +38,6 @@ BENCHMARKS = {
     }
 }
 
-def run_benchmark(executable: str, expected_exit_code: int, runs: int = 15, warmup: int = 3) -> list:
-    """Run benchmark multiple times and return execution times in seconds."""
-    times = []
-
-    # Warmup runs (discarded)
-    for _ in range(warmup):
-        start = time.perf_counter()
-        result = subprocess.run([executable], capture_output=True)
-        end = time.perf_counter()
-        # Don't check exit code during warmup
-
-    # Actual measurement runs
-    for _ in range(runs):
-        start = time.perf_counter()
-        result = subprocess.run([executable], capture_output=True)
-        end = time.perf_counter()
-
-        if result.returncode != expected_exit_code:
-            raise Exception(f"Benchmark {executable} failed with exit code {result.returncode}, expected {expected_exit_code}")
-
-        times.append(end - start)
-
-    return times
-
 def measure_benchmark(name: str, config: dict) -> dict:
     """Measure a single benchmark and return timing data."""
     print(f"\n{'='*60}")
@@ -69,7 +45,7 @@ def measure_benchmark(name: str, config: dict) -> dict:
     print(f"Description: {config['description']}")
     print(f"{'='*60}")
 
-    times = run_benchmark(config["executable"], config["expected_exit_code"])
+    times = run_timed(config["executable"], expected_exit_code=config["expected_exit_code"])
 
     # Remove outliers (20% trimmed mean)
     times_sorted = sorted(times)
@@ -79,10 +55,10 @@ def measure_benchmark(name: str, config: dict) -> dict:
     else:
         trimmed_times = times_sorted
 
-    # Calculate statistics
-    mean_time_s = statistics.mean(trimmed_times)
+    # Calculate statistics; samples stay integer ns until here
+    mean_time_s = statistics.mean(trimmed_times) / 1e9
     mean_time_ms = mean_time_s * 1000
-    std_time_ms = statistics.stdev(trimmed_times) * 1000
+    std_time_ms = statistics.stdev(trimmed_times) / 1e6
 
     # Calculate per-instruction latency
     instructions = config["instructions_per_iteration"]
@@ -0,0 +1,142 @@
+// memory_combined_long.s - Sequential, strided and random memory kernels in one binary
+// 10M iterations of the selected kernel; argv[1] picks which one:
+//   0 = sequential (memory_sequential_long.s)
+//   1 = strided, stride = 32 bytes (memory_strided_long.s)
+//   2 = random / scattered offsets (memory_random_long.s)
+// A missing argument runs the sequential kernel.
+//
+// Purpose: measure_memory_benchmarks.py spawns this one executable for all
+// three kernels, so they share the same binary image, page cache state and
+// frequency/thermal conditions instead of each paying its own cold start.
+//
+// Each iteration: 5 store/load pairs (10 memory instructions), identical to
+// the standalone kernels. Exit code is 50M mod 256 = 128 for every kernel.
+
+.global _main
+.align 4
+
+_main:
+    // Default selector 0 when no argument is given
+    mov x2, #0
+    cmp x0, #2
+    b.lt .dispatch
+    ldr x3, [x1, #8]         // argv[1]
+    ldrb w2, [x3]            // first character
+    sub w2, w2, #'0'
+
+.dispatch:
+    // Reserve a 4096-byte buffer, large enough for every kernel's offsets
+    sub sp, sp, #4096
+
+    // Initialize loop counter
+    mov x10, #0              // iteration counter
+    // Load 10000000 (0x989680) into x11
+    movz x11, #0x9680
+    movk x11, #0x0098, lsl #16
+
+    // Initialize value
+    mov x0, #0
+
+    cmp x2, #0
+    b.eq .seq
+    cmp x2, #1
+    b.eq .stride
+    b .random
+
+.align 4
+.seq:
+    // --- Timing region: Sequential memory operations ---
+    str x0, [sp]
+    ldr x1, [sp]
+    add x0, x1, #1
+
+    str x0, [sp, #8]
+    ldr x1, [sp, #8]
+    add x0, x1, #1
+
+    str x0, [sp, #16]
+    ldr x1, [sp, #16]
+    add x0, x1, #1
+
+    str x0, [sp, #24]
+    ldr x1, [sp, #24]
+    add x0, x1, #1
+
+    str x0, [sp, #32]
+    ldr x1, [sp, #32]
+    add x0, x1, #1
+    // --- End timing region ---
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .seq
+    b .done
+
+.align 4
+.stride:
+    // --- Timing region: Strided memory operations (stride = 4 * 8) ---
+    str x0, [sp]
+    ldr x1, [sp]
+    add x0, x1, #1
+
+    str x0, [sp, #32]
+    ldr x1, [sp, #32]
+    add x0, x1, #1
+
+    str x0, [sp, #64]
+    ldr x1, [sp, #64]
+    add x0, x1, #1
+
+    str x0, [sp, #96]
+    ldr x1, [sp, #96]
+    add x0, x1, #1
+
+    str x0, [sp, #128]
+    ldr x1, [sp, #128]
+    add x0, x1, #1
+    // --- End timing region ---
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .stride
+    b .done
+
+.align 4
+.random:
+    // --- Timing region: Random (scattered) memory operations ---
+    // Offsets 0, 2048, 512, 3072, 1536 land on different cache lines
+    str x0, [sp]
+    ldr x1, [sp]
+    add x0, x1, #1
+
+    str x0, [sp, #2048]
+    ldr x1, [sp, #2048]
+    add x0, x1, #1
+
+    str x0, [sp, #512]
+    ldr x1, [sp, #512]
+    add x0, x1, #1
+
+    str x0, [sp, #3072]
+    ldr x1, [sp, #3072]
+    add x0, x1, #1
+
+    str x0, [sp, #1536]
+    ldr x1, [sp, #1536]
+    add x0, x1, #1
+    // --- End timing region ---
+
+    add x10, x10, #1
+    cmp x10, x11
+    b.lt .random
+
+.done:
+    // Restore stack
+    add sp, sp, #4096
+
+    // x0 = 50M, exit code is 8-bit: 50000000 mod 256 = 128
+    and x0, x0, #0xFF
+
+    // Exit syscall
+    mov x16, #1
+    svc #0x80
@@ -7,12 +7,73 @@ It uses the hardware baseline data from polybench_calibration_results.json and e
 """
 
 import json
+import math
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+import numpy as np
+
+# orjson parses and pretty-prints several times faster than the stdlib
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def load_json(path: Path):
+    """Load a JSON file, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def null_non_finite(value):
+    """Replace inf and NaN with None, which is how orjson writes them.
+
+    The stdlib encoder would emit the non-standard Infinity and NaN tokens
+    instead, so both backends go through this to write the same JSON.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [null_non_finite(item) for item in value]
+    return value
+
+
+def dump_json(data, pretty=False) -> bytes:
+    """Serialize data as JSON bytes, compact unless pretty; uses orjson when available.
+
+    Non-finite numbers, such as the error for a zero latency, become null.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    data = null_non_finite(data)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def write_files(contents) -> None:
+    """Write {path: bytes} concurrently; the writes are independent I/O."""
+    with ThreadPoolExecutor(max_workers=len(contents) or 1) as pool:
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), contents.items()))
+
+
 def main():
     """Generate H5 PolyBench accuracy report."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="H5 PolyBench accuracy report")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the JSON results (default: compact)")
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
 
     print("=" * 60)
@@ -23,8 +84,7 @@ def main():
     polybench_path = script_dir / "polybench_calibration_results.json"
     print(f"\nLoading PolyBench calibration results from: {polybench_path}")
 
-    with open(polybench_path) as f:
-        calibration_data = json.load(f)
+    calibration_data = load_json(polybench_path)
 
     # Estimated simulator CPI values based on architectural analysis
     # Adjusted based on hardware baseline analysis - PolyBench benchmarks are much more complex
@@ -42,54 +102,62 @@ def main():
     # M2 frequency for latency conversion
     frequency_ghz = 3.5
 
-    # Calculate accuracy results
-    results = []
-    total_error = 0
-    calibrated_count = 0
-
     print("\n" + "=" * 60)
     print("POLYBENCH ACCURACY ANALYSIS")
     print("=" * 60)
-    print(f"{'Benchmark':<15} {'HW CPI':<10} {'Sim CPI':<10} {'HW ns/inst':<12} {'Sim ns/inst':<12} {'Error %':<10}")
-    print("-" * 80)
-
-    for benchmark_data in calibration_data["results"]:
-        bench_name = benchmark_data["benchmark"]
-        # Extract CPI from data_points array
-        data_points = benchmark_data.get("data_points", [])
-        if data_points:
-            hw_cpi = data_points[0].get("cpi", 0)
-        else:
-            hw_cpi = 0
-        hw_latency_ns = benchmark_data["instruction_latency_ns"]
-
-        if bench_name not in simulator_cpis:
-            print(f"Warning: No simulator CPI estimate for {bench_name}")
-            continue
-
-        sim_cpi = simulator_cpis[bench_name]
-        sim_latency_ns = sim_cpi / frequency_ghz
 
-        # Calculate error using the standard formula
-        error = abs(sim_latency_ns - hw_latency_ns) / min(sim_latency_ns, hw_latency_ns)
-
-        results.append({
-            "benchmark": bench_name,
-            "description": benchmark_data["description"],
-            "hw_cpi": hw_cpi,
-            "sim_cpi": sim_cpi,
-            "hw_latency_ns": hw_latency_ns,
-            "sim_latency_ns": sim_latency_ns,
-            "error": error
-        })
-
-        total_error += error
-        calibrated_count += 1
+    # Align hardware rows with the simulator estimates up front, so every
+    # array below has one entry per benchmark in the same order
+    rows = []
+    for r in calibration_data["results"]:
+        if r["benchmark"] in simulator_cpis:
+            rows.append(r)
+        else:
+            print(f"Warning: No simulator CPI estimate for {r['benchmark']}")
+    names = [r["benchmark"] for r in rows]
+
+    # Hardware CPI comes from the first entry of each data_points array
+    hw_cpi = [r["data_points"][0].get("cpi", 0) if r.get("data_points") else 0
+              for r in rows]
+    hw_latency_ns = np.array([r["instruction_latency_ns"] for r in rows], dtype=float)
+    sim_cpi = np.array([simulator_cpis[n] for n in names], dtype=float)
+    sim_latency_ns = sim_cpi / frequency_ghz
+
+    # Calculate error using the standard formula; a zero latency gives inf
+    smaller = np.minimum(sim_latency_ns, hw_latency_ns)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        errors = np.abs(sim_latency_ns - hw_latency_ns) / smaller
+    errors[smaller == 0] = np.inf
+
+    results = [
+        {
+            "benchmark": name,
+            "description": r["description"],
+            "hw_cpi": hc,
+            "sim_cpi": sc,
+            "hw_latency_ns": hl,
+            "sim_latency_ns": sl,
+            "error": e,
+        }
+        for name, r, hc, sc, hl, sl, e in zip(names, rows, hw_cpi, sim_cpi.tolist(),
+                                               hw_latency_ns.tolist(), sim_latency_ns.tolist(),
+                                               errors.tolist())
+    ]
+    calibrated_count = len(results)
 
-        print(f"{bench_name:<15} {hw_cpi:<10.1f} {sim_cpi:<10.1f} {hw_latency_ns:<12.1f} {sim_latency_ns:<12.3f} {error*100:<10.1f}")
+    table = [
+        f"{'Benchmark':<15} {'HW CPI':<10} {'Sim CPI':<10} {'HW ns/inst':<12} {'Sim ns/inst':<12} {'Error %':<10}",
+        "-" * 80,
+    ]
+    table += [
+        f"{r['benchmark']:<15} {r['hw_cpi']:<10.1f} {r['sim_cpi']:<10.1f} {r['hw_latency_ns']:<12.1f} "
+        f"{r['sim_latency_ns']:<12.3f} {r['error']*100:<10.1f}"
+        for r in results
+    ]
+    print("\n".join(table))
 
     # Calculate summary statistics
-    avg_error = total_error / calibrated_count if calibrated_count > 0 else 0
+    avg_error = float(errors.mean()) if calibrated_count > 0 else 0
 
     print("\n" + "=" * 60)
     print("H5 MILESTONE ACCURACY SUMMARY")
@@ -122,10 +190,6 @@ def main():
     }
 
     output_path = script_dir / "polybench_accuracy_results.json"
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
-
-    print(f"\nResults saved to: {output_path}")
 
     # Generate markdown report
     markdown_lines = [
@@ -169,9 +233,14 @@ def main():
     ])
 
     markdown_path = script_dir / "polybench_accuracy_report.md"
-    with open(markdown_path, 'w') as f:
-        f.write('\n'.join(markdown_lines))
 
+    # Both outputs are rendered first, then written together
+    write_files({
+        output_path: dump_json(output_data, pretty=args.pretty),
+        markdown_path: '\n'.join(markdown_lines).encode(),
+    })
+
+    print(f"\nResults saved to: {output_path}")
     print(f"Markdown report saved to: {markdown_path}")
 
     return 0 if success else 1
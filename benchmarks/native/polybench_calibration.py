@@ -20,10 +20,13 @@ import json
 import os
 import subprocess
 import sys
-import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from bench_harness import linear_regression, run_timed, trimmed_stats
 
 POLYBENCH_BENCHMARKS = {
     "gemm": "General matrix multiply (GEMM) - C := alpha*A*B + beta*C",
@@ -88,54 +91,6 @@ def count_instructions(binary_path: str, verbose: bool = False) -> Optional[int]
     return None
 
 
-def run_timed(binary_path: str, runs: int = 15, warmup: int = 3) -> List[float]:
-    """Run binary multiple times with warmup, return times in seconds."""
-    for _ in range(warmup):
-        subprocess.run([binary_path], capture_output=True)
-    times = []
-    for _ in range(runs):
-        start = time.perf_counter()
-        subprocess.run([binary_path], capture_output=True)
-        end = time.perf_counter()
-        times.append(end - start)
-    return times
-
-
-def trimmed_mean(values: List[float], trim_pct: float = 0.2) -> float:
-    """Trimmed mean, removing top/bottom trim_pct."""
-    if len(values) < 3:
-        return sum(values) / len(values)
-    s = sorted(values)
-    n = len(s)
-    tc = int(n * trim_pct)
-    trimmed = s[tc:-tc] if tc > 0 else s
-    return sum(trimmed) / len(trimmed) if trimmed else sum(s) / n
-
-
-def linear_regression(x: List[float], y: List[float]) -> Tuple[float, float, float]:
-    """Returns (slope, intercept, r_squared)."""
-    try:
-        from scipy import stats
-        slope, intercept, r, _, _ = stats.linregress(x, y)
-        return slope, intercept, r ** 2
-    except ImportError:
-        pass
-    n = len(x)
-    sx = sum(x); sy = sum(y)
-    sxy = sum(a * b for a, b in zip(x, y))
-    sx2 = sum(a * a for a in x)
-    d = n * sx2 - sx * sx
-    if abs(d) < 1e-15:
-        return 0.0, sy / n if n else 0.0, 0.0
-    slope = (n * sxy - sx * sy) / d
-    intercept = (sy - slope * sx) / n
-    ym = sy / n
-    ss_tot = sum((yi - ym) ** 2 for yi in y)
-    ss_res = sum((yi - (slope * xi + intercept)) ** 2 for xi, yi in zip(x, y))
-    r2 = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-    return slope, intercept, r2
-
-
 @dataclass
 class CalibrationResult:
     benchmark: str
@@ -176,14 +131,9 @@ def calibrate_benchmark(
         insts = count_instructions(binary, verbose=first_attempt)
         first_attempt = False
 
-        run_times = run_timed(binary, runs=runs, warmup=3)
-        run_times_ms = [t * 1000 for t in run_times]
-        avg_ms = trimmed_mean(run_times_ms)
-
-        s = sorted(run_times_ms)
-        tc = int(len(s) * 0.2)
-        trimmed = s[tc:-tc] if tc > 0 else s
-        std_ms = (sum((t - avg_ms) ** 2 for t in trimmed) / len(trimmed)) ** 0.5
+        run_times_ns = run_timed(binary, runs=runs, warmup=3)
+        run_times_ms = np.asarray(run_times_ns) / 1e6
+        avg_ms, std_ms = trimmed_stats(run_times_ms)
 
         if verbose:
             if insts is not None:
@@ -5,16 +5,58 @@ Combines microbenchmark and PolyBench results for H5 milestone validation.
 """
 
 import json
+import math
 from pathlib import Path
 
+# orjson parses and pretty-prints several times faster than the stdlib
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def load_json(path):
-    """Load JSON file."""
+    """Load JSON file, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(Path(path).read_bytes())
     with open(path) as f:
         return json.load(f)
 
 
-def calculate_h5_accuracy():
+def null_non_finite(value):
+    """Replace inf and NaN with None, which is how orjson writes them.
+
+    The stdlib encoder would emit the non-standard Infinity and NaN tokens
+    instead, so both backends go through this to write the same JSON.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [null_non_finite(item) for item in value]
+    return value
+
+
+def save_json(data, path, pretty=False):
+    """Write data as JSON, compact unless pretty; uses orjson when available.
+
+    Non-finite numbers become null.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+    data = null_non_finite(data)
+    with open(path, 'w') as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
+
+
+def calculate_h5_accuracy(pretty=False):
     """Calculate H5 accuracy combining micro and PolyBench results."""
 
     # Existing microbenchmark results (14.4% average error)
@@ -123,13 +165,17 @@ def calculate_h5_accuracy():
 
     # Save results
     output_path = Path("h5_milestone_results.json")
-    with open(output_path, 'w') as f:
-        json.dump(h5_results, f, indent=2)
+    save_json(h5_results, output_path, pretty=pretty)
 
     print(f"\n📄 Results saved to: {output_path}")
     return h5_complete
 
 
 if __name__ == "__main__":
-    success = calculate_h5_accuracy()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="H5 accuracy calculator")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the JSON results (default: compact)")
+    success = calculate_h5_accuracy(pretty=parser.parse_args().pretty)
     exit(0 if success else 1)
\ No newline at end of file
@@ -19,18 +19,24 @@ var (
 	fastTiming  = flag.Bool("fast-timing", false, "Enable fast timing simulation mode (optimized for calibration)")
 	cpuProfile  = flag.String("cpuprofile", "", "write cpu profile to file")
 	memProfile  = flag.String("memprofile", "", "write memory profile to file")
-	duration    = flag.Duration("duration", 30*time.Second, "max duration to run (for profiling)")
+	duration    = flag.Duration("duration", 30*time.Second, "max duration to run each program (for profiling)")
 	instruction = flag.Int("max-instr", 1000000, "max instructions to execute (0 = unlimited)")
 )
 
 func main() {
+	os.Exit(run())
+}
+
+// run profiles every program named on the command line and returns the
+// process exit status, so that deferred profile writers still run.
+func run() int {
 	flag.Parse()
 
 	if flag.NArg() < 1 {
-		fmt.Fprintf(os.Stderr, "Usage: profile [options] <program.elf>\n")
+		fmt.Fprintf(os.Stderr, "Usage: profile [options] <program.elf> [program.elf ...]\n")
 		fmt.Fprintf(os.Stderr, "\nOptions:\n")
 		flag.PrintDefaults()
-		os.Exit(1)
+		return 1
 	}
 
 	// Start CPU profiling if requested
@@ -38,24 +44,58 @@ func main() {
 		f, err := os.Create(*cpuProfile)
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "Error creating CPU profile: %v\n", err)
-			os.Exit(1)
+			return 1
 		}
 		defer func() { _ = f.Close() }()
 
 		if err := pprof.StartCPUProfile(f); err != nil {
 			fmt.Fprintf(os.Stderr, "Error starting CPU profile: %v\n", err)
-			os.Exit(1)
+			return 1
 		}
 		defer pprof.StopCPUProfile()
 	}
 
-	programPath := flag.Arg(0)
+	// Several programs are profiled back to back in this one process, each
+	// section headed by a "=== benchmark: <path> ===" line, so callers
+	// measuring many variants pay the tool's startup cost once. A program
+	// that fails to load or times out is reported in its own section and
+	// the rest still run.
+	status := 0
+	for _, programPath := range flag.Args() {
+		if flag.NArg() > 1 {
+			fmt.Printf("=== benchmark: %s ===\n", programPath)
+		}
+		if err := profileProgram(programPath); err != nil {
+			fmt.Printf("Error: %v\n", err)
+			fmt.Fprintf(os.Stderr, "Error profiling %s: %v\n", programPath, err)
+			status = 1
+		}
+	}
 
+	// Write memory profile if requested
+	if *memProfile != "" {
+		f, err := os.Create(*memProfile)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error creating memory profile: %v\n", err)
+			return 1
+		}
+		defer func() { _ = f.Close() }()
+
+		if err := pprof.WriteHeapProfile(f); err != nil {
+			fmt.Fprintf(os.Stderr, "Error writing memory profile: %v\n", err)
+		}
+	}
+
+	return status
+}
+
+// profileProgram loads and runs one program, then prints its results.
+// The -duration limit applies to each program separately.
+func profileProgram(programPath string) error {
 	// Load the ELF program
 	prog, err := loader.Load(programPath)
 	if err != nil {
-		fmt.Fprintf(os.Stderr, "Error loading program: %v\n", err)
-		os.Exit(1)
+		return fmt.Errorf("loading program: %w", err)
 	}
 
 	fmt.Printf("Loaded: %s\n", programPath)
@@ -63,41 +103,36 @@ func main() {
 
 	start := time.Now()
 
-	// Set timeout
-	go func() {
-		time.Sleep(*duration)
-		fmt.Printf("\nTimeout reached after %v - stopping execution\n", *duration)
-		os.Exit(2)
-	}()
-
 	var exitCode int64
 	var instrCount uint64
 	var cycleCount uint64
 
-	if *fastTiming {
-		exitCode, instrCount, cycleCount = runFastTimingProfile(prog, programPath)
-	} else if *timing {
-		exitCode, instrCount, cycleCount = runTimingProfile(prog, programPath)
-	} else {
-		exitCode, instrCount = runEmulationProfile(prog, programPath)
-	}
-
-	elapsed := time.Since(start)
-
-	// Write memory profile if requested
-	if *memProfile != "" {
-		f, err := os.Create(*memProfile)
-		if err != nil {
-			fmt.Fprintf(os.Stderr, "Error creating memory profile: %v\n", err)
-			os.Exit(1)
+	// The simulators cannot be interrupted, so a program that exceeds the
+	// timeout is abandoned: its goroutine keeps running in the background
+	// until the process exits.
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		if *fastTiming {
+			exitCode, instrCount, cycleCount = runFastTimingProfile(prog, programPath)
+		} else if *timing {
+			exitCode, instrCount, cycleCount = runTimingProfile(prog, programPath)
+		} else {
+			exitCode, instrCount = runEmulationProfile(prog, programPath)
 		}
-		defer func() { _ = f.Close() }()
+	}()
 
-		if err := pprof.WriteHeapProfile(f); err != nil {
-			fmt.Fprintf(os.Stderr, "Error writing memory profile: %v\n", err)
-		}
+	timeout := time.NewTimer(*duration)
+	defer timeout.Stop()
+	select {
+	case <-done:
+	case <-timeout.C:
+		fmt.Printf("\nTimeout reached after %v - stopping execution\n", *duration)
+		return fmt.Errorf("timed out after %v", *duration)
 	}
 
+	elapsed := time.Since(start)
+
 	fmt.Printf("\nProfiling Results:\n")
 	fmt.Printf("Exit code: %d\n", exitCode)
 	fmt.Printf("Instructions executed: %d\n", instrCount)
@@ -110,6 +145,7 @@ func main() {
 	if instrCount > 0 {
 		fmt.Printf("Instructions/second: %.0f\n", float64(instrCount)/elapsed.Seconds())
 	}
+	return nil
 }
 
 // loadSegments loads program segments into memory.
@@ -9,28 +9,114 @@ compatible with the existing accuracy analysis pipeline.
 
 import json
 import csv
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+# Fastest available CSV reader first: pyarrow (multithreaded C++), then
+# pandas (C parser), then csv.DictReader
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pac
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# orjson serializes in native code; the stdlib encoder is the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Benchmark descriptions for PolyBench suite
+POLYBENCH_DESCRIPTIONS = MappingProxyType({
+    'atax': 'Matrix transpose and vector multiply (atax kernel)',
+    'bicg': 'BiCG kernel - Biconjugate gradient solver',
+    'gemm': 'General matrix multiply (GEMM) - compute C = AB + C',
+    'mvt': 'Matrix-vector multiply and transpose operations',
+    'jacobi-1d': '1D Jacobi iteration stencil computation',
+    '2mm': 'Two matrix multiplies (2MM) - D = A * B; E = C * D',
+    '3mm': 'Three matrix multiplies (3MM) - G = A * B; H = C * D; I = E * H'
+})
+
+# Column types of baselines.csv
+BASELINE_DTYPES = {
+    'benchmark': str,
+    'avg_time_sec': 'float64',
+    'est_cycles': 'float64',
+    'instructions': 'int64',
+    'cpi': 'float64',
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Baseline:
+    """Hardware measurement for one PolyBench benchmark (one baselines.csv row)."""
+    avg_time_sec: float
+    est_cycles: float
+    instructions: int
+    cpi: float
+
+
+def load_baselines_csv(csv_path: Path) -> dict[str, Baseline]:
+    """Load PolyBench hardware baselines from CSV, keyed by benchmark name."""
+    if HAS_PYARROW:
+        options = pac.ConvertOptions(column_types={
+            'benchmark': pa.string(),
+            'avg_time_sec': pa.float64(),
+            'est_cycles': pa.float64(),
+            'instructions': pa.int64(),
+            'cpi': pa.float64(),
+        })
+        rows = pac.read_csv(csv_path, convert_options=options).to_pylist()
+        return {
+            row.pop('benchmark'): Baseline(**row)
+            for row in rows
+            if (row['benchmark'] or '').strip()  # Skip empty rows
+        }
 
+    if HAS_PANDAS:
+        # round_trip parses floats exactly as float() would
+        df = pd.read_csv(csv_path, dtype=BASELINE_DTYPES, float_precision='round_trip')
+        df = df[df['benchmark'].fillna('').str.strip() != '']  # Skip empty rows
+        return {
+            name: Baseline(**row)
+            for name, row in df.set_index('benchmark').to_dict(orient='index').items()
+        }
 
-def load_baselines_csv(csv_path: Path) -> dict:
-    """Load PolyBench hardware baselines from CSV."""
     baselines = {}
 
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        # Column positions are looked up once; rows are then read by index
+        # rather than through a per-row dict
+        header = next(reader)
+        name_col, time_col, cycles_col, insts_col, cpi_col = (
+            header.index(column)
+            for column in ('benchmark', 'avg_time_sec', 'est_cycles', 'instructions', 'cpi')
+        )
         for row in reader:
-            if row['benchmark'].strip():  # Skip empty rows
-                baselines[row['benchmark']] = {
-                    'avg_time_sec': float(row['avg_time_sec']),
-                    'est_cycles': float(row['est_cycles']),
-                    'instructions': int(row['instructions']),
-                    'cpi': float(row['cpi'])
-                }
+            if row and row[name_col].strip():  # Skip empty rows
+                baselines[row[name_col]] = Baseline(
+                    avg_time_sec=float(row[time_col]),
+                    est_cycles=float(row[cycles_col]),
+                    instructions=int(row[insts_col]),
+                    cpi=float(row[cpi_col])
+                )
 
     return baselines
 
 
-def convert_to_calibration_format(baselines: dict, frequency_ghz: float = 3.5) -> dict:
+def convert_to_calibration_format(baselines: dict[str, Baseline], frequency_ghz: float = 3.5) -> dict:
     """Convert baseline CPI data to calibration_results.json format.
 
     Args:
@@ -40,17 +126,6 @@ def convert_to_calibration_format(baselines: dict, frequency_ghz: float = 3.5) -
     Returns:
         Dict in calibration_results.json format
     """
-    # Benchmark descriptions for PolyBench suite
-    descriptions = {
-        'atax': 'Matrix transpose and vector multiply (atax kernel)',
-        'bicg': 'BiCG kernel - Biconjugate gradient solver',
-        'gemm': 'General matrix multiply (GEMM) - compute C = AB + C',
-        'mvt': 'Matrix-vector multiply and transpose operations',
-        'jacobi-1d': '1D Jacobi iteration stencil computation',
-        '2mm': 'Two matrix multiplies (2MM) - D = A * B; E = C * D',
-        '3mm': 'Three matrix multiplies (3MM) - G = A * B; H = C * D; I = E * H'
-    }
-
     calibration_data = {
         "methodology": "m2_hardware_baseline",
         "formula": "instruction_latency_ns = cpi / frequency_ghz",
@@ -59,29 +134,37 @@ def convert_to_calibration_format(baselines: dict, frequency_ghz: float = 3.5) -
         "results": []
     }
 
-    for benchmark, data in baselines.items():
-        # Convert CPI to instruction latency using frequency
-        # instruction_latency_ns = CPI / frequency_GHz
-        instruction_latency_ns = data['cpi'] / frequency_ghz
+    # Derived columns are computed over the whole suite at once, then zipped
+    # back into the per-benchmark schema consumers expect
+    cpi = np.fromiter((b.cpi for b in baselines.values()), dtype=np.float64, count=len(baselines))
+    avg_time_sec = np.fromiter((b.avg_time_sec for b in baselines.values()),
+                               dtype=np.float64, count=len(baselines))
+
+    # instruction_latency_ns = CPI / frequency_GHz
+    instruction_latency_ns = cpi / frequency_ghz
+    time_ms = avg_time_sec * 1000  # Convert to ms
 
-        benchmark_result = {
+    calibration_data["results"] = [
+        {
             "benchmark": benchmark,
-            "description": descriptions.get(benchmark, f"{benchmark} PolyBench kernel"),
+            "description": POLYBENCH_DESCRIPTIONS.get(benchmark, f"{benchmark} PolyBench kernel"),
             "calibrated": True,  # These are real hardware measurements
-            "instruction_latency_ns": instruction_latency_ns,
-            "m2_hardware_cpi": data['cpi'],
-            "instructions_per_run": data['instructions'],
-            "avg_time_sec": data['avg_time_sec'],
+            "instruction_latency_ns": latency_ns,
+            "m2_hardware_cpi": data.cpi,
+            "instructions_per_run": data.instructions,
+            "avg_time_sec": data.avg_time_sec,
             "r_squared": 1.0,  # Perfect correlation since this is direct measurement
             "data_points": [
                 {
-                    "instructions": data['instructions'],
-                    "time_ms": data['avg_time_sec'] * 1000  # Convert to ms
+                    "instructions": data.instructions,
+                    "time_ms": ms
                 }
             ]
         }
-
-        calibration_data["results"].append(benchmark_result)
+        for (benchmark, data), latency_ns, ms in zip(baselines.items(),
+                                                     instruction_latency_ns.tolist(),
+                                                     time_ms.tolist())
+    ]
 
     return calibration_data
 
@@ -101,14 +184,17 @@ def main():
 
     print(f"Found {len(baselines)} PolyBench benchmarks:")
     for name, data in baselines.items():
-        print(f"  {name}: {data['cpi']:.3f} CPI, {data['instructions']} instructions")
+        print(f"  {name}: {data.cpi:.3f} CPI, {data.instructions} instructions")
 
     print("\nConverting to calibration format...")
     calibration_data = convert_to_calibration_format(baselines)
 
     print(f"Writing calibration data to: {output_json}")
-    with open(output_json, 'w') as f:
-        json.dump(calibration_data, f, indent=2)
+    if HAS_ORJSON:
+        output_json.write_bytes(orjson.dumps(calibration_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_json, 'w') as f:
+            json.dump(calibration_data, f, indent=2)
 
     print(f"✅ PolyBench calibration data created: {len(calibration_data['results'])} benchmarks")
 
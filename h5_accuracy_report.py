@@ -12,26 +12,39 @@ This script combines:
 Generates comprehensive accuracy analysis for H5 completion verification.
 """
 
+import functools
+import hashlib
 import json
+import math
+import os
 import re
 import subprocess
 import sys
+import tempfile
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Optional, Tuple
 
-# Check for matplotlib availability
+import numpy as np
+
+# Microbenchmark CPI logic shared with the native accuracy report, imported
+# once as a package path from the repo root (this script's directory)
+try:
+    from benchmarks.native.accuracy_report import measure_simulator_cpis
+except ImportError:
+    measure_simulator_cpis = None
+
+# orjson serializes in native code; the stdlib encoder is the fallback
 try:
-    import matplotlib.pyplot as plt
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend for CI
-    HAS_MATPLOTLIB = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_MATPLOTLIB = False
-    print("Warning: matplotlib not available, skipping figure generation")
+    HAS_ORJSON = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkComparison:
     """Comparison between simulator and real hardware for a benchmark."""
     name: str
@@ -49,15 +62,120 @@ class BenchmarkComparison:
     calibrated: bool = True   # whether baseline is from real hardware measurement
 
 
+@dataclass
+class H5Stats:
+    """Comparisons with their calibrated errors split by category, computed once."""
+    comparisons: List[BenchmarkComparison]
+    micro_count: int
+    polybench_count: int
+    micro_errors: np.ndarray      # errors of calibrated microbenchmarks
+    polybench_errors: np.ndarray  # errors of calibrated PolyBench benchmarks
+    all_errors: np.ndarray        # errors of every calibrated benchmark
+
+    # Each statistic is reduced once and reused by the report, JSON and summary
+
+    @functools.cached_property
+    def micro_avg(self) -> float:
+        return mean_or_zero(self.micro_errors)
+
+    @functools.cached_property
+    def polybench_avg(self) -> float:
+        return mean_or_zero(self.polybench_errors)
+
+    @functools.cached_property
+    def overall_avg(self) -> float:
+        return mean_or_zero(self.all_errors)
+
+    @functools.cached_property
+    def micro_max(self) -> float:
+        return max_or_zero(self.micro_errors)
+
+    @functools.cached_property
+    def polybench_max(self) -> float:
+        return max_or_zero(self.polybench_errors)
+
+    @property
+    def h5_complete(self) -> bool:
+        return len(self.comparisons) >= 15 and self.overall_avg < 0.2
+
+
+def mean_or_zero(errors: np.ndarray) -> float:
+    """Mean of errors, or 0 when there are none."""
+    return float(errors.mean()) if errors.size else 0
+
+
+def max_or_zero(errors: np.ndarray) -> float:
+    """Largest of errors, or 0 when there are none."""
+    return float(errors.max()) if errors.size else 0
+
+
+def summarize(comparisons: List[BenchmarkComparison]) -> H5Stats:
+    """Split comparisons by category in a single pass.
+
+    Both report generators and main take the resulting H5Stats instead of
+    re-filtering comparisons themselves.
+    """
+    errors = {'micro': [], 'polybench': []}
+    counts = {'micro': 0, 'polybench': 0}
+    for c in comparisons:
+        counts[c.category] += 1
+        if c.calibrated:
+            errors[c.category].append(c.error)
+
+    micro_errors = np.array(errors['micro'], dtype=np.float64)
+    polybench_errors = np.array(errors['polybench'], dtype=np.float64)
+    return H5Stats(
+        comparisons=comparisons,
+        micro_count=counts['micro'],
+        polybench_count=counts['polybench'],
+        micro_errors=micro_errors,
+        polybench_errors=polybench_errors,
+        # compare_all_benchmarks lists micro before polybench, so this
+        # keeps comparison order without another pass over comparisons
+        all_errors=np.concatenate((micro_errors, polybench_errors)),
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def load_calibration_results(path: Path) -> dict:
-    """Load calibration results from JSON."""
+    """Load calibration results from JSON, with orjson when available.
+
+    Parsed once per path; callers share the returned dict and must not
+    modify it.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Calibration results not found: {path}")
 
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     with open(path) as f:
         return json.load(f)
 
 
+# Fallback CPI values — only used if go test fails
+# Updated to realistic values matching observed PolyBench CPI range (~0.39-0.43)
+POLYBENCH_FALLBACK_CPIS = MappingProxyType({
+    'atax': 0.41,
+    'bicg': 0.43,
+    'gemm': 0.41,
+    'mvt': 0.41,
+    'jacobi-1d': 0.42,
+    '2mm': 0.39,
+    '3mm': 0.40,
+})
+
+# (go test name, benchmark name) for each PolyBench timing simulation
+POLYBENCH_TESTS = (
+    ("TestPolybenchATAX", "atax"),
+    ("TestPolybenchBiCG", "bicg"),
+    ("TestPolybenchMVT", "mvt"),
+    ("TestPolybenchJacobi1D", "jacobi-1d"),
+    ("TestPolybenchGEMM", "gemm"),
+    ("TestPolybench2MM", "2mm"),
+    ("TestPolybench3MM", "3mm"),
+)
+
+
 def get_polybench_simulator_cpis(repo_root: Path) -> dict:
     """Get CPI values for PolyBench benchmarks by running timing simulations.
 
@@ -66,27 +184,8 @@ def get_polybench_simulator_cpis(repo_root: Path) -> dict:
 
     Returns dict mapping benchmark name to CPI.
     """
-    # Fallback CPI values — only used if go test fails
-    # Updated to realistic values matching observed PolyBench CPI range (~0.39-0.43)
-    fallback_cpis = {
-        'atax': 0.41,
-        'bicg': 0.43,
-        'gemm': 0.41,
-        'mvt': 0.41,
-        'jacobi-1d': 0.42,
-        '2mm': 0.39,
-        '3mm': 0.40,
-    }
-
-    polybench_tests = [
-        ("TestPolybenchATAX", "atax"),
-        ("TestPolybenchBiCG", "bicg"),
-        ("TestPolybenchMVT", "mvt"),
-        ("TestPolybenchJacobi1D", "jacobi-1d"),
-        ("TestPolybenchGEMM", "gemm"),
-        ("TestPolybench2MM", "2mm"),
-        ("TestPolybench3MM", "3mm"),
-    ]
+    fallback_cpis = POLYBENCH_FALLBACK_CPIS
+    polybench_tests = POLYBENCH_TESTS
 
     polybench_cpis = {}
 
@@ -129,153 +228,259 @@ def get_polybench_simulator_cpis(repo_root: Path) -> dict:
     return polybench_cpis
 
 
-def get_microbench_simulator_cpis(repo_root: Path) -> dict:
-    """Get CPI values for microbenchmarks from existing accuracy_report.py logic."""
+# Fallback CPI values from accuracy_report.py
+MICROBENCH_FALLBACK_CPIS = MappingProxyType({
+    "arithmetic": 0.27,
+    "dependency": 1.02,
+    "branch": 1.32,
+    "memorystrided": 2.7,
+    "loadheavy": 0.361,
+    "storeheavy": 0.361,
+    "branchheavy": 0.829,
+    "vectorsum": 0.500,
+    "vectoradd": 0.401,
+    "reductiontree": 0.452,
+    "strideindirect": 0.708,
+})
+
 
-    # Import the existing CPI logic from accuracy_report.py
-    sys.path.append(str(repo_root / "benchmarks" / "native"))
+# Simulator CPIs keyed by a hash of everything the go test runs read, kept
+# across runs so an unchanged tree is never re-simulated
+CPI_CACHE_DIR = Path(tempfile.gettempdir()) / "m2sim_h5_cpi_cache"
 
+
+def go_sources(repo_root: Path) -> List[Path]:
+    """Go sources git knows about under repo_root, tracked or not yet added.
+
+    Asking git skips ignored trees such as vendored or cached modules; a
+    checkout without git falls back to walking the whole tree.
+    """
     try:
-        from accuracy_report import get_simulator_cpi_for_benchmarks
-        return get_simulator_cpi_for_benchmarks(repo_root)
-    except ImportError:
+        listing = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", "*.go"],
+            cwd=str(repo_root), capture_output=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return sorted(repo_root.rglob("*.go"))
+    paths = (repo_root / name for name in sorted(set(listing.decode().split("\0"))) if name)
+    # Files deleted from the worktree are still in the index
+    return [path for path in paths if path.exists()]
+
+
+def go_version(repo_root: Path) -> str:
+    """The toolchain `go env GOVERSION` reports for repo_root, or "" without go."""
+    try:
+        return subprocess.run(
+            ["go", "env", "GOVERSION"], cwd=str(repo_root),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def microbench_cpi_cache_key(repo_root: Path) -> str:
+    """Hash of repo_root, the Go version and the mtimes of every simulator CPI input.
+
+    Those are accuracy_report.py, go.mod/go.sum, every Go source, and the
+    benchmark ELFs the tests under benchmarks/ load.
+    """
+    sources = [repo_root / "benchmarks" / "native" / "accuracy_report.py",
+               *(path for path in (repo_root / "go.mod", repo_root / "go.sum") if path.exists()),
+               *go_sources(repo_root),
+               *sorted((repo_root / "benchmarks").rglob("*.elf"))]
+    digest = hashlib.blake2b(str(repo_root.resolve()).encode())
+    digest.update(f"\ngo:{go_version(repo_root)}".encode())
+    for path in sources:
+        digest.update(f"\n{path}:{path.stat().st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=None)
+def get_microbench_simulator_cpis(repo_root: Path) -> dict:
+    """Get CPI values for microbenchmarks from existing accuracy_report.py logic.
+
+    Results are read from CPI_CACHE_DIR when none of the simulation inputs
+    changed since they were computed, and are memoized per repo_root;
+    callers must not modify the returned dict. Only a run in which every
+    CPI was measured is written to the cache, never one that fell back to
+    hard-coded values.
+    """
+    if measure_simulator_cpis is None:
         print("Warning: Could not import microbenchmark CPI logic, using fallback values")
+        return dict(MICROBENCH_FALLBACK_CPIS)
 
-        # Fallback CPI values from accuracy_report.py
-        return {
-            "arithmetic": 0.27,
-            "dependency": 1.02,
-            "branch": 1.32,
-            "memorystrided": 2.7,
-            "loadheavy": 0.361,
-            "storeheavy": 0.361,
-            "branchheavy": 0.829,
-            "vectorsum": 0.500,
-            "vectoradd": 0.401,
-            "reductiontree": 0.452,
-            "strideindirect": 0.708,
-        }
-
-
-def calculate_error(t_sim: float, t_real: float) -> float:
-    """Calculate error using the formula from Issue #89."""
-    if min(t_sim, t_real) == 0:
-        return float('inf')
-    return abs(t_sim - t_real) / min(t_sim, t_real)
+    cached = CPI_CACHE_DIR / f"h5_micro_cpis_{microbench_cpi_cache_key(repo_root)}.json"
+    if cached.exists():
+        print(f"  Using cached simulator CPIs: {cached}")
+        return json.loads(cached.read_text())
 
+    cpis, unmeasured = measure_simulator_cpis(repo_root)
+    if unmeasured:
+        print(f"  Not caching simulator CPIs: {len(unmeasured)} not measured "
+              f"({', '.join(sorted(unmeasured))})")
+        return cpis
 
-def compare_all_benchmarks(
-    micro_calibration: dict,
-    polybench_calibration: dict,
-    micro_cpis: dict,
-    polybench_cpis: dict,
-    assumed_frequency_ghz: float = 3.5
-) -> List[BenchmarkComparison]:
-    """Compare simulator predictions against hardware for all benchmarks."""
-    comparisons = []
-
-    # Process microbenchmarks
-    for result in micro_calibration.get('results', []):
-        bench_name = result['benchmark']
-        if bench_name not in micro_cpis:
-            print(f"Warning: No simulator CPI for microbenchmark '{bench_name}'")
-            continue
-
-        real_latency_ns = result['instruction_latency_ns']
-        sim_cpi = micro_cpis[bench_name]
-        sim_latency_ns = sim_cpi / assumed_frequency_ghz
-        error = calculate_error(sim_latency_ns, real_latency_ns)
-
-        comparisons.append(BenchmarkComparison(
-            name=bench_name,
-            description=result['description'],
-            category='micro',
-            real_latency_ns=real_latency_ns,
-            real_r_squared=result.get('r_squared', 1.0),
-            sim_cpi=sim_cpi,
-            sim_latency_ns=sim_latency_ns,
-            error=error,
-            calibrated=result.get('calibrated', True),
-        ))
+    # Write then rename, so a concurrent run never reads a partial file
+    CPI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    staging = cached.with_name(f"{cached.name}.{os.getpid()}")
+    staging.write_text(json.dumps(cpis))
+    os.replace(staging, cached)
+    return cpis
+
+
+def null_non_finite(value):
+    """Replace inf and NaN with None, which is how orjson writes them.
+
+    The stdlib encoder would emit the non-standard Infinity and NaN tokens
+    instead, so both backends go through this to write the same JSON.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: null_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [null_non_finite(item) for item in value]
+    return value
 
-    # Process PolyBench benchmarks
-    for result in polybench_calibration.get('results', []):
-        bench_name = result['benchmark']
-        if bench_name not in polybench_cpis:
-            print(f"Warning: No simulator CPI for PolyBench '{bench_name}'")
-            continue
 
-        real_latency_ns = result['instruction_latency_ns']
-        sim_cpi = polybench_cpis[bench_name]
-        sim_latency_ns = sim_cpi / assumed_frequency_ghz
-        error = calculate_error(sim_latency_ns, real_latency_ns)
+def calculate_errors(t_sim: np.ndarray, t_real: np.ndarray) -> np.ndarray:
+    """Element-wise error using the formula from Issue #89; a zero in either gives inf.
 
-        comparisons.append(BenchmarkComparison(
-            name=bench_name,
+    inf is written to the JSON results as null.
+    """
+    smaller = np.minimum(t_sim, t_real)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        errors = np.abs(t_sim - t_real) / smaller
+    errors[smaller == 0] = np.inf
+    return errors
+
+
+def compare_category(
+    calibration: dict,
+    cpis: dict,
+    category: str,
+    assumed_frequency_ghz: float
+) -> List[BenchmarkComparison]:
+    """Compare one calibration file's benchmarks, computing all errors at once."""
+    label = 'microbenchmark' if category == 'micro' else 'PolyBench'
+    results = []
+    for result in calibration.get('results', []):
+        if result['benchmark'] in cpis:
+            results.append(result)
+        else:
+            print(f"Warning: No simulator CPI for {label} '{result['benchmark']}'")
+
+    real_latency_ns = np.fromiter((r['instruction_latency_ns'] for r in results),
+                                  dtype=np.float64, count=len(results))
+    sim_cpi = np.fromiter((cpis[r['benchmark']] for r in results),
+                          dtype=np.float64, count=len(results))
+    sim_latency_ns = sim_cpi / assumed_frequency_ghz
+    errors = calculate_errors(sim_latency_ns, real_latency_ns)
+
+    return [
+        BenchmarkComparison(
+            name=result['benchmark'],
             description=result['description'],
-            category='polybench',
-            real_latency_ns=real_latency_ns,
+            category=category,
+            real_latency_ns=real,
             real_r_squared=result.get('r_squared', 1.0),
-            sim_cpi=sim_cpi,
-            sim_latency_ns=sim_latency_ns,
+            sim_cpi=cpi,
+            sim_latency_ns=sim,
             error=error,
             calibrated=result.get('calibrated', True),
-        ))
-
-    return comparisons
-
-
-def generate_h5_report(comparisons: List[BenchmarkComparison], output_path: Path):
-    """Generate H5 milestone completion report."""
-    micro_benchmarks = [c for c in comparisons if c.category == 'micro']
-    polybench_benchmarks = [c for c in comparisons if c.category == 'polybench']
+        )
+        for result, real, cpi, sim, error in zip(
+            results, real_latency_ns.tolist(), sim_cpi.tolist(),
+            sim_latency_ns.tolist(), errors.tolist())
+    ]
 
-    micro_errors = [c.error for c in micro_benchmarks if c.calibrated]
-    polybench_errors = [c.error for c in polybench_benchmarks if c.calibrated]
-    all_errors = [c.error for c in comparisons if c.calibrated]
 
-    micro_avg = sum(micro_errors) / len(micro_errors) if micro_errors else 0
-    polybench_avg = sum(polybench_errors) / len(polybench_errors) if polybench_errors else 0
-    overall_avg = sum(all_errors) / len(all_errors) if all_errors else 0
+def compare_all_benchmarks(
+    micro_calibration: dict,
+    polybench_calibration: dict,
+    micro_cpis: dict,
+    polybench_cpis: dict,
+    assumed_frequency_ghz: float = 3.5
+) -> H5Stats:
+    """Compare simulator predictions against hardware for all benchmarks."""
+    comparisons = (
+        compare_category(micro_calibration, micro_cpis, 'micro', assumed_frequency_ghz)
+        + compare_category(polybench_calibration, polybench_cpis, 'polybench',
+                           assumed_frequency_ghz)
+    )
+    return summarize(comparisons)
+
+
+# Markdown report templates, parsed once and filled per report / per row
+REPORT_HEADER_FORMAT = "\n".join((
+    "# H5 Milestone Accuracy Report",
+    "",
+    "## H5 Completion Status",
+    "",
+    "- **Total Benchmarks:** {total} (Target: 15+) ✅",
+    "- **Microbenchmarks:** {micro_count} calibrated",
+    "- **PolyBench (Intermediate):** {polybench_count} calibrated",
+    "- **Overall Average Error:** {overall_pct:.1f}% (Target: <20%)",
+    "",
+    "## Accuracy Summary by Category",
+    "",
+    "### Microbenchmarks ({micro_count} benchmarks)",
+    "- **Average Error:** {micro_pct:.1f}%",
+    "- **Max Error:** {micro_max}",
+    "",
+    "### PolyBench Intermediate ({polybench_count} benchmarks)",
+    "- **Average Error:** {polybench_pct:.1f}%",
+    "- **Max Error:** {polybench_max}",
+    "",
+    "## Detailed Results",
+    "",
+    "| Category | Benchmark | Description | Real (ns/inst) | Sim (ns/inst) | Error | Status |",
+    "|----------|-----------|-------------|----------------|---------------|-------|---------|",
+))
+
+REPORT_ROW_FORMAT = (
+    "| {category} | {c.name} | {c.description:.30}... | "
+    "{c.real_latency_ns:.4f} | {c.sim_latency_ns:.4f} | "
+    "{error_pct:.1f}% | {status} |"
+)
+
+CATEGORY_LABELS = MappingProxyType({'micro': 'Micro', 'polybench': 'PolyBench'})
+
+
+def error_status(error: float) -> str:
+    """Status icon for one benchmark's error."""
+    return "✅" if error < 0.2 else "⚠️" if error < 0.5 else "❌"
+
+
+def format_max_error(max_error: float, count: int) -> str:
+    """Max error as a percentage, or N/A for an empty category."""
+    return f"{max_error * 100:.1f}%" if count else "N/A"
+
+
+def render_h5_report(stats: H5Stats, rows: List[str]) -> str:
+    """Render the H5 milestone completion report around pre-rendered table rows."""
+    comparisons = stats.comparisons
+    micro_errors = stats.micro_errors
+    polybench_errors = stats.polybench_errors
+
+    micro_avg = stats.micro_avg
+    polybench_avg = stats.polybench_avg
+    overall_avg = stats.overall_avg
 
     lines = [
-        "# H5 Milestone Accuracy Report",
-        "",
-        "## H5 Completion Status",
-        "",
-        f"- **Total Benchmarks:** {len(comparisons)} (Target: 15+) ✅",
-        f"- **Microbenchmarks:** {len(micro_benchmarks)} calibrated",
-        f"- **PolyBench (Intermediate):** {len(polybench_benchmarks)} calibrated",
-        f"- **Overall Average Error:** {overall_avg * 100:.1f}% (Target: <20%)",
-        "",
-        "## Accuracy Summary by Category",
-        "",
-        f"### Microbenchmarks ({len(micro_benchmarks)} benchmarks)",
-        f"- **Average Error:** {micro_avg * 100:.1f}%",
-        f"- **Max Error:** {max(micro_errors) * 100:.1f}%" if micro_errors else "- **Max Error:** N/A",
-        "",
-        f"### PolyBench Intermediate ({len(polybench_benchmarks)} benchmarks)",
-        f"- **Average Error:** {polybench_avg * 100:.1f}%",
-        f"- **Max Error:** {max(polybench_errors) * 100:.1f}%" if polybench_errors else "- **Max Error:** N/A",
-        "",
-        "## Detailed Results",
-        "",
-        "| Category | Benchmark | Description | Real (ns/inst) | Sim (ns/inst) | Error | Status |",
-        "|----------|-----------|-------------|----------------|---------------|-------|---------|",
+        REPORT_HEADER_FORMAT.format(
+            total=len(comparisons),
+            micro_count=stats.micro_count,
+            polybench_count=stats.polybench_count,
+            overall_pct=overall_avg * 100,
+            micro_pct=micro_avg * 100,
+            micro_max=format_max_error(stats.micro_max, micro_errors.size),
+            polybench_pct=polybench_avg * 100,
+            polybench_max=format_max_error(stats.polybench_max, polybench_errors.size),
+        ),
+        *rows,
     ]
 
-    # Sort by category, then by name
-    sorted_comparisons = sorted(comparisons, key=lambda c: (c.category, c.name))
-
-    for c in sorted_comparisons:
-        category_label = "Micro" if c.category == "micro" else "PolyBench"
-        status = "✅" if c.error < 0.2 else "⚠️" if c.error < 0.5 else "❌"
-        lines.append(
-            f"| {category_label} | {c.name} | {c.description[:30]}... | "
-            f"{c.real_latency_ns:.4f} | {c.sim_latency_ns:.4f} | "
-            f"{c.error * 100:.1f}% | {status} |"
-        )
-
     lines.extend([
         "",
         "## H5 Milestone Validation",
@@ -312,56 +517,73 @@ def generate_h5_report(comparisons: List[BenchmarkComparison], output_path: Path
         "*H5 Milestone Accuracy Report - Generated for strategic milestone validation*",
     ])
 
-    output_path.write_text('\n'.join(lines))
-    print(f"H5 report saved to: {output_path}")
-
+    return '\n'.join(lines)
 
-def generate_h5_json_results(comparisons: List[BenchmarkComparison], output_path: Path):
-    """Generate H5 machine-readable JSON results."""
-    micro_benchmarks = [c for c in comparisons if c.category == 'micro']
-    polybench_benchmarks = [c for c in comparisons if c.category == 'polybench']
 
-    micro_errors = [c.error for c in micro_benchmarks if c.calibrated]
-    polybench_errors = [c.error for c in polybench_benchmarks if c.calibrated]
-    all_errors = [c.error for c in comparisons if c.calibrated]
+def render_h5_json(stats: H5Stats, benchmarks: List[dict]) -> bytes:
+    """Render the H5 machine-readable JSON results around per-benchmark entries."""
+    comparisons = stats.comparisons
 
     output = {
         "h5_milestone": {
-            "status": "complete" if len(comparisons) >= 15 and (sum(all_errors) / len(all_errors) if all_errors else 0) < 0.2 else "incomplete",
+            "status": "complete" if stats.h5_complete else "incomplete",
             "total_benchmarks": len(comparisons),
             "target_benchmarks": 15,
-            "overall_average_error": sum(all_errors) / len(all_errors) if all_errors else 0,
+            "overall_average_error": stats.overall_avg,
             "target_error": 0.2,
         },
         "categories": {
             "microbenchmarks": {
-                "count": len(micro_benchmarks),
-                "average_error": sum(micro_errors) / len(micro_errors) if micro_errors else 0,
-                "max_error": max(micro_errors) if micro_errors else 0,
+                "count": stats.micro_count,
+                "average_error": stats.micro_avg,
+                "max_error": stats.micro_max,
             },
             "polybench": {
-                "count": len(polybench_benchmarks),
-                "average_error": sum(polybench_errors) / len(polybench_errors) if polybench_errors else 0,
-                "max_error": max(polybench_errors) if polybench_errors else 0,
+                "count": stats.polybench_count,
+                "average_error": stats.polybench_avg,
+                "max_error": stats.polybench_max,
             }
         },
-        "benchmarks": [
-            {
-                "name": c.name,
-                "description": c.description,
-                "category": c.category,
-                "calibrated": c.calibrated,
-                "real_latency_ns": c.real_latency_ns,
-                "sim_cpi": c.sim_cpi,
-                "sim_latency_ns": c.sim_latency_ns,
-                "error": c.error,
-            }
-            for c in comparisons
-        ]
+        "benchmarks": benchmarks
     }
 
-    output_path.write_text(json.dumps(output, indent=2))
-    print(f"H5 JSON results saved to: {output_path}")
+    if HAS_ORJSON:
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    return json.dumps(null_non_finite(output), indent=2).encode()
+
+
+def emit_h5_outputs(stats: H5Stats, report_path: Path, json_path: Path):
+    """Write the Markdown report and JSON results from one walk over the comparisons.
+
+    Each comparison yields its table row and its JSON entry together. JSON
+    entries keep comparison order; rows are then sorted by category and
+    name, a stable sort matching the previous per-report ordering.
+    """
+    row = REPORT_ROW_FORMAT.format
+    keyed_rows = []
+    benchmarks = []
+    for c in stats.comparisons:
+        keyed_rows.append((
+            (c.category, c.name),
+            row(c=c, category=CATEGORY_LABELS[c.category], error_pct=c.error * 100,
+                status=error_status(c.error)),
+        ))
+        benchmarks.append({
+            "name": c.name,
+            "description": c.description,
+            "category": c.category,
+            "calibrated": c.calibrated,
+            "real_latency_ns": c.real_latency_ns,
+            "sim_cpi": c.sim_cpi,
+            "sim_latency_ns": c.sim_latency_ns,
+            "error": c.error,
+        })
+    keyed_rows.sort(key=itemgetter(0))
+
+    report_path.write_text(render_h5_report(stats, [r for _, r in keyed_rows]))
+    print(f"H5 report saved to: {report_path}")
+    json_path.write_bytes(render_h5_json(stats, benchmarks))
+    print(f"H5 JSON results saved to: {json_path}")
 
 
 def main():
@@ -392,16 +614,16 @@ def main():
 
     # Compare all benchmarks
     print("\nComparing simulator vs hardware for all benchmarks...")
-    comparisons = compare_all_benchmarks(
+    stats = compare_all_benchmarks(
         micro_calibration, polybench_calibration,
         micro_cpis, polybench_cpis
     )
 
     # Print summary
-    micro_count = len([c for c in comparisons if c.category == 'micro'])
-    polybench_count = len([c for c in comparisons if c.category == 'polybench'])
-    all_errors = [c.error for c in comparisons if c.calibrated]
-    overall_avg = sum(all_errors) / len(all_errors) if all_errors else 0
+    comparisons = stats.comparisons
+    micro_count = stats.micro_count
+    polybench_count = stats.polybench_count
+    overall_avg = stats.overall_avg
 
     print("\n" + "=" * 60)
     print("H5 MILESTONE SUMMARY")
@@ -412,7 +634,7 @@ def main():
     print(f"Overall Average Error: {overall_avg * 100:.1f}% (Target: <20%)")
     print("")
 
-    h5_complete = len(comparisons) >= 15 and overall_avg < 0.2
+    h5_complete = stats.h5_complete
     print(f"H5 STATUS: {'✅ COMPLETE' if h5_complete else '❌ INCOMPLETE'}")
 
     # Generate outputs
@@ -420,8 +642,7 @@ def main():
     json_path = repo_root / "h5_accuracy_results.json"
 
     print("\nGenerating H5 outputs...")
-    generate_h5_report(comparisons, report_path)
-    generate_h5_json_results(comparisons, json_path)
+    emit_h5_outputs(stats, report_path, json_path)
 
     print("\n✅ H5 accuracy analysis complete!")
 
@@ -18,24 +18,236 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
+import hashlib
 import json
+import mmap
+import os
+import re
+import shutil
+import statistics
 import subprocess
+import tempfile
 import time
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, defaultdict
+from dataclasses import dataclass, asdict, replace
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import numpy as np
-from scipy import stats
 import sys
 
+# orjson serializes dataclass dicts and NumPy scalars several times faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# E-Divisive means (MongoDB's signal-processing-algorithms); without it,
+# velocity and performance are judged by fixed thresholds only
+try:
+    from signal_processing_algorithms.energy_statistics.energy_statistics import e_divisive
+    HAS_E_DIVISIVE = True
+except ImportError:
+    HAS_E_DIVISIVE = False
+
 # Import Alex's statistical framework components
 sys.path.append(str(Path(__file__).parent))
 from incremental_testing_validation import (
     ScalingDataPoint, ScalingAnalysis, analyze_scaling_correlation,
-    generate_scaling_plots, POLYBENCH_SCALING_SIZES
+    generate_scaling_plots, linregress, POLYBENCH_SCALING_SIZES
+)
+
+# Every metric of interest in profile-tool output, matched in one pass;
+# the named group that matched identifies the metric
+SIMULATION_METRIC_PATTERN = (
+    r'Instructions executed: (?P<instructions>\d+)'
+    r'|Cycles: (?P<cycles>\d+)'
+    r'|CPI: (?P<cpi>[\d.]+)'
+    r'|Elapsed time: (?P<elapsed_time>[\d.]+(?:μs|ms|ns|s))'
+    r'|Instructions/second: (?P<instructions_per_sec>[\d.]+)'
 )
+SIMULATION_METRIC_RE = re.compile(SIMULATION_METRIC_PATTERN)
+# UTF-8 form, scanned directly over the memory-mapped simulator output
+SIMULATION_METRIC_RE_BYTES = re.compile(SIMULATION_METRIC_PATTERN.encode())
+METRIC_TYPES = {
+    'instructions': int,
+    'cycles': int,
+    'cpi': float,
+    'elapsed_time': float,
+    'instructions_per_sec': float,
+}
+# Heads each program's results when the profile tool is given several
+BENCHMARK_SECTION_RE = re.compile(rb'^=== benchmark: (.+) ===$', re.MULTILINE)
+ELAPSED_TIME_RE = re.compile(r'([\d.]+)(μs|ms|ns|s)')
+ELAPSED_TIME_UNITS = {'μs': 1e-6, 'ms': 1e-3, 'ns': 1e-9, 's': 1.0}
+
+# Built benchmark binaries, one per (sources, Makefile, size) key; see
+# DianaQAValidator.binary_cache_path
+BINARY_CACHE_DIR = Path.home() / '.cache' / 'diana_qa'
+
+# Builds (C compiles) run on half the cores; simulators are heavyweight,
+# so only a couple run at once, overlapping with the builds still going
+BUILD_CONCURRENCY = max(1, (os.cpu_count() or 2) // 2)
+SIMULATOR_CONCURRENCY = 2
+
+# Go pipeline benchmark run as each PolyBench benchmark's regression check
+BENCHMARK_GO_TESTS = {
+    'gemm': 'BenchmarkPipelineTick8Wide',
+    'atax': 'BenchmarkPipelineMixed8Wide',
+    'gesummv': 'BenchmarkPipelineDepChain8Wide'
+}
+DEFAULT_GO_TEST = 'BenchmarkPipelineTick8Wide'
+# Metrics kept from `go test -bench -benchmem` result lines, by unit
+GO_BENCH_UNITS = {'ns/op': 'ns_per_op', 'B/op': 'bytes_per_op', 'allocs/op': 'allocs_per_op'}
+
+# Validation criteria, one bit each in the mask built by
+# _determine_validation_status. A failed critical criterion fails the
+# validation; the others only produce a warning.
+CORRELATION_OK, ACCURACY_OK, SIGNIFICANCE_OK, VELOCITY_OK, PERFORMANCE_OK = (1 << i for i in range(5))
+CRITICAL_CRITERIA = CORRELATION_OK | ACCURACY_OK | SIGNIFICANCE_OK
+ALL_CRITERIA = CRITICAL_CRITERIA | VELOCITY_OK | PERFORMANCE_OK
+
+# Every run's key metrics, one JSON object per line in the output directory
+HISTORY_FILE = 'history.jsonl'
+# Past runs of a benchmark needed before change-point detection replaces
+# the fixed thresholds
+HISTORY_MIN_POINTS = 20
+CHANGE_POINT_PERMUTATIONS = 50
+# A shift counts as a regression when the latest segment's mean is this
+# much worse than the segment before it
+REGRESSION_WORSENING = 0.10
+
+# Results for Perfherder-format change-point tooling (Perfherder, Hunter,
+# Nyrkiö), one suite per benchmark; see write_perfherder_data
+PERFHERDER_FILE = 'perfherder-data.json'
+PERFHERDER_FRAMEWORK = 'diana_qa'
+
+# QAValidationResult.validation_status values; a WARNING still lets the
+# enhancement through (ACCEPTED_STATUSES)
+PASSED = 'PASSED'
+WARNING = 'WARNING'
+FAILED = 'FAILED'
+ACCEPTED_STATUSES = frozenset({PASSED, WARNING})
+
+# Report markers by validation status, and for the suite by whether no
+# benchmark failed
+STATUS_ICONS = {PASSED: '✅', WARNING: '⚠️', FAILED: '❌'}
+SUITE_STATUS = {True: '✅ SUITE PASSED', False: '❌ SUITE FAILED'}
+SUITE_RECOMMENDATION = {
+    True: '✅ **APPROVE ENHANCEMENT INTEGRATION**',
+    False: '❌ **REQUIRE ADDITIONAL VALIDATION**',
+}
+
+# generate_suite_summary text around the results table, filled in with
+# str.format; the literals are built once at import, not on every call
+SUITE_SUMMARY_HEADER = """# Diana's QA Validation Suite Summary - Issue #486
+
+**Validation Date:** {timestamp}
+**Framework:** Comprehensive Statistical Validation for Issue #481 Enhancement
+**Suite Results:** {passed} PASSED, {warning} WARNING, {failed} FAILED
+**Suite Metrics:** mean R² {mean_r_squared:.4f}, max error {max_error:.1f}%, mean velocity {mean_velocity:.1f}x
+
+## Overall Assessment
+
+**Status:** {status}
+
+Alex's Performance Optimization Enhancement (Issue #481) has been comprehensively validated using Diana's QA framework. The validation confirms statistical rigor, accuracy preservation, and development velocity improvements across the benchmark suite.
+
+## Benchmark Results
+
+| Benchmark | Status | R² Correlation | Max Error % | Velocity | Performance |
+|-----------|--------|----------------|-------------|----------|-------------|
+"""
+
+SUITE_SUMMARY_TRAILER = """
+
+## Quality Assurance Summary
+
+### Statistical Validation Framework (Alex's Components):
+- **R² Correlation Requirements:** All benchmarks validated against ≥95% threshold
+- **Progressive Scaling:** 64³ → 1024³ incremental testing methodology verified
+- **Statistical Significance:** p-value validation for trend reliability
+
+### Cross-Scale Accuracy Verification (Diana's Methodology):
+- **Accuracy Preservation:** Cross-scale calibration parameter generalization
+- **Error Bounds:** ≤20% maximum accuracy deviation across problem sizes
+- **Confidence Intervals:** 95% statistical confidence for accuracy measurements
+
+### Development Velocity Validation:
+- **Productivity Target:** ≥3x development cycle acceleration
+- **Time Reduction:** Quantified iteration time improvements
+- **Scaling Efficiency:** Statistical correlation of velocity improvements
+
+### Performance Integration (Maya's Optimization):
+- **Regression Monitoring:** Critical path performance preservation
+- **Optimization Validation:** Phase 2A (99.99% allocation reduction) + Phase 2B (pipeline optimization)
+- **CI Integration:** Automated performance monitoring operational
+
+## Recommendations for Issue #481
+
+{recommendation}
+
+### QA Certification:
+- Statistical validation framework operational and scientifically rigorous
+- Cross-scale accuracy methodology established and verified
+- Development velocity improvements quantified and validated
+- Performance regression monitoring integrated and functional
+
+### Implementation Readiness:
+- Alex's statistical framework: ✅ Validated and production-ready
+- Maya's performance optimization: ✅ Integrated and regression-tested
+- Diana's QA validation: ✅ Comprehensive validation complete
+
+**Overall Assessment:** The performance optimization enhancement meets all QA criteria for production deployment with comprehensive statistical validation and regression monitoring.
+
+---
+**QA Framework:** Diana's Comprehensive Statistical Validation (Issue #486)
+**Enhancement Validation:** Complete validation of Alex's Performance Optimization Enhancement (Issue #481)
+**Implementation Foundation:** Maya's Phase 2A/2B performance optimizations with 99.99% allocation reduction
+"""
+
+# Signature and mtime of the summary last written to each output file, so
+# generate_suite_summary can skip rewriting identical results; bounded to
+# the most recent SUITE_SUMMARY_CACHE_SIZE files
+SUITE_SUMMARY_SIGNATURES = {}
+SUITE_SUMMARY_CACHE_SIZE = 5
 
-@dataclass
+# Failures main() reports as "QA Validation failed" instead of a traceback:
+# I/O, subprocess and measurement errors, including a worker's re-raised in
+# the suite's process pool (a broken pool is a RuntimeError)
+QA_ERRORS = (OSError, ValueError, RuntimeError, subprocess.SubprocessError)
+
+# Rule above and below console section headings
+SEPARATOR = '=' * 60
+
+# Write buffer for generate_suite_summary (1 MiB)
+SUMMARY_WRITE_BUFFER = 1 << 20
+
+# (problem size, simulation seconds) records for the velocity regression
+SIZE_TIME_DTYPE = np.dtype([('size', 'f8'), ('time', 'f8')])
+
+async def run_async(cmd: List[str], timeout: float, **kwargs) -> int:
+    """Run cmd without blocking the event loop, returning its exit code.
+
+    Output is discarded unless stdout is given. On timeout (or if the
+    awaiting task is cancelled) the process is killed before the error
+    propagates, so no orphaned build or simulator keeps running.
+    """
+    kwargs.setdefault('stdout', subprocess.DEVNULL)
+    proc = await asyncio.create_subprocess_exec(*cmd, stderr=subprocess.DEVNULL, **kwargs)
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+
+@dataclass(slots=True)
 class QAValidationResult:
     """QA validation result for a single benchmark."""
     benchmark: str
@@ -43,10 +255,10 @@ class QAValidationResult:
     accuracy_validation: Dict[str, float]
     performance_regression_check: Dict[str, any]
     development_velocity_metrics: Dict[str, float]
-    validation_status: str  # "PASSED", "FAILED", "WARNING"
+    validation_status: str  # PASSED, WARNING or FAILED
     validation_timestamp: str
 
-@dataclass
+@dataclass(slots=True)
 class CrossScaleAccuracyPoint:
     """Accuracy measurement at specific problem scale."""
     problem_size: int
@@ -55,13 +267,84 @@ class CrossScaleAccuracyPoint:
     simulation_cpi: float
     confidence_interval: Tuple[float, float]
 
+def change_point_regression(series: List[float], higher_is_better: bool) -> Optional[bool]:
+    """Whether the latest value sits in a segment that regressed, by E-Divisive means.
+
+    The change points found split series (oldest first) into segments; it
+    regressed if the last segment's mean is more than REGRESSION_WORSENING
+    worse than the one before it. Noise within a segment never counts.
+    Returns None when there are fewer than HISTORY_MIN_POINTS values or
+    e_divisive is unavailable, leaving the caller's fixed threshold.
+    """
+    if not HAS_E_DIVISIVE or len(series) < HISTORY_MIN_POINTS:
+        return None
+
+    series = np.asarray(series, dtype=float)
+    change_points = sorted(e_divisive(series, permutations=CHANGE_POINT_PERMUTATIONS))
+    if not change_points:
+        return False
+
+    start = change_points[-2] if len(change_points) > 1 else 0
+    before = series[start:change_points[-1]].mean()
+    after = series[change_points[-1]:].mean()
+    if before == 0:
+        return False
+    worsening = (before - after if higher_is_better else after - before) / abs(before)
+    return bool(worsening > REGRESSION_WORSENING)
+
+
+def judged_pass(metrics: Dict, threshold_pass: bool) -> bool:
+    """threshold_pass, unless metrics carry a change_point_regression verdict."""
+    regressed = metrics.get('change_point_regression')
+    return threshold_pass if regressed is None else not regressed
+
+
+class RunningCorrelation:
+    """R² of a simple linear regression, updated one (x, y) point at a time.
+
+    Means and co-moments are accumulated with Welford's update, so adding a
+    point is O(1) and stays numerically stable when y barely varies (e.g.
+    near-constant CPI). Matches linregress, including R² = 0
+    when either variable is constant.
+    """
+
+    __slots__ = ('n', 'mean_x', 'mean_y', 'm_xx', 'm_yy', 'm_xy')
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m_xx = self.m_yy = self.m_xy = 0.0
+
+    def add(self, x: float, y: float):
+        self.n += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.n
+        dy = y - self.mean_y
+        self.mean_y += dy / self.n
+        self.m_xx += dx * (x - self.mean_x)
+        self.m_yy += dy * (y - self.mean_y)
+        self.m_xy += dx * (y - self.mean_y)
+
+    @property
+    def r_squared(self) -> float:
+        if self.m_xx == 0 or self.m_yy == 0:
+            return 0.0
+        return min(1.0, self.m_xy ** 2 / (self.m_xx * self.m_yy))
+
 class DianaQAValidator:
     """Comprehensive QA validation framework for statistical and performance validation."""
 
-    def __init__(self, polybench_dir: Path, profile_tool: Path, output_dir: Path):
+    def __init__(self, polybench_dir: Path, profile_tool: Path, output_dir: Path,
+                 batch_simulation: bool = False, concurrent_benchmarks: int = 1):
         self.polybench_dir = polybench_dir
         self.profile_tool = profile_tool
         self.output_dir = output_dir
+        # Simulate all sizes in one profile-tool run (build_and_measure_batch)
+        self.batch_simulation = batch_simulation
+        # Builds and simulations at once for one benchmark; benchmarks
+        # validated concurrently split the machine between them
+        self.build_concurrency = max(1, BUILD_CONCURRENCY // concurrent_benchmarks)
+        self.simulator_concurrency = max(1, SIMULATOR_CONCURRENCY // concurrent_benchmarks)
         self.r_squared_threshold = 0.95
         self.velocity_threshold = 3.0  # 3x development velocity improvement
 
@@ -73,8 +356,55 @@ class DianaQAValidator:
             'pipeline_mixed_8wide': 7000,   # 7μs - mixed workload
         }
 
-    def build_and_measure_with_size(self, benchmark: str, size: int) -> Optional[ScalingDataPoint]:
-        """Build and measure performance for specific problem size with QA validation."""
+        # Parsed Go benchmark metrics by test name; several PolyBench
+        # benchmarks map to the same Go benchmark, which only needs one run
+        self._go_bench_cache: Dict[str, Dict[str, float]] = {}
+
+    def stage_benchmark(self, benchmark: str, size: int, scratch_root: Path) -> Path:
+        """Copy a benchmark's sources into a private build directory for one size.
+
+        Each size then builds in its own tree, so concurrent builds never
+        share object files or `make clean` each other's output. The shared
+        common/ headers are linked alongside so `../common` includes resolve.
+        """
+        size_root = scratch_root / f"{benchmark}_{size}"
+        bench_dir = size_root / benchmark
+        shutil.copytree(self.polybench_dir / benchmark, bench_dir)
+
+        common_dir = self.polybench_dir / 'common'
+        if common_dir.exists():
+            (size_root / 'common').symlink_to(common_dir.resolve(), target_is_directory=True)
+
+        return bench_dir
+
+    def binary_cache_path(self, benchmark: str, size: int) -> Path:
+        """Where the binary built for this benchmark and size is cached.
+
+        The key hashes the size, the Makefile's contents and the mtimes of
+        every C source and header in the benchmark and common/ directories,
+        so any edit to them (or a different size) misses the cache.
+        """
+        bench_dir = self.polybench_dir / benchmark
+        digest = hashlib.blake2b(f"{size}\n".encode())
+        makefile = bench_dir / 'Makefile'
+        try:
+            digest.update(makefile.read_bytes())
+        except FileNotFoundError:
+            pass
+        for source_dir in (bench_dir, self.polybench_dir / 'common'):
+            for path in sorted([*source_dir.glob('*.c'), *source_dir.glob('*.h')]):
+                digest.update(f"\n{path.name}:{path.stat().st_mtime_ns}".encode())
+        return BINARY_CACHE_DIR / benchmark / digest.hexdigest()[:16] / benchmark
+
+    async def _build_async(self, benchmark: str, size: int,
+                           scratch_root: Optional[Path] = None) -> Optional[Path]:
+        """Build the benchmark for one problem size, returning its binary.
+
+        With scratch_root, the benchmark is built in a private copy under it
+        (see stage_benchmark) instead of in the PolyBench source tree. A
+        binary already in the cache (binary_cache_path) is hard-linked into
+        place instead of running make; a fresh build is added to the cache.
+        """
 
         bench_dir = self.polybench_dir / benchmark
         if not bench_dir.exists():
@@ -82,93 +412,271 @@ class DianaQAValidator:
             return None
 
         try:
+            cached = self.binary_cache_path(benchmark, size)
+
+            if scratch_root is not None:
+                bench_dir = self.stage_benchmark(benchmark, size, scratch_root)
+
+            binary_path = bench_dir / benchmark
+            binary_path.unlink(missing_ok=True)
+            try:
+                os.link(cached, binary_path)
+                return binary_path
+            except FileNotFoundError:
+                pass  # Not cached yet
+            except OSError:
+                # Cache on another filesystem
+                shutil.copy2(cached, binary_path)
+                return binary_path
+
             # Clean previous builds (QA requirement)
-            subprocess.run(['make', 'clean'], cwd=bench_dir, timeout=30,
-                          capture_output=True, check=False)
+            await run_async(['make', 'clean'], timeout=30, cwd=bench_dir)
 
             # Build with custom size using DATASET=CUSTOM
-            env = {'DATASET': 'CUSTOM', f'N': str(size)}
-            result = subprocess.run(['make', 'DATASET=CUSTOM'],
-                                  cwd=bench_dir, timeout=60,
-                                  capture_output=True, env=env)
+            env = {**os.environ, 'DATASET': 'CUSTOM', 'N': str(size)}
+            returncode = await run_async(['make', 'DATASET=CUSTOM'], timeout=60,
+                                         cwd=bench_dir, env=env)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 print(f"QA Error: Build failed for {benchmark} size {size}")
                 return None
 
-            binary_path = bench_dir / benchmark
-            if not binary_path.exists():
+            # Copy then rename, so a concurrent build never links a partial
+            # file; the copy also checks that make produced the binary
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            staging = cached.with_name(f"{benchmark}.{os.getpid()}.{size}")
+            try:
+                shutil.copy2(binary_path, staging)
+            except FileNotFoundError:
                 print(f"QA Error: Binary {binary_path} not found after build")
                 return None
+            os.replace(staging, cached)
 
-            # Run simulation with QA monitoring
-            start_time = time.time()
+            return binary_path
 
-            sim_result = subprocess.run([
-                str(self.profile_tool),
-                '-fast-timing',  # Use fast timing for incremental validation
-                '-max-instr', '10000000',  # Increased for QA rigor
-                str(binary_path)
-            ], capture_output=True, text=True, timeout=600)  # 10 min timeout for QA
+        except asyncio.TimeoutError:
+            print(f"QA Error: Timeout building {benchmark} size {size}")
+            return None
+        except Exception as e:
+            print(f"QA Error: Exception building {benchmark} size {size}: {e}")
+            return None
+
+    def profile_command(self, binaries: List[Path]) -> List[str]:
+        """profile-tool argv simulating binaries in order."""
+        return [
+            str(self.profile_tool),
+            '-fast-timing',  # Use fast timing for incremental validation
+            '-max-instr', '10000000',  # Increased for QA rigor
+            *map(str, binaries)
+        ]
+
+    @contextlib.contextmanager
+    def simulate(self, binaries: List[Path], timeout: float):
+        """Run the profile tool over binaries, yielding (returncode, seconds, output).
+
+        stdout goes to an unnamed temporary file rather than a pipe, so a
+        long simulator log is never held (and decoded) in this process;
+        output is that file memory-mapped, valid inside the with block.
+        """
+        start_time = time.time()
+
+        with tempfile.TemporaryFile() as sim_output:
+            sim_result = subprocess.run(self.profile_command(binaries), stdout=sim_output,
+                                        stderr=subprocess.DEVNULL, timeout=timeout)
 
             simulation_time = time.time() - start_time
 
-            if sim_result.returncode != 0:
-                print(f"QA Error: Simulation failed for {benchmark} size {size}")
-                return None
+            if os.fstat(sim_output.fileno()).st_size == 0:
+                yield sim_result.returncode, simulation_time, b''
+            else:
+                with mmap.mmap(sim_output.fileno(), 0, access=mmap.ACCESS_READ) as output:
+                    yield sim_result.returncode, simulation_time, output
 
-            # Parse metrics with QA validation
-            metrics = self._parse_simulation_metrics(sim_result.stdout, benchmark, size)
-            if not metrics:
-                return None
+    async def _simulate_async(self, benchmark: str, size: int,
+                              binary_path: Path) -> Optional[ScalingDataPoint]:
+        """Simulate one built size without blocking the event loop.
 
-            return ScalingDataPoint(
-                problem_size=size,
-                problem_volume=size ** 3,
-                instructions=metrics['instructions'],
-                cycles=metrics['cycles'],
-                cpi=metrics['cpi'],
-                wall_time_sec=metrics.get('elapsed_time', 0.0),
-                simulation_time_sec=simulation_time,
-                instructions_per_sec=metrics.get('instructions_per_sec', 0.0)
-            )
-
-        except subprocess.TimeoutExpired:
-            print(f"QA Error: Timeout building/measuring {benchmark} size {size}")
+        Output is captured and parsed as in simulate().
+        """
+        try:
+            with tempfile.TemporaryFile() as sim_output:
+                start_time = time.time()
+                # Run simulation with QA monitoring (10 min timeout for QA)
+                returncode = await run_async(self.profile_command([binary_path]),
+                                             timeout=600, stdout=sim_output)
+                simulation_time = time.time() - start_time
+
+                if returncode != 0:
+                    print(f"QA Error: Simulation failed for {benchmark} size {size}")
+                    return None
+
+                if os.fstat(sim_output.fileno()).st_size == 0:
+                    metrics = self._parse_simulation_metrics(b'', benchmark, size)
+                else:
+                    # Parse metrics with QA validation, straight from the mapped file
+                    with mmap.mmap(sim_output.fileno(), 0, access=mmap.ACCESS_READ) as output:
+                        metrics = self._parse_simulation_metrics(output, benchmark, size)
+
+        except asyncio.TimeoutError:
+            print(f"QA Error: Timeout measuring {benchmark} size {size}")
             return None
         except Exception as e:
             print(f"QA Error: Exception measuring {benchmark} size {size}: {e}")
             return None
 
-    def _parse_simulation_metrics(self, output: str, benchmark: str, size: int) -> Optional[Dict]:
-        """Parse simulation output with QA validation."""
+        if not metrics:
+            return None
+        return self._scaling_point(size, metrics, simulation_time)
+
+    async def _measure_async(self, benchmark: str, size: int, scratch_root: Optional[Path],
+                             build_slots: asyncio.Semaphore, simulator_slots: asyncio.Semaphore,
+                             simulations: Optional[Dict[bytes, Tuple[int, asyncio.Task]]] = None
+                             ) -> Optional[ScalingDataPoint]:
+        """Build then simulate one size, each stage holding a slot of its own pool.
+
+        The build slot is released before simulating, so the next size's
+        build overlaps with this size's simulation.
+
+        simulations, shared by the sizes of one run, maps a binary's content
+        hash to (size, simulation task). A binary identical to another size's
+        is not simulated again: the simulator is deterministic, so that
+        size's result is reused, and a QA warning notes that the problem
+        size did not change the build.
+        """
+        async with build_slots:
+            binary_path = await self._build_async(benchmark, size, scratch_root)
+        if binary_path is None:
+            return None
+
+        async def simulate():
+            async with simulator_slots:
+                return await self._simulate_async(benchmark, size, binary_path)
 
-        import re
-        patterns = {
-            'instructions': r'Instructions executed: (\d+)',
-            'cycles': r'Cycles: (\d+)',
-            'cpi': r'CPI: ([\d.]+)',
-            'elapsed_time': r'Elapsed time: ([\d.]+[μmn]?s)',
-            'instructions_per_sec': r'Instructions/second: ([\d.]+)'
-        }
+        if simulations is None:
+            return await simulate()
 
-        metrics = {}
-        for key, pattern in patterns.items():
-            match = re.search(pattern, output)
-            if match:
-                value = match.group(1)
-                if key in ['instructions', 'cycles']:
-                    metrics[key] = int(value)
-                elif key in ['cpi', 'instructions_per_sec']:
-                    metrics[key] = float(value)
-                elif key == 'elapsed_time':
-                    # Convert to seconds with QA validation
-                    if 'μs' in value:
-                        metrics[key] = float(value.replace('μs', '')) / 1e6
-                    elif 'ms' in value:
-                        metrics[key] = float(value.replace('ms', '')) / 1e3
+        digest = hashlib.blake2b(binary_path.read_bytes(), digest_size=16).digest()
+        if digest not in simulations:
+            simulations[digest] = (size, asyncio.ensure_future(simulate()))
+            return await simulations[digest][1]
+
+        same_size, simulation = simulations[digest]
+        print(f"QA Warning: {benchmark} binary for size {size} is identical to size {same_size}; "
+              "reusing its simulation")
+        point = await simulation
+        if point is None:
+            return None
+        return replace(point, problem_size=size, problem_volume=size ** 3)
+
+    def build_and_measure_with_size(self, benchmark: str, size: int,
+                                    scratch_root: Optional[Path] = None) -> Optional[ScalingDataPoint]:
+        """Build and measure performance for specific problem size with QA validation."""
+
+        async def measure():
+            return await self._measure_async(benchmark, size, scratch_root,
+                                             asyncio.Semaphore(1), asyncio.Semaphore(1))
+
+        return asyncio.run(measure())
+
+    def build_and_measure_batch(self, benchmark: str, sizes: List[int]) -> List[ScalingDataPoint]:
+        """Build every size in parallel, then simulate them all in one profile-tool run.
+
+        The profile tool accepts several programs and heads each one's
+        results with a "=== benchmark: <path> ===" line, so the sizes share
+        a single tool startup. A point's simulation time is the elapsed time
+        the tool reports for that program. Returns points sorted by size.
+        """
+
+        async def build_all(scratch_root):
+            build_slots = asyncio.Semaphore(self.build_concurrency)
+
+            async def build(size):
+                async with build_slots:
+                    return await self._build_async(benchmark, size, scratch_root)
+
+            return await asyncio.gather(*map(build, sizes))
+
+        with tempfile.TemporaryDirectory(prefix=f"diana_qa_{benchmark}_") as scratch:
+            binaries = asyncio.run(build_all(Path(scratch)))
+            built = {str(path): size for size, path in zip(sizes, binaries) if path is not None}
+
+            if not built:
+                return []
+
+            print(f"  Simulating {len(built)} sizes in one profile-tool run...")
+            try:
+                with self.simulate(list(built), timeout=600 * len(built)) as (returncode, simulation_time, output):
+                    if returncode != 0:
+                        # The tool reports a failing program inside its own
+                        # section and carries on, so the rest still parse
+                        print(f"QA Warning: Batch simulation for {benchmark} exited with code {returncode}")
+
+                    if len(built) == 1:
+                        # A single program is printed without a section header
+                        sections = [(next(iter(built)), 0, len(output))]
                     else:
-                        metrics[key] = float(value.replace('s', ''))
+                        headers = list(BENCHMARK_SECTION_RE.finditer(output))
+                        ends = [h.start() for h in headers[1:]] + [len(output)]
+                        sections = [(h.group(1).decode(), h.end(), end) for h, end in zip(headers, ends)]
+
+                    scaling_points = []
+                    for path, pos, endpos in sections:
+                        size = built[path]
+                        metrics = self._parse_simulation_metrics(output, benchmark, size, pos, endpos)
+                        if metrics:
+                            scaling_points.append(self._scaling_point(
+                                size, metrics, metrics.get('elapsed_time', simulation_time / len(built))
+                            ))
+
+            except subprocess.TimeoutExpired:
+                print(f"QA Error: Timeout in batch simulation for {benchmark}")
+                return []
+
+        scaling_points.sort(key=lambda p: p.problem_size)
+        return scaling_points
+
+    @staticmethod
+    def _scaling_point(size: int, metrics: Dict, simulation_time: float) -> ScalingDataPoint:
+        """ScalingDataPoint for one size from its parsed simulator metrics."""
+        return ScalingDataPoint(
+            problem_size=size,
+            problem_volume=size ** 3,
+            instructions=metrics['instructions'],
+            cycles=metrics['cycles'],
+            cpi=metrics['cpi'],
+            wall_time_sec=metrics.get('elapsed_time', 0.0),
+            simulation_time_sec=simulation_time,
+            instructions_per_sec=metrics.get('instructions_per_sec', 0.0)
+        )
+
+    def _parse_simulation_metrics(self, output, benchmark: str, size: int,
+                                  pos: int = 0, endpos: Optional[int] = None) -> Optional[Dict]:
+        """Parse simulation output with QA validation.
+
+        output is a str, or any bytes-like UTF-8 buffer (such as an mmap),
+        which is scanned in place without decoding it. Only output[pos:endpos]
+        is scanned, e.g. one program's section of a batch run.
+        """
+
+        metric_re = SIMULATION_METRIC_RE if isinstance(output, str) else SIMULATION_METRIC_RE_BYTES
+        if endpos is None:
+            endpos = len(output)
+        metrics = {}
+        for match in metric_re.finditer(output, pos, endpos):
+            key = match.lastgroup
+            if key in metrics:
+                continue  # First occurrence wins
+            value = match.group(key)
+            if key == 'elapsed_time':
+                # Convert to seconds with QA validation
+                if not isinstance(value, str):
+                    value = value.decode()
+                number, unit = ELAPSED_TIME_RE.fullmatch(value).groups()
+                metrics[key] = float(number) * ELAPSED_TIME_UNITS[unit]
+            else:
+                metrics[key] = METRIC_TYPES[key](value)
+            if len(metrics) == len(METRIC_TYPES):
+                break
 
         # QA validation - ensure critical metrics are present
         required_metrics = ['instructions', 'cycles', 'cpi']
@@ -194,35 +702,44 @@ class DianaQAValidator:
             print(f"QA Error: Insufficient scaling points for accuracy validation: {len(scaling_points)}")
             return []
 
-        accuracy_points = []
-
-        # Use smallest scale as baseline reference
-        baseline_point = min(scaling_points, key=lambda p: p.problem_size)
-        baseline_cpi = baseline_point.cpi
+        expected_cpis, errors = self.cross_scale_errors(scaling_points)
 
-        for point in scaling_points:
-            # Calculate accuracy relative to baseline scaling expectations
-            # For compute-bound workloads, CPI should remain relatively stable
-            expected_cpi = baseline_cpi * (1.0 + 0.05 * np.log(point.problem_size / baseline_point.problem_size))
-            accuracy_error = abs(point.cpi - expected_cpi) / expected_cpi * 100
+        # Calculate statistical confidence interval (95%)
+        # Based on empirical variance from calibrated benchmarks
+        margins = np.maximum(2.0, errors * 0.15)  # At least 2% confidence margin
+        lower = errors - margins
+        upper = errors + margins
 
-            # Calculate statistical confidence interval (95%)
-            # Based on empirical variance from calibrated benchmarks
-            confidence_margin = max(2.0, accuracy_error * 0.15)  # At least 2% confidence margin
-            confidence_interval = (
-                accuracy_error - confidence_margin,
-                accuracy_error + confidence_margin
-            )
-
-            accuracy_points.append(CrossScaleAccuracyPoint(
+        return [
+            CrossScaleAccuracyPoint(
                 problem_size=point.problem_size,
-                accuracy_error_percent=accuracy_error,
+                accuracy_error_percent=error,
                 baseline_cpi=expected_cpi,
                 simulation_cpi=point.cpi,
-                confidence_interval=confidence_interval
-            ))
+                confidence_interval=(lo, hi)
+            )
+            for point, expected_cpi, error, lo, hi in zip(
+                scaling_points, expected_cpis.tolist(), errors.tolist(),
+                lower.tolist(), upper.tolist()
+            )
+        ]
+
+    def cross_scale_errors(self, scaling_points: List[ScalingDataPoint]) -> Tuple[np.ndarray, np.ndarray]:
+        """Expected CPI and accuracy error (%) for every point, in input order.
 
-        return accuracy_points
+        The smallest scale is the baseline reference; for compute-bound
+        workloads CPI should remain relatively stable, growing at most
+        logarithmically with problem size.
+        """
+        sizes = np.fromiter((p.problem_size for p in scaling_points), dtype=np.float64,
+                            count=len(scaling_points))
+        cpis = np.fromiter((p.cpi for p in scaling_points), dtype=np.float64,
+                           count=len(scaling_points))
+
+        baseline = np.argmin(sizes)
+        expected_cpis = cpis[baseline] * (1.0 + 0.05 * np.log(sizes / sizes[baseline]))
+        errors = np.abs(cpis - expected_cpis) / expected_cpis * 100
+        return expected_cpis, errors
 
     def validate_development_velocity(self, scaling_points: List[ScalingDataPoint]) -> Dict[str, float]:
         """Validate development velocity improvements with statistical analysis."""
@@ -247,13 +764,17 @@ class DianaQAValidator:
             iteration_time_reduction = 0.0
 
         # Statistical significance test
-        simulation_times = [p.simulation_time_sec for p in sorted_points]
-        problem_sizes = [p.problem_size for p in sorted_points]
+        # (size, time) pairs go straight into one array, then both columns
+        # are log-transformed in place
+        size_time = np.fromiter(
+            ((p.problem_size, p.simulation_time_sec) for p in sorted_points),
+            dtype=SIZE_TIME_DTYPE, count=len(sorted_points)
+        )
 
         # Log-linear regression for scaling behavior
-        log_sizes = np.log(problem_sizes)
-        log_times = np.log(simulation_times)
-        slope, intercept, r_value, p_value, std_err = stats.linregress(log_sizes, log_times)
+        log_sizes = np.log(size_time['size'], out=size_time['size'])
+        log_times = np.log(size_time['time'], out=size_time['time'])
+        slope, intercept, r_value, p_value, std_err = linregress(log_sizes, log_times)
 
         return {
             "velocity_improvement": velocity_improvement,
@@ -270,30 +791,34 @@ class DianaQAValidator:
 
         print(f"Running performance regression check for {benchmark}")
 
-        regression_results = {}
+        # Every outcome carries a performance_status, ERROR unless the
+        # benchmark ran (or timed out), so readers can index it directly
+        regression_results = {'performance_status': 'ERROR'}
 
-        # Map benchmark names to internal test identifiers
-        benchmark_tests = {
-            'gemm': 'BenchmarkPipelineTick8Wide',
-            'atax': 'BenchmarkPipelineMixed8Wide',
-            'gesummv': 'BenchmarkPipelineDepChain8Wide'
-        }
-
-        test_name = benchmark_tests.get(benchmark, 'BenchmarkPipelineTick8Wide')
+        test_name = BENCHMARK_GO_TESTS.get(benchmark, DEFAULT_GO_TEST)
 
         try:
-            # Run Go benchmark for performance baseline
-            cmd = [
-                'go', 'test', '-bench', test_name,
-                '-benchtime=5000x', '-count=3', '-benchmem',
-                './timing/pipeline/'
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-
-            if result.returncode == 0:
-                # Parse benchmark results
-                performance_metrics = self._parse_go_benchmark_output(result.stdout, test_name)
+            performance_metrics = self._go_bench_cache.get(test_name)
+            if performance_metrics is not None:
+                print(f"  Reusing {test_name} results from an earlier benchmark")
+            else:
+                # Run Go benchmark for performance baseline
+                cmd = [
+                    'go', 'test', '-bench', test_name,
+                    '-benchtime=5000x', '-count=3', '-benchmem',
+                    './timing/pipeline/'
+                ]
+
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+
+                if result.returncode == 0:
+                    # Parse benchmark results
+                    performance_metrics = self._parse_go_benchmark_output(result.stdout, test_name)
+                    self._go_bench_cache[test_name] = performance_metrics
+                else:
+                    print(f"QA Error: Performance benchmark failed: {result.stderr}")
+
+            if performance_metrics is not None:
                 regression_results.update(performance_metrics)
 
                 # Check against thresholds
@@ -306,76 +831,122 @@ class DianaQAValidator:
                     'performance_margin': ((threshold - ns_per_op) / threshold * 100) if ns_per_op > 0 else 0
                 })
 
-            else:
-                print(f"QA Error: Performance benchmark failed: {result.stderr}")
-                regression_results['performance_status'] = 'ERROR'
-
         except subprocess.TimeoutExpired:
             print(f"QA Error: Performance benchmark timed out")
             regression_results['performance_status'] = 'TIMEOUT'
         except Exception as e:
             print(f"QA Error: Performance regression check failed: {e}")
-            regression_results['performance_status'] = 'ERROR'
 
         return regression_results
 
     def _parse_go_benchmark_output(self, output: str, benchmark_name: str) -> Dict[str, float]:
         """Parse Go benchmark output for performance metrics."""
 
-        metrics = {}
-
-        for line in output.split('\n'):
-            if benchmark_name in line and 'ns/op' in line:
-                parts = line.split()
-                if len(parts) >= 4:
-                    try:
-                        ns_per_op = float(parts[2])
-                        metrics['ns_per_op'] = ns_per_op
-
-                        # Parse memory metrics if present
-                        for i, part in enumerate(parts):
-                            if 'B/op' in part and i > 0:
-                                metrics['bytes_per_op'] = float(parts[i-1])
-                            if 'allocs/op' in part and i > 0:
-                                metrics['allocs_per_op'] = float(parts[i-1])
-
-                    except (ValueError, IndexError):
-                        continue
-
-        return metrics
-
-    def run_comprehensive_validation(self, benchmark: str) -> QAValidationResult:
-        """Run comprehensive QA validation for a benchmark."""
+        # One result line per -count run: name, iterations, then value/unit pairs
+        samples = defaultdict(list)
+
+        for line in output.splitlines():
+            if not line.startswith(benchmark_name) or 'ns/op' not in line:
+                continue
+            parts = line.split()
+            try:
+                run = {GO_BENCH_UNITS[unit]: float(value)
+                       for value, unit in zip(parts[2::2], parts[3::2]) if unit in GO_BENCH_UNITS}
+            except ValueError:
+                continue
+            for name, value in run.items():
+                samples[name].append(value)
+
+        # The median across runs, so one noisy run cannot decide the result
+        return {name: statistics.median(values) for name, values in samples.items()}
+
+    def measure_scaling_points(self, benchmark: str) -> List[ScalingDataPoint]:
+        """Measure every POLYBENCH_SCALING_SIZES size concurrently, sorted by size.
+
+        Each size is built in its own scratch build directory and then
+        simulated, as a pipeline on one event loop: up to build_concurrency
+        builds and simulator_concurrency simulations run at once, so later
+        sizes compile while earlier ones simulate. Once at least five points
+        are in and their R² meets the threshold, the remaining sizes are
+        cancelled (QA efficiency); that R² is tracked incrementally by
+        RunningCorrelation rather than by refitting every point each time.
+        """
+        return asyncio.run(self._measure_scaling_points_async(benchmark))
+
+    async def _measure_scaling_points_async(self, benchmark: str) -> List[ScalingDataPoint]:
+        """Event-loop side of measure_scaling_points."""
+        build_slots = asyncio.Semaphore(self.build_concurrency)
+        simulator_slots = asyncio.Semaphore(self.simulator_concurrency)
+        simulations = {}
+        scaling_points = []
+        # Updated as points arrive, so the early-exit check never refits
+        correlation = RunningCorrelation()
+
+        async def measure(size, scratch_root):
+            return size, await self._measure_async(benchmark, size, scratch_root,
+                                                   build_slots, simulator_slots, simulations)
+
+        with tempfile.TemporaryDirectory(prefix=f"diana_qa_{benchmark}_") as scratch:
+            tasks = []
+            for size in POLYBENCH_SCALING_SIZES:
+                print(f"  Measuring {benchmark} at size {size}³...")
+                tasks.append(asyncio.create_task(measure(size, Path(scratch))))
+
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    size, point = await next_done
+                    if point:
+                        scaling_points.append(point)
+                        # Same axes as analyze_scaling_correlation: CPI against log volume
+                        correlation.add(np.log(point.problem_volume), point.cpi)
+                        print(f"    ✅ size {size}: {point.instructions:,} instructions, CPI={point.cpi:.3f}")
+                    else:
+                        print(f"    ❌ Failed to measure size {size}")
+
+                    # Early validation success check (QA efficiency)
+                    if correlation.n >= 5:
+                        r_squared = correlation.r_squared
+                        if r_squared >= self.r_squared_threshold:
+                            print(f"  Early QA validation success: R² = {r_squared:.4f}")
+                            break
+            finally:
+                # Kills any build or simulator still running (see run_async)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        scaling_points.sort(key=lambda p: p.problem_size)
+        return scaling_points
+
+    def run_comprehensive_validation(self, benchmark: str,
+                                     regression_check: Optional[Dict] = None) -> QAValidationResult:
+        """Run comprehensive QA validation for a benchmark.
+
+        regression_check, if given, is a run_performance_regression_check
+        result measured beforehand, which is used instead of running it here.
+        """
 
         print(f"Starting comprehensive QA validation for {benchmark}")
         print(f"Validation framework: R² ≥{self.r_squared_threshold}, Velocity ≥{self.velocity_threshold}x")
 
-        # Step 1: Incremental scaling validation using Alex's framework
-        scaling_points = []
-        for size in POLYBENCH_SCALING_SIZES:
-            print(f"  Measuring {benchmark} at size {size}³...")
-            point = self.build_and_measure_with_size(benchmark, size)
-            if point:
-                scaling_points.append(point)
-                print(f"    ✅ {point.instructions:,} instructions, CPI={point.cpi:.3f}")
-            else:
-                print(f"    ❌ Failed to measure size {size}")
+        # Sizes whose binary is already cached skip make (_build_async)
+        cache_hits = sum(self.binary_cache_path(benchmark, size).exists()
+                         for size in POLYBENCH_SCALING_SIZES)
 
-            # Early validation success check (QA efficiency)
-            if len(scaling_points) >= 5:
-                temp_analysis = analyze_scaling_correlation(benchmark, scaling_points)
-                if temp_analysis.correlation_coefficient >= self.r_squared_threshold:
-                    print(f"  Early QA validation success: R² = {temp_analysis.correlation_coefficient:.4f}")
-                    break
+        # Step 1: Incremental scaling validation using Alex's framework
+        if self.batch_simulation:
+            scaling_points = self.build_and_measure_batch(benchmark, POLYBENCH_SCALING_SIZES)
+        else:
+            scaling_points = self.measure_scaling_points(benchmark)
 
         if len(scaling_points) < 3:
             return QAValidationResult(
                 benchmark=benchmark,
                 scaling_analysis=None,
                 accuracy_validation={},
-                performance_regression_check={},
+                performance_regression_check={'performance_status': 'ERROR'},
                 development_velocity_metrics={},
-                validation_status="FAILED",
+                validation_status=FAILED,
                 validation_timestamp=time.strftime('%Y-%m-%d %H:%M:%S UTC')
             )
 
@@ -385,22 +956,42 @@ class DianaQAValidator:
 
         # Step 3: Cross-scale accuracy validation (Diana's methodology)
         print(f"  Validating cross-scale accuracy...")
-        accuracy_points = self.validate_cross_scale_accuracy(benchmark, scaling_points)
+        # Summarized straight from the error vector (at least 3 points here)
+        _, accuracy_errors = self.cross_scale_errors(scaling_points)
         accuracy_metrics = {
-            'max_accuracy_error': max(p.accuracy_error_percent for p in accuracy_points) if accuracy_points else 100,
-            'avg_accuracy_error': np.mean([p.accuracy_error_percent for p in accuracy_points]) if accuracy_points else 100,
-            'accuracy_points_count': len(accuracy_points)
+            'max_accuracy_error': float(accuracy_errors.max()),
+            'avg_accuracy_error': float(accuracy_errors.mean()),
+            'accuracy_points_count': len(accuracy_errors)
         }
 
         # Step 4: Development velocity validation
         print(f"  Validating development velocity...")
         velocity_metrics = self.validate_development_velocity(scaling_points)
+        velocity_metrics['binary_cache_hits'] = cache_hits
+        velocity_metrics['binary_cache_hit_rate'] = cache_hits / len(POLYBENCH_SCALING_SIZES)
 
         # Step 5: Performance regression check
-        print(f"  Running performance regression check...")
-        regression_check = self.run_performance_regression_check(benchmark)
-
-        # Step 6: Overall validation status determination
+        if regression_check is None:
+            print(f"  Running performance regression check...")
+            regression_check = self.run_performance_regression_check(benchmark)
+
+        # Step 6: Judge velocity and performance against this benchmark's
+        # own history, where there is enough of it
+        history = self.record_history(benchmark, {
+            'ns_per_op': regression_check.get('ns_per_op'),
+            'velocity_improvement': velocity_metrics['velocity_improvement'],
+            'max_accuracy_error': accuracy_metrics['max_accuracy_error'],
+        })
+        for metrics, name, higher_is_better in ((velocity_metrics, 'velocity_improvement', True),
+                                                (regression_check, 'ns_per_op', False)):
+            if metrics.get(name) is not None:
+                regressed = change_point_regression(
+                    [run[name] for run in history if run.get(name) is not None], higher_is_better
+                )
+                if regressed is not None:
+                    metrics['change_point_regression'] = regressed
+
+        # Step 7: Overall validation status determination
         validation_status = self._determine_validation_status(
             scaling_analysis, accuracy_metrics, velocity_metrics, regression_check
         )
@@ -415,6 +1006,26 @@ class DianaQAValidator:
             validation_timestamp=time.strftime('%Y-%m-%d %H:%M:%S UTC')
         )
 
+    def record_history(self, benchmark: str, metrics: Dict[str, Optional[float]]) -> List[Dict]:
+        """Append this run's metrics to HISTORY_FILE; return the benchmark's runs, oldest first.
+
+        The returned runs include the one just recorded.
+        """
+        history_path = self.output_dir / HISTORY_FILE
+        try:
+            with open(history_path) as f:
+                history = [run for run in map(json.loads, f) if run.get('benchmark') == benchmark]
+        except FileNotFoundError:
+            history = []
+
+        run = {'benchmark': benchmark, 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S UTC'), **metrics}
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(history_path, 'a') as f:
+            f.write(json.dumps(run) + '\n')
+
+        history.append(run)
+        return history
+
     def _determine_validation_status(self, scaling_analysis, accuracy_metrics, velocity_metrics, regression_check) -> str:
         """Determine overall validation status based on all criteria."""
 
@@ -425,42 +1036,65 @@ class DianaQAValidator:
         accuracy_pass = accuracy_metrics['max_accuracy_error'] <= 20.0
 
         # Development velocity requirement
-        velocity_pass = velocity_metrics['velocity_improvement'] >= self.velocity_threshold
+        velocity_pass = judged_pass(
+            velocity_metrics, velocity_metrics['velocity_improvement'] >= self.velocity_threshold
+        )
 
         # Performance regression requirement
-        performance_pass = regression_check.get('performance_status', 'ERROR') in ['PASS', 'TIMEOUT']
+        performance_pass = judged_pass(
+            regression_check, regression_check['performance_status'] in ['PASS', 'TIMEOUT']
+        )
 
         # Statistical significance requirement
         significance_pass = scaling_analysis.p_value < 0.05
 
-        # Determine status
-        critical_failures = []
-        if not correlation_pass:
-            critical_failures.append(f"R² correlation: {scaling_analysis.correlation_coefficient:.4f} < {self.r_squared_threshold}")
-        if not accuracy_pass:
-            critical_failures.append(f"Max accuracy error: {accuracy_metrics['max_accuracy_error']:.1f}% > 20%")
-        if not significance_pass:
-            critical_failures.append(f"Statistical significance: p = {scaling_analysis.p_value:.6f} >= 0.05")
-
-        warnings = []
-        if not velocity_pass:
-            warnings.append(f"Development velocity: {velocity_metrics['velocity_improvement']:.1f}x < {self.velocity_threshold}x")
-        if not performance_pass:
-            warnings.append(f"Performance regression: {regression_check.get('performance_status', 'ERROR')}")
-
-        if critical_failures:
-            return "FAILED"
-        elif warnings:
-            return "WARNING"
+        # Determine status from the mask of criteria met
+        passed = (correlation_pass * CORRELATION_OK | accuracy_pass * ACCURACY_OK
+                  | significance_pass * SIGNIFICANCE_OK | velocity_pass * VELOCITY_OK
+                  | performance_pass * PERFORMANCE_OK)
+
+        if passed & CRITICAL_CRITERIA != CRITICAL_CRITERIA:
+            return FAILED
+        return PASSED if passed == ALL_CRITERIA else WARNING
+
+    def write_json_result(self, result: QAValidationResult, output_file: Path):
+        """Write the validation result as JSON, for programmatic consumers.
+
+        Carries the same data as the Markdown report (every scaling point,
+        metric and status), with tuples as lists and NumPy scalars as plain
+        numbers. Uses orjson when available.
+        """
+        data = asdict(result)
+        if HAS_ORJSON:
+            output_file.write_bytes(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         else:
-            return "PASSED"
+            output_file.write_text(json.dumps(
+                data, indent=2, default=lambda o: o.item() if isinstance(o, np.generic) else str(o)
+            ))
+
+        print(f"QA validation results saved: {output_file}")
 
     def generate_comprehensive_report(self, result: QAValidationResult, output_file: Path):
         """Generate comprehensive QA validation report."""
 
-        status_icon = "✅" if result.validation_status == "PASSED" else "⚠️" if result.validation_status == "WARNING" else "❌"
+        status_icon = STATUS_ICONS.get(result.validation_status, "❌")
+
+        # Each criterion is evaluated once; the report repeats several of them
+        analysis = result.scaling_analysis
+        if analysis is None:
+            raise RuntimeError(f"too few scaling points measured for {result.benchmark}")
+        accuracy = result.accuracy_validation
+        velocity = result.development_velocity_metrics
+        performance = result.performance_regression_check
+        correlation_pass = analysis.correlation_coefficient >= self.r_squared_threshold
+        significance_pass = analysis.p_value < 0.05
+        accuracy_pass = accuracy['max_accuracy_error'] <= 20.0
+        velocity_pass = judged_pass(velocity, velocity['velocity_improvement'] >= self.velocity_threshold)
+        performance_pass = judged_pass(performance, performance['performance_status'] == 'PASS')
 
-        report = f"""# QA Validation Report: {result.benchmark}
+        parts = [f"""# QA Validation Report: {result.benchmark}
 
 **Diana's Comprehensive QA Framework - Issue #486**
 **Validation Date:** {result.validation_timestamp}
@@ -472,96 +1106,99 @@ This report validates Alex's Performance Optimization Enhancement (Issue #481) u
 
 ## Statistical Correlation Analysis (Alex's Framework)
 
-**R² Correlation:** {result.scaling_analysis.correlation_coefficient:.4f}
+**R² Correlation:** {analysis.correlation_coefficient:.4f}
 **Target Threshold:** ≥{self.r_squared_threshold}
-**Status:** {'✅ PASSED' if result.scaling_analysis.correlation_coefficient >= self.r_squared_threshold else '❌ FAILED'}
+**Status:** {'✅ PASSED' if correlation_pass else '❌ FAILED'}
 
-- **Statistical Significance:** {'✅' if result.scaling_analysis.p_value < 0.05 else '❌'} (p = {result.scaling_analysis.p_value:.6f})
-- **Scaling Slope:** {result.scaling_analysis.slope:.4f}
-- **Confidence Interval:** [{result.scaling_analysis.confidence_interval[0]:.4f}, {result.scaling_analysis.confidence_interval[1]:.4f}]
+- **Statistical Significance:** {'✅' if significance_pass else '❌'} (p = {analysis.p_value:.6f})
+- **Scaling Slope:** {analysis.slope:.4f}
+- **Confidence Interval:** [{analysis.confidence_interval[0]:.4f}, {analysis.confidence_interval[1]:.4f}]
 
 ### Scaling Data Points
 
 | Problem Size | Volume (N³) | Instructions | CPI | Sim Time (s) | Inst/sec |
 |--------------|-------------|--------------|-----|--------------|----------|
-"""
+"""]
 
         # Add scaling data table
-        for point in result.scaling_analysis.scaling_points:
-            report += f"| {point.problem_size} | {point.problem_volume:,} | {point.instructions:,} | "
-            report += f"{point.cpi:.3f} | {point.simulation_time_sec:.3f} | {point.instructions_per_sec:.0f} |\n"
+        parts.extend(
+            f"| {point.problem_size} | {point.problem_volume:,} | {point.instructions:,} | "
+            f"{point.cpi:.3f} | {point.simulation_time_sec:.3f} | {point.instructions_per_sec:.0f} |\n"
+            for point in analysis.scaling_points
+        )
 
-        report += f"""
+        parts.append(f"""
 
 ## Cross-Scale Accuracy Validation (Diana's Methodology)
 
-**Maximum Accuracy Error:** {result.accuracy_validation['max_accuracy_error']:.2f}%
-**Average Accuracy Error:** {result.accuracy_validation['avg_accuracy_error']:.2f}%
-**Validation Points:** {result.accuracy_validation['accuracy_points_count']}
-**Status:** {'✅ PASSED' if result.accuracy_validation['max_accuracy_error'] <= 20.0 else '❌ FAILED'} (Target: ≤20% error)
+**Maximum Accuracy Error:** {accuracy['max_accuracy_error']:.2f}%
+**Average Accuracy Error:** {accuracy['avg_accuracy_error']:.2f}%
+**Validation Points:** {accuracy['accuracy_points_count']}
+**Status:** {'✅ PASSED' if accuracy_pass else '❌ FAILED'} (Target: ≤20% error)
 
 Cross-scale accuracy validation ensures calibration parameters generalize across problem sizes with acceptable error bounds.
 
 ## Development Velocity Validation
 
-**Velocity Improvement:** {result.development_velocity_metrics['velocity_improvement']:.1f}x
+**Velocity Improvement:** {velocity['velocity_improvement']:.1f}x
 **Target Threshold:** ≥{self.velocity_threshold}x
-**Status:** {'✅ PASSED' if result.development_velocity_metrics['velocity_improvement'] >= self.velocity_threshold else '❌ FAILED'}
+**Status:** {'✅ PASSED' if velocity_pass else '❌ FAILED'}
 
-- **Small Scale Time:** {result.development_velocity_metrics['small_scale_time_sec']:.2f} seconds
-- **Large Scale Time:** {result.development_velocity_metrics['large_scale_time_sec']:.2f} seconds
-- **Iteration Time Reduction:** {result.development_velocity_metrics['iteration_time_reduction']:.1f}%
-- **Scaling Correlation:** R² = {result.development_velocity_metrics['scaling_correlation']:.4f}
+- **Small Scale Time:** {velocity['small_scale_time_sec']:.2f} seconds
+- **Large Scale Time:** {velocity['large_scale_time_sec']:.2f} seconds
+- **Iteration Time Reduction:** {velocity['iteration_time_reduction']:.1f}%
+- **Scaling Correlation:** R² = {velocity['scaling_correlation']:.4f}
+- **Binary Cache Hits:** {velocity.get('binary_cache_hits', 0)}/{len(POLYBENCH_SCALING_SIZES)} sizes ({velocity.get('binary_cache_hit_rate', 0.0):.0%})
 
 ## Performance Regression Monitoring
 
-**Performance Status:** {result.performance_regression_check.get('performance_status', 'ERROR')}
-**Benchmark Performance:** {result.performance_regression_check.get('ns_per_op', 0):.1f} ns/op
-**Threshold:** {result.performance_regression_check.get('threshold_ns_per_op', 0):.1f} ns/op
-**Performance Margin:** {result.performance_regression_check.get('performance_margin', 0):.1f}%
+**Performance Status:** {performance['performance_status']}
+**Benchmark Performance:** {performance.get('ns_per_op', 0):.1f} ns/op
+**Threshold:** {performance.get('threshold_ns_per_op', 0):.1f} ns/op
+**Performance Margin:** {performance.get('performance_margin', 0):.1f}%
 
 Integration with Maya's performance optimization validation ensures no regression in critical path performance.
 
 ## Quality Assurance Checklist
 
-- {'✅' if result.scaling_analysis.correlation_coefficient >= self.r_squared_threshold else '❌'} **R² Correlation ≥{self.r_squared_threshold}**: Parameter generalization validation
-- {'✅' if result.accuracy_validation['max_accuracy_error'] <= 20.0 else '❌'} **Cross-Scale Accuracy ≤20%**: Calibration accuracy preservation
-- {'✅' if result.scaling_analysis.p_value < 0.05 else '❌'} **Statistical Significance (p < 0.05)**: Trend validation
-- {'✅' if result.development_velocity_metrics['velocity_improvement'] >= self.velocity_threshold else '❌'} **Development Velocity ≥{self.velocity_threshold}x**: Productivity improvement
-- {'✅' if result.performance_regression_check.get('performance_status') == 'PASS' else '❌'} **Performance Regression Check**: Critical path preservation
+- {'✅' if correlation_pass else '❌'} **R² Correlation ≥{self.r_squared_threshold}**: Parameter generalization validation
+- {'✅' if accuracy_pass else '❌'} **Cross-Scale Accuracy ≤20%**: Calibration accuracy preservation
+- {'✅' if significance_pass else '❌'} **Statistical Significance (p < 0.05)**: Trend validation
+- {'✅' if velocity_pass else '❌'} **Development Velocity ≥{self.velocity_threshold}x**: Productivity improvement
+- {'✅' if performance_pass else '❌'} **Performance Regression Check**: Critical path preservation
 
 ## Diana's QA Assessment
 
 ### Validation Framework Success Factors:
-"""
+""")
 
-        if result.validation_status == "PASSED":
-            report += """
+        if result.validation_status == PASSED:
+            parts.append("""
 ✅ **VALIDATION COMPLETE** - All QA criteria satisfied for production deployment
 - Statistical correlation meets scientific rigor standards (R² ≥95%)
 - Cross-scale accuracy validation confirms calibration parameter generalization
 - Development velocity improvement quantified and verified
 - Performance regression monitoring operational
 - Framework ready for Alex's performance optimization integration
-"""
-        elif result.validation_status == "WARNING":
-            report += """
+""")
+        elif result.validation_status == WARNING:
+            parts.append("""
 ⚠️ **CONDITIONAL APPROVAL** - Core requirements met with minor concerns
 - Critical statistical requirements satisfied (R² ≥95%, accuracy ≤20%)
 - Secondary requirements need attention (velocity or performance)
 - Recommend monitoring and follow-up validation
 - Safe for production with continued QA oversight
-"""
+""")
         else:
-            report += """
+            parts.append("""
 ❌ **VALIDATION FAILED** - Critical requirements not met
 - Statistical correlation or accuracy requirements failed
 - Additional investigation required before deployment
 - Review calibration methodology and scaling behavior
 - Recommend root cause analysis before proceeding
-"""
+""")
 
-        report += f"""
+        parts.append(f"""
 
 ### Integration with Maya's Performance Optimization:
 - **Phase 2A Validation**: 99.99% allocation reduction confirmed in QA framework
@@ -570,7 +1207,7 @@ Integration with Maya's performance optimization validation ensures no regressio
 - **Quality Standards**: Alex's statistical framework + Maya's optimization + Diana's validation = comprehensive QA
 
 ### Recommendations for Issue #481:
-{'✅ **Approve Enhancement Integration**' if result.validation_status in ['PASSED', 'WARNING'] else '❌ **Block Enhancement Integration**'}
+{'✅ **Approve Enhancement Integration**' if result.validation_status in ACCEPTED_STATUSES else '❌ **Block Enhancement Integration**'}
 - Statistical validation framework operational and verified
 - Cross-scale accuracy methodology established
 - Performance optimization integration validated
@@ -581,9 +1218,9 @@ Integration with Maya's performance optimization validation ensures no regressio
 **Enhancement Target:** Alex's Performance Optimization Enhancement (Issue #481)
 **Performance Optimization:** Maya's Phase 2A/2B Implementation (99.99% allocation reduction + pipeline optimization)
 **Validation Standards:** R² ≥95% correlation, ≤20% accuracy error, ≥3x development velocity improvement
-"""
+""")
 
-        output_file.write_text(report)
+        output_file.write_bytes(''.join(parts).encode('utf-8'))
         print(f"Comprehensive QA validation report saved: {output_file}")
 
 def main():
@@ -599,18 +1236,25 @@ def main():
                        help='M2Sim profile tool binary')
     parser.add_argument('--output', type=Path, default=Path('validation_results'),
                        help='Output directory or file for reports')
+    parser.add_argument('--batch-simulation', action='store_true',
+                       help='Simulate all sizes in one profile-tool run (no early exit)')
+    parser.add_argument('--exit-code-only', action='store_true',
+                       help='With --benchmark, write no reports for a FAILED result; '
+                            'only the exit status reports it')
 
     args = parser.parse_args()
 
     # Validate inputs
-    if not args.polybench_dir.exists():
-        print(f"Error: PolyBench directory {args.polybench_dir} not found")
-        return 1
-
-    if not args.profile_tool.exists():
-        print(f"Error: Profile tool {args.profile_tool} not found")
-        print("Build it with: go build -o profile-tool ./cmd/profile")
-        return 1
+    required_inputs = [
+        (args.polybench_dir, "PolyBench directory", None),
+        (args.profile_tool, "Profile tool", "Build it with: go build -o profile-tool ./cmd/profile"),
+    ]
+    for path, description, hint in required_inputs:
+        if not path.exists():
+            print(f"Error: {description} {path} not found")
+            if hint:
+                print(hint)
+            return 1
 
     # Create output directory
     if args.output.suffix == '.md':
@@ -622,150 +1266,220 @@ def main():
 
     output_dir.mkdir(exist_ok=True)
 
-    # Initialize QA validator
-    validator = DianaQAValidator(args.polybench_dir, args.profile_tool, output_dir)
+    if not (args.full_suite or args.benchmark):
+        print("Error: Must specify --benchmark or --full-suite")
+        return 1
 
-    try:
-        if args.full_suite:
-            # Run validation on key benchmarks
-            benchmarks = ['gemm', 'atax', 'gesummv']
-            print(f"Running QA validation suite on {len(benchmarks)} benchmarks")
+    if args.full_suite:
+        # Run validation on key benchmarks
+        benchmarks = ['gemm', 'atax', 'gesummv']
+        print(f"Running QA validation suite on {len(benchmarks)} benchmarks")
 
-            all_results = []
-            for benchmark in benchmarks:
-                print(f"\n{'='*60}")
-                print(f"QA VALIDATION: {benchmark}")
-                print(f"{'='*60}")
+        try:
+            validator = DianaQAValidator(args.polybench_dir, args.profile_tool, output_dir,
+                                         batch_simulation=args.batch_simulation,
+                                         concurrent_benchmarks=len(benchmarks))
 
-                result = validator.run_comprehensive_validation(benchmark)
-                all_results.append(result)
+            # The Go regression benchmarks are timed first, one at a time on
+            # an otherwise idle machine, so the concurrent validations below
+            # cannot skew their ns/op
+            regression_checks = [validator.run_performance_regression_check(b) for b in benchmarks]
 
-                # Generate individual report
-                report_file = output_dir / f"diana_qa_{benchmark}_validation.md"
-                validator.generate_comprehensive_report(result, report_file)
+            # Benchmarks build in disjoint scratch trees and write their own
+            # reports, so they are validated in parallel, one process each
+            with ProcessPoolExecutor(max_workers=len(benchmarks)) as pool:
+                all_results = list(pool.map(validate_and_report, repeat(validator), benchmarks,
+                                            repeat(output_dir), regression_checks))
 
             # Generate suite summary
             suite_summary = output_dir / "diana_qa_suite_summary.md"
             generate_suite_summary(all_results, suite_summary)
+            write_perfherder_data(all_results, output_dir / PERFHERDER_FILE)
+        except QA_ERRORS as e:
+            print(f"QA Validation failed: {e}")
+            return 1
 
-            print(f"\n✅ QA validation suite complete: {len(all_results)} benchmarks validated")
-            return 0 if all(r.validation_status in ['PASSED', 'WARNING'] for r in all_results) else 1
-
-        elif args.benchmark:
-            # Run validation on single benchmark
-            print(f"Running QA validation on benchmark: {args.benchmark}")
-
-            result = validator.run_comprehensive_validation(args.benchmark)
-
-            if output_file:
-                report_file = output_file
-            else:
-                report_file = output_dir / f"diana_qa_{args.benchmark}_validation.md"
-
-            validator.generate_comprehensive_report(result, report_file)
+        print(f"\n✅ QA validation suite complete: {len(all_results)} benchmarks validated")
+        return 0 if all(r.validation_status in ACCEPTED_STATUSES for r in all_results) else 1
 
-            print(f"\n{'='*60}")
-            print(f"QA VALIDATION SUMMARY: {args.benchmark}")
-            print(f"{'='*60}")
-            print(f"Status: {result.validation_status}")
-            print(f"R² Correlation: {result.scaling_analysis.correlation_coefficient:.4f}")
-            print(f"Max Accuracy Error: {result.accuracy_validation['max_accuracy_error']:.2f}%")
-            print(f"Velocity Improvement: {result.development_velocity_metrics['velocity_improvement']:.1f}x")
-            print(f"Report: {report_file}")
+    # Run validation on single benchmark
+    print(f"Running QA validation on benchmark: {args.benchmark}")
 
-            return 0 if result.validation_status in ['PASSED', 'WARNING'] else 1
+    if output_file:
+        report_file = output_file
+    else:
+        report_file = output_dir / f"diana_qa_{args.benchmark}_validation.md"
 
-        else:
-            print("Error: Must specify --benchmark or --full-suite")
+    try:
+        validator = DianaQAValidator(args.polybench_dir, args.profile_tool, output_dir,
+                                     batch_simulation=args.batch_simulation)
+        result = validator.run_comprehensive_validation(args.benchmark)
+
+        # CI sweeps that only need the exit status skip the reports for a
+        # failure (often a broken build, with nothing worth reporting)
+        if args.exit_code_only and result.validation_status == FAILED:
+            print(f"QA validation FAILED: {args.benchmark} (reports skipped)")
             return 1
 
-    except Exception as e:
+        validator.generate_comprehensive_report(result, report_file)
+        validator.write_json_result(result, report_file.with_suffix('.json'))
+        write_perfherder_data([result], report_file.parent / PERFHERDER_FILE)
+    except QA_ERRORS as e:
         print(f"QA Validation failed: {e}")
         return 1
 
-def generate_suite_summary(results: List[QAValidationResult], output_file: Path):
-    """Generate summary report for full validation suite."""
-
-    passed_count = sum(1 for r in results if r.validation_status == 'PASSED')
-    warning_count = sum(1 for r in results if r.validation_status == 'WARNING')
-    failed_count = sum(1 for r in results if r.validation_status == 'FAILED')
-
-    summary = f"""# Diana's QA Validation Suite Summary - Issue #486
-
-**Validation Date:** {time.strftime('%Y-%m-%d %H:%M:%S UTC')}
-**Framework:** Comprehensive Statistical Validation for Issue #481 Enhancement
-**Suite Results:** {passed_count} PASSED, {warning_count} WARNING, {failed_count} FAILED
-
-## Overall Assessment
-
-**Status:** {'✅ SUITE PASSED' if failed_count == 0 else '❌ SUITE FAILED'}
-
-Alex's Performance Optimization Enhancement (Issue #481) has been comprehensively validated using Diana's QA framework. The validation confirms statistical rigor, accuracy preservation, and development velocity improvements across the benchmark suite.
-
-## Benchmark Results
-
-| Benchmark | Status | R² Correlation | Max Error % | Velocity | Performance |
-|-----------|--------|----------------|-------------|----------|-------------|
-"""
-
-    for result in results:
-        status_icon = "✅" if result.validation_status == "PASSED" else "⚠️" if result.validation_status == "WARNING" else "❌"
-        perf_status = result.performance_regression_check.get('performance_status', 'ERROR')
-
-        summary += f"| {result.benchmark} | {status_icon} {result.validation_status} | "
-        summary += f"{result.scaling_analysis.correlation_coefficient:.4f} | "
-        summary += f"{result.accuracy_validation['max_accuracy_error']:.1f}% | "
-        summary += f"{result.development_velocity_metrics['velocity_improvement']:.1f}x | "
-        summary += f"{perf_status} |\n"
-
-    summary += f"""
-
-## Quality Assurance Summary
-
-### Statistical Validation Framework (Alex's Components):
-- **R² Correlation Requirements:** All benchmarks validated against ≥95% threshold
-- **Progressive Scaling:** 64³ → 1024³ incremental testing methodology verified
-- **Statistical Significance:** p-value validation for trend reliability
-
-### Cross-Scale Accuracy Verification (Diana's Methodology):
-- **Accuracy Preservation:** Cross-scale calibration parameter generalization
-- **Error Bounds:** ≤20% maximum accuracy deviation across problem sizes
-- **Confidence Intervals:** 95% statistical confidence for accuracy measurements
-
-### Development Velocity Validation:
-- **Productivity Target:** ≥3x development cycle acceleration
-- **Time Reduction:** Quantified iteration time improvements
-- **Scaling Efficiency:** Statistical correlation of velocity improvements
-
-### Performance Integration (Maya's Optimization):
-- **Regression Monitoring:** Critical path performance preservation
-- **Optimization Validation:** Phase 2A (99.99% allocation reduction) + Phase 2B (pipeline optimization)
-- **CI Integration:** Automated performance monitoring operational
+    # The summary block goes to stdout as one write
+    sys.stdout.write(
+        f"\n{SEPARATOR}\n"
+        f"QA VALIDATION SUMMARY: {args.benchmark}\n"
+        f"{SEPARATOR}\n"
+        f"Status: {result.validation_status}\n"
+        f"R² Correlation: {result.scaling_analysis.correlation_coefficient:.4f}\n"
+        f"Max Accuracy Error: {result.accuracy_validation['max_accuracy_error']:.2f}%\n"
+        f"Velocity Improvement: {result.development_velocity_metrics['velocity_improvement']:.1f}x\n"
+        f"Report: {report_file}\n"
+    )
+    sys.stdout.flush()
+
+    return 0 if result.validation_status in ACCEPTED_STATUSES else 1
+
+def validate_and_report(validator: DianaQAValidator, benchmark: str, output_dir: Path,
+                        regression_check: Optional[Dict] = None) -> QAValidationResult:
+    """Validate one benchmark and write its Markdown and JSON reports to output_dir."""
+    print(f"\n{SEPARATOR}")
+    print(f"QA VALIDATION: {benchmark}")
+    print(SEPARATOR)
+
+    result = validator.run_comprehensive_validation(benchmark, regression_check)
+
+    # Generate individual report
+    report_file = output_dir / f"diana_qa_{benchmark}_validation.md"
+    validator.generate_comprehensive_report(result, report_file)
+    validator.write_json_result(result, report_file.with_suffix('.json'))
+    return result
+
+
+def perfherder_suite(result: QAValidationResult) -> Optional[Dict]:
+    """One benchmark's metrics as a Perfherder suite, or None if it has no scaling analysis."""
+    analysis = result.scaling_analysis
+    if analysis is None:
+        return None
+
+    def subtest(name, value, lower_is_better=True, unit=None):
+        entry = {'name': name, 'value': float(value), 'lowerIsBetter': lower_is_better}
+        if unit:
+            entry['unit'] = unit
+        return entry
+
+    subtests = []
+    for point in analysis.scaling_points:
+        subtests.append(subtest(f"cpi_size_{point.problem_size}", point.cpi))
+        subtests.append(subtest(f"sim_time_{point.problem_size}", point.simulation_time_sec, unit='s'))
+    subtests.append(subtest('r_squared', analysis.correlation_coefficient, lower_is_better=False))
+    subtests.append(subtest('max_accuracy_error', result.accuracy_validation['max_accuracy_error'], unit='%'))
+    subtests.append(subtest('velocity_improvement',
+                            result.development_velocity_metrics['velocity_improvement'],
+                            lower_is_better=False))
+    if 'ns_per_op' in result.performance_regression_check:
+        subtests.append(subtest('ns_per_op', result.performance_regression_check['ns_per_op'], unit='ns'))
+
+    return {'name': result.benchmark, 'subtests': subtests}
+
+
+def write_perfherder_data(results: List[QAValidationResult], output_file: Path):
+    """Write results in the Perfherder data format, for external change-point tooling."""
+    suites = [suite for suite in map(perfherder_suite, results) if suite is not None]
+    data = {'framework': {'name': PERFHERDER_FRAMEWORK}, 'suites': suites}
+
+    if HAS_ORJSON:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        output_file.write_text(json.dumps(data, indent=2))
 
-## Recommendations for Issue #481
+    print(f"Perfherder data saved: {output_file}")
 
-{'✅ **APPROVE ENHANCEMENT INTEGRATION**' if failed_count == 0 else '❌ **REQUIRE ADDITIONAL VALIDATION**'}
 
-### QA Certification:
-- Statistical validation framework operational and scientifically rigorous
-- Cross-scale accuracy methodology established and verified
-- Development velocity improvements quantified and validated
-- Performance regression monitoring integrated and functional
+def suite_row(result: QAValidationResult) -> str:
+    """One generate_suite_summary table row for result.
 
-### Implementation Readiness:
-- Alex's statistical framework: ✅ Validated and production-ready
-- Maya's performance optimization: ✅ Integrated and regression-tested
-- Diana's QA validation: ✅ Comprehensive validation complete
+    The columns never change, so the row is a single f-string over the
+    result's fields rather than a template filled from a dict of them.
+    """
+    status = result.validation_status
+    return (
+        f"| {result.benchmark} | {STATUS_ICONS.get(status, '❌')} {status} | "
+        f"{result.scaling_analysis.correlation_coefficient:.4f} | "
+        f"{result.accuracy_validation['max_accuracy_error']:.1f}% | "
+        f"{result.development_velocity_metrics['velocity_improvement']:.1f}x | "
+        f"{result.performance_regression_check['performance_status']} |\n"
+    )
 
-**Overall Assessment:** The performance optimization enhancement meets all QA criteria for production deployment with comprehensive statistical validation and regression monitoring.
 
----
-**QA Framework:** Diana's Comprehensive Statistical Validation (Issue #486)
-**Enhancement Validation:** Complete validation of Alex's Performance Optimization Enhancement (Issue #481)
-**Implementation Foundation:** Maya's Phase 2A/2B performance optimizations with 99.99% allocation reduction
-"""
+def generate_suite_summary(results: List[QAValidationResult], output_file: Path):
+    """Generate summary report for full validation suite.
+
+    Nothing is written for an empty suite, or when output_file still holds
+    the summary this process last wrote for the same results.
+    """
+    if not results:
+        print("QA validation suite summary skipped: no results")
+        return
+
+    signature = hashlib.blake2b(repr([
+        (r.benchmark, r.validation_status, r.scaling_analysis.correlation_coefficient,
+         r.accuracy_validation['max_accuracy_error'],
+         r.development_velocity_metrics['velocity_improvement'],
+         r.performance_regression_check['performance_status'])
+        for r in results
+    ]).encode(), digest_size=16).digest()
+    cached = SUITE_SUMMARY_SIGNATURES.get(output_file)
+    if cached is not None and output_file.exists() and \
+            cached == (signature, output_file.stat().st_mtime_ns):
+        print(f"QA validation suite summary unchanged: {output_file}")
+        return
+
+    # One pass over the results for all three tallies
+    status_counts = Counter(r.validation_status for r in results)
+    passed_count = status_counts[PASSED]
+    warning_count = status_counts[WARNING]
+    failed_count = status_counts[FAILED]
+    suite_passed = failed_count == 0
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    # Suite-wide aggregates come from one array per metric
+    n = len(results)
+    r_squared = np.fromiter((r.scaling_analysis.correlation_coefficient for r in results),
+                            dtype=np.float64, count=n)
+    max_errors = np.fromiter((r.accuracy_validation['max_accuracy_error'] for r in results),
+                             dtype=np.float64, count=n)
+    velocities = np.fromiter((r.development_velocity_metrics['velocity_improvement'] for r in results),
+                             dtype=np.float64, count=n)
+
+    header = SUITE_SUMMARY_HEADER.format(
+        timestamp=timestamp, passed=passed_count, warning=warning_count,
+        failed=failed_count, status=SUITE_STATUS[suite_passed],
+        mean_r_squared=r_squared.mean(), max_error=max_errors.max(),
+        mean_velocity=velocities.mean(),
+    )
+    trailer = SUITE_SUMMARY_TRAILER.format(
+        recommendation=SUITE_RECOMMENDATION[suite_passed],
+    )
+
+    # Rows are encoded and written as they are formatted, through one large
+    # binary buffer, so the whole summary never exists as a single string
+    with open(output_file, "wb", buffering=SUMMARY_WRITE_BUFFER) as f:
+        f.write(header.encode("utf-8"))
+
+        for result in results:
+            f.write(suite_row(result).encode("utf-8"))
+
+        f.write(trailer.encode("utf-8"))
+
+    SUITE_SUMMARY_SIGNATURES.pop(output_file, None)
+    SUITE_SUMMARY_SIGNATURES[output_file] = (signature, output_file.stat().st_mtime_ns)
+    if len(SUITE_SUMMARY_SIGNATURES) > SUITE_SUMMARY_CACHE_SIZE:
+        del SUITE_SUMMARY_SIGNATURES[next(iter(SUITE_SUMMARY_SIGNATURES))]
 
-    output_file.write_text(summary)
     print(f"QA validation suite summary saved: {output_file}")
 
 if __name__ == '__main__':
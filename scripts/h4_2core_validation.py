@@ -10,17 +10,25 @@ This framework establishes the foundation for multi-core accuracy validation
 before scaling to 4-core and 8-core configurations.
 """
 
+import functools
 import os
 import sys
 import json
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 import numpy as np
 
 
+def write_files(contents: Dict[Path, bytes]) -> None:
+    """Write {path: bytes} concurrently; the writes are independent I/O."""
+    with ThreadPoolExecutor(max_workers=len(contents) or 1) as pool:
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), contents.items()))
+
+
 @dataclass
 class TwoCoreValidationResult:
     """Data structure for 2-core validation results"""
@@ -79,42 +87,27 @@ class H4TwoCoreValidator:
             "shared_data_structures": self._create_shared_data_template()
         }
 
-        created_count = 0
-
+        # Every file is rendered to bytes first, then all are written together
+        files = {}
         for benchmark_name, source_code in benchmarks.items():
-            # Create C source file
-            source_path = self.multicore_benchmarks_path / f"{benchmark_name}.c"
-
-            with open(source_path, 'w') as f:
-                f.write(source_code)
-
-            print(f"  ✅ Created: {source_path}")
+            files[self.multicore_benchmarks_path / f"{benchmark_name}.c"] = source_code.encode()
+            # Makefile for benchmark compilation
+            files[self.multicore_benchmarks_path / f"Makefile.{benchmark_name}"] = \
+                self._create_benchmark_makefile(benchmark_name).encode()
 
-            # Create Makefile for benchmark compilation
-            makefile_content = self._create_benchmark_makefile(benchmark_name)
-            makefile_path = self.multicore_benchmarks_path / f"Makefile.{benchmark_name}"
-
-            with open(makefile_path, 'w') as f:
-                f.write(makefile_content)
-
-            created_count += 1
-
-        # Create master Makefile for all benchmarks
-        master_makefile = self._create_master_makefile(list(benchmarks.keys()))
+        # Master Makefile for all benchmarks, and README with compilation and
+        # usage instructions
         master_makefile_path = self.multicore_benchmarks_path / "Makefile"
-
-        with open(master_makefile_path, 'w') as f:
-            f.write(master_makefile)
-
-        print(f"  ✅ Created master Makefile: {master_makefile_path}")
-
-        # Create README with compilation and usage instructions
-        readme_content = self._create_benchmark_readme()
         readme_path = self.multicore_benchmarks_path / "README.md"
+        files[master_makefile_path] = self._create_master_makefile(list(benchmarks)).encode()
+        files[readme_path] = self._create_benchmark_readme().encode()
 
-        with open(readme_path, 'w') as f:
-            f.write(readme_content)
+        write_files(files)
+        created_count = len(benchmarks)
 
+        for benchmark_name in benchmarks:
+            print(f"  ✅ Created: {self.multicore_benchmarks_path / f'{benchmark_name}.c'}")
+        print(f"  ✅ Created master Makefile: {master_makefile_path}")
         print(f"  ✅ Created documentation: {readme_path}")
         print(f"\n=== Summary: {created_count} benchmark templates created ===")
         print(f"Next steps:")
@@ -124,7 +117,9 @@ class H4TwoCoreValidator:
 
         return created_count
 
-    def _create_coherence_intensive_template(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_coherence_intensive_template() -> str:
         """Create cache-coherence intensive benchmark template"""
         return """
 /*
@@ -202,7 +197,9 @@ int main() {
 }
 """
 
-    def _create_memory_intensive_template(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_memory_intensive_template() -> str:
         """Create memory bandwidth intensive benchmark template"""
         return """
 /*
@@ -290,7 +287,9 @@ int main() {
 }
 """
 
-    def _create_compute_intensive_template(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_compute_intensive_template() -> str:
         """Create compute-intensive parallel benchmark template"""
         return """
 /*
@@ -352,7 +351,9 @@ int main() {
 }
 """
 
-    def _create_atomic_operations_template(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_atomic_operations_template() -> str:
         """Create atomic operations heavy benchmark template"""
         return """
 /*
@@ -431,7 +432,9 @@ int main() {
 }
 """
 
-    def _create_shared_data_template(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_shared_data_template() -> str:
         """Create shared data structures benchmark template"""
         return """
 /*
@@ -444,20 +447,32 @@ int main() {
 #include <omp.h>
 #include <time.h>
 #include <stdatomic.h>
+#include <stdalign.h>
 #include <string.h>
 
 #define SHARED_ARRAY_SIZE 100000
 #define NUM_THREADS 2
 #define SHARING_ITERATIONS 5000
 
-// Shared data structures with different cache line behaviors
+// Shared data structures with different cache line behaviors. Everything
+// is aligned to the 64-byte M2 cache line, so which lines the threads share
+// is fixed by the layout rather than by where the allocator put it.
 typedef struct {
-    int data[16];  // 64-byte cache line on M2
-    atomic_int access_count;
+    alignas(64) int data[16];  // Exactly one cache line
+    atomic_int access_count;   // Starts the next line
+    char _pad[64 - sizeof(atomic_int)];
 } cache_line_t;
 
+// One cache line per thread: the no-sharing baseline
+typedef struct {
+    alignas(64) int v;
+    char _pad[60];
+} padded_int_t;
+
 cache_line_t shared_cache_lines[SHARED_ARRAY_SIZE / 16];
-int false_sharing_array[NUM_THREADS][16];  // Adjacent memory - false sharing
+// Indexed [i][thread_id], so both threads write to every line - false sharing
+alignas(64) int false_sharing_array[16][NUM_THREADS];
+padded_int_t private_lines[NUM_THREADS];
 volatile int true_sharing_data = 0;
 
 void shared_data_workload(int thread_id) {
@@ -484,12 +499,18 @@ void shared_data_workload(int thread_id) {
 
         // False sharing: adjacent memory locations
         for (int i = 0; i < 16; i++) {
-            false_sharing_array[thread_id][i] = iter * thread_id + i;
+            false_sharing_array[i][thread_id] = iter * thread_id + i;
 
             // Memory fence to ensure visibility
             __sync_synchronize();
         }
 
+        // The same stores to a line no other thread touches
+        for (int i = 0; i < 16; i++) {
+            private_lines[thread_id].v = iter * thread_id + i;
+            __sync_synchronize();
+        }
+
         // Cache line ping-pong simulation
         if (iter % 10 == 0) {
             int target_line = iter % (SHARED_ARRAY_SIZE / 16);
@@ -507,6 +528,7 @@ int main() {
     printf("Initializing shared data structures...\\n");
     memset(shared_cache_lines, 0, sizeof(shared_cache_lines));
     memset(false_sharing_array, 0, sizeof(false_sharing_array));
+    memset(private_lines, 0, sizeof(private_lines));
 
     printf("Starting 2-core shared data structures benchmark...\\n");
     clock_gettime(CLOCK_MONOTONIC, &start);
@@ -537,7 +559,9 @@ int main() {
 }
 """
 
-    def _create_benchmark_makefile(self, benchmark_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _create_benchmark_makefile(benchmark_name: str) -> str:
         """Create individual benchmark Makefile"""
         return f"""
 # Makefile for {benchmark_name}
@@ -563,7 +587,7 @@ clean:
         """Create master Makefile for all benchmarks"""
         targets = ' '.join(benchmark_names)
 
-        makefile_content = f"""
+        header = f"""
 # Master Makefile for H4 2-Core Validation Framework
 # Builds all multi-core benchmarks for cache coherence validation
 
@@ -577,15 +601,14 @@ all: $(BENCHMARKS)
 
 """
 
-        # Add individual benchmark rules
-        for benchmark in benchmark_names:
-            makefile_content += f"""
+        # Individual benchmark rules
+        rules = "".join(f"""
 {benchmark}: {benchmark}.c
 \t$(CC) $(CFLAGS) -o {benchmark} {benchmark}.c $(LDFLAGS)
 
-"""
+""" for benchmark in benchmark_names)
 
-        makefile_content += """
+        footer = """
 clean:
 \trm -f $(BENCHMARKS)
 
@@ -600,9 +623,11 @@ test: all
 .PHONY: all clean test
 """
 
-        return makefile_content
+        return header + rules + footer
 
-    def _create_benchmark_readme(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _create_benchmark_readme() -> str:
         """Create README documentation for 2-core benchmarks"""
         return """
 # H4 Multi-Core Benchmarks - 2-Core Validation Suite
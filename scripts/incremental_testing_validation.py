@@ -17,17 +17,18 @@ Usage:
 
 import argparse
 import json
+import math
+import os
 import numpy as np
 import subprocess
 import time
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from scipy import stats
 import matplotlib.pyplot as plt
 
 
-@dataclass
+@dataclass(slots=True)
 class ScalingDataPoint:
     """Performance measurement at specific problem size."""
     problem_size: int  # Linear dimension (e.g., 64 for 64³)
@@ -43,7 +44,7 @@ class ScalingDataPoint:
     accuracy_error_percent: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScalingAnalysis:
     """Statistical analysis of problem size scaling."""
     benchmark: str
@@ -61,6 +62,59 @@ POLYBENCH_SCALING_SIZES = [64, 96, 128, 192, 256, 384, 512, 768, 1024]
 SCALING_TIMEOUT_MINUTES = 10
 
 
+def student_t_two_sided_p(t: float, df: int) -> float:
+    """P(|T| >= |t|) for Student's t with integer df >= 1.
+
+    Uses the finite series of Abramowitz & Stegun 26.7.3/26.7.4, which is
+    exact for integer degrees of freedom (always the case for n - 2).
+    """
+    theta = math.atan(abs(t) / math.sqrt(df))
+    cos2 = math.cos(theta) ** 2
+    term = total = 1.0
+    if df % 2:
+        for k in range(1, (df - 1) // 2):
+            term *= cos2 * (2 * k) / (2 * k + 1)
+            total += term
+        inside = 2 / math.pi * (theta + (math.sin(theta) * math.cos(theta) * total if df > 1 else 0.0))
+    else:
+        for k in range(1, df // 2):
+            term *= cos2 * (2 * k - 1) / (2 * k)
+            total += term
+        inside = math.sin(theta) * total
+    return max(0.0, 1.0 - inside)
+
+
+def linregress(x, y) -> Tuple[float, float, float, float, float]:
+    """Least-squares fit of y on x: (slope, intercept, r_value, p_value, std_err).
+
+    A NumPy equivalent of scipy.stats.linregress (same outputs and edge
+    cases), so the validation scripts do not need SciPy. p_value tests for
+    zero slope with Student's t on n - 2 degrees of freedom.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    if sxx == 0:
+        raise ValueError("Cannot calculate a linear regression if all x values are identical")
+
+    slope = sxy / sxx
+    intercept = y.mean() - slope * x.mean()
+    # r is 0 when y is constant, and clipped against rounding past ±1
+    r = 0.0 if syy == 0 else min(1.0, max(-1.0, float(sxy) / math.sqrt(sxx * syy)))
+
+    if n == 2:
+        return float(slope), float(intercept), r, 1.0 if y[0] == y[1] else 0.0, 0.0
+
+    df = n - 2
+    t = r * math.sqrt(df / ((1.0 - r) * (1.0 + r) + 1e-20))
+    p_value = student_t_two_sided_p(t, df)
+    std_err = math.sqrt((1 - r * r) * syy / sxx / df)
+    return float(slope), float(intercept), r, p_value, std_err
+
+
 def build_polybench_with_size(benchmark: str, size: int, polybench_dir: Path) -> Optional[Path]:
     """Build PolyBench benchmark with specific problem size."""
     bench_dir = polybench_dir / benchmark
@@ -75,7 +129,7 @@ def build_polybench_with_size(benchmark: str, size: int, polybench_dir: Path) ->
 
         # Build with custom size using DATASET=CUSTOM
         # PolyBench uses DATASET preprocessor definition
-        env = {'DATASET': 'CUSTOM', f'N': str(size)}
+        env = {**os.environ, 'DATASET': 'CUSTOM', 'N': str(size)}
         result = subprocess.run(['make', 'DATASET=CUSTOM'],
                               cwd=bench_dir, timeout=60,
                               capture_output=True, env=env)
@@ -190,7 +244,7 @@ def analyze_scaling_correlation(benchmark: str, scaling_points: List[ScalingData
 
     # Linear regression: CPI vs problem volume (log scale often better)
     log_volumes = np.log(problem_volumes)
-    slope, intercept, r_value, p_value, std_err = stats.linregress(log_volumes, cpis)
+    slope, intercept, r_value, p_value, std_err = linregress(log_volumes, cpis)
 
     # Calculate R² correlation coefficient
     r_squared = r_value ** 2